@@ -0,0 +1,78 @@
+"""
+Compares the installed `jsonlib` backends on search responses and room pages.
+
+Decodes StaysSearch responses from bytes, parses room pages given as str
+(the old `response.text` path) and as bytes, and encodes the decoded
+search responses again.
+
+Save recorded responses as `benchmarks/fixtures/search*.json` and room
+pages as `benchmarks/fixtures/*.html` to measure them; otherwise synthetic
+ones from `fixtures.py` are used.
+
+    $ python benchmarks/bench_json.py -n 20
+"""
+
+import timeit
+from argparse import ArgumentParser, Namespace
+
+from fixtures import load_fixtures, make_room_html, make_search_response
+
+from pyairbnb import jsonlib, parse
+
+
+class ProgramArgsNamespace(Namespace):
+    number: int
+
+
+def get_args() -> ProgramArgsNamespace:
+    parser = ArgumentParser()
+    parser.add_argument("-n", "--number", type=int, default=20)
+    return parser.parse_args(namespace=ProgramArgsNamespace())
+
+
+def per_call_ms(function, number: int) -> float:
+    return timeit.timeit(function, number=number) / number * 1000
+
+
+def main() -> None:
+    args = get_args()
+    responses = [text.encode() for _, text in load_fixtures("search*.json")] or [
+        jsonlib.dumps(make_search_response(str(page), pages=3, page_size=50))
+        for page in range(3)
+    ]
+    pages = [body for _, body in load_fixtures("*.html")] or [
+        make_room_html(seed) for seed in range(3)
+    ]
+    decoded = [jsonlib.loads(response) for response in responses]
+
+    print(
+        f"{'backend':<10}{'search ms':>12}{'page str ms':>14}"
+        f"{'page bytes ms':>16}{'encode ms':>12}"
+    )
+    for name in jsonlib.PREFERRED_BACKENDS:
+        if name not in jsonlib.BACKENDS:
+            continue
+        jsonlib.set_backend(name)
+        search = sum(
+            per_call_ms(lambda: jsonlib.loads(response), args.number)
+            for response in responses
+        ) / len(responses)
+        page_str = sum(
+            per_call_ms(lambda: parse.parse_body_details(body), args.number)
+            for body in pages
+        ) / len(pages)
+        page_bytes = sum(
+            per_call_ms(lambda: parse.parse_body_details(body), args.number)
+            for body in [page.encode() for page in pages]
+        ) / len(pages)
+        encode = sum(
+            per_call_ms(lambda: jsonlib.dumps(data), args.number) for data in decoded
+        ) / len(decoded)
+        print(
+            f"{name:<10}{search:>12.3f}{page_str:>14.3f}"
+            f"{page_bytes:>16.3f}{encode:>12.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
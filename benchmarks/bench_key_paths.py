@@ -0,0 +1,97 @@
+"""
+Compares `standardize.from_search` using precompiled `utils.KeyPath`
+accessors with the same code splitting every key path on each lookup, as
+`utils.get_nested_value` used to.
+
+Save recorded `searchResults` lists as `benchmarks/fixtures/search*.json` to
+benchmark against them; otherwise synthetic pages from `fixtures.py` are used.
+
+    $ python benchmarks/bench_key_paths.py -n 200
+"""
+
+import json
+import timeit
+from argparse import ArgumentParser, Namespace
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+from fixtures import load_fixtures, make_search_results
+
+from pyairbnb import standardize, utils
+
+
+def get_nested_value_split(d: dict, key_path: str, default: Any = None) -> Any:
+    """`utils.get_nested_value` as it was before key paths were compiled."""
+    keys = key_path.split(".")
+    current = d
+    for key in keys:
+        current = current.get(key, {})
+        if current == {} or current is None:
+            return default
+    return current
+
+
+class SplitPath:
+    def __init__(self, key_path: str):
+        self.key_path = key_path
+
+    def get(self, d: dict, default: Any = None) -> Any:
+        return get_nested_value_split(d, self.key_path, default)
+
+
+@contextmanager
+def split_paths() -> Iterator[None]:
+    """Swaps the compiled paths of `standardize` for split-on-every-call ones."""
+    compiled = {
+        name: value
+        for name, value in vars(standardize).items()
+        if isinstance(value, utils.KeyPath)
+    }
+    try:
+        for name, path in compiled.items():
+            setattr(standardize, name, SplitPath(path.key_path))
+        yield
+    finally:
+        for name, path in compiled.items():
+            setattr(standardize, name, path)
+
+
+class ProgramArgsNamespace(Namespace):
+    number: int
+
+
+def get_args() -> ProgramArgsNamespace:
+    parser = ArgumentParser()
+    parser.add_argument("-n", "--number", type=int, default=100)
+    return parser.parse_args(namespace=ProgramArgsNamespace())
+
+
+def main() -> None:
+    args = get_args()
+    pages = [
+        (name, json.loads(text)) for name, text in load_fixtures("search*.json")
+    ] or [(f"synthetic-{seed}", make_search_results(seed)) for seed in range(3)]
+    print(
+        f"{'page':<24}{'results':>8}{'split us':>12}{'compiled us':>14}{'speedup':>10}"
+    )
+    for name, results in pages:
+        with split_paths():
+            expected = standardize.from_search(results)
+            split_s = timeit.timeit(
+                lambda: standardize.from_search(results), number=args.number
+            )
+        assert standardize.from_search(results) == expected, name
+        compiled_s = timeit.timeit(
+            lambda: standardize.from_search(results), number=args.number
+        )
+        per_result = args.number * len(results) / 1e6
+        print(
+            f"{name:<24}{len(results):>8}"
+            f"{split_s / per_result:>12.2f}"
+            f"{compiled_s / per_result:>14.2f}"
+            f"{split_s / compiled_s:>9.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Compares the deferred-state fast path of `parse.parse_body_details` with the
+original BeautifulSoup implementation.
+
+Save real room pages as `benchmarks/fixtures/*.html` to benchmark against
+them; otherwise synthetic pages from `fixtures.py` are used.
+
+    $ python benchmarks/bench_parse.py -n 20
+"""
+
+import json
+import re
+import timeit
+from argparse import ArgumentParser, Namespace
+from typing import Any
+
+from bs4 import BeautifulSoup
+from fixtures import load_fixtures, make_room_html
+
+from pyairbnb import parse, utils
+
+regexApiKey = re.compile(r'"key":".+?"')
+regexLanguage = re.compile(r'"language":".+?"')
+
+
+def parse_body_details_soup(body: str) -> tuple[Any, str, str]:
+    """`parse.parse_body_details` as it was before the fast path."""
+    soup = BeautifulSoup(body, "html.parser")
+    data_deferred_state = soup.select("#data-deferred-state-0")[0].getText()
+    html_data = utils.remove_space(data_deferred_state)
+
+    language_match = regexLanguage.search(body)
+    if not language_match:
+        raise AttributeError("could not extract language from response text")
+    language = language_match.group()
+    language = language.replace('"language":"', "")
+    language = language.replace('"', "")
+
+    api_key_match = regexApiKey.search(body)
+    if not api_key_match:
+        raise AttributeError("could not extract API key from response text")
+    api_key = api_key_match.group()
+    api_key = api_key.replace('"key":"', "")
+    api_key = api_key.replace('"', "")
+
+    data = json.loads(html_data)
+    details_data = data["niobeMinimalClientData"][0][1]
+    return details_data, language, api_key
+
+
+class ProgramArgsNamespace(Namespace):
+    number: int
+
+
+def get_args() -> ProgramArgsNamespace:
+    parser = ArgumentParser()
+    parser.add_argument("-n", "--number", type=int, default=10)
+    return parser.parse_args(namespace=ProgramArgsNamespace())
+
+
+def main() -> None:
+    args = get_args()
+    pages = load_fixtures("*.html") or [
+        (f"synthetic-{seed}", make_room_html(seed)) for seed in range(3)
+    ]
+    print(f"{'page':<24}{'size':>10}{'soup ms':>12}{'fast ms':>12}{'speedup':>10}")
+    for name, body in pages:
+        assert parse.parse_body_details(body) == parse_body_details_soup(body), name
+        soup_s = timeit.timeit(lambda: parse_body_details_soup(body), number=args.number)
+        fast_s = timeit.timeit(lambda: parse.parse_body_details(body), number=args.number)
+        print(
+            f"{name:<24}{len(body) // 1024:>8}KB"
+            f"{soup_s / args.number * 1000:>12.2f}"
+            f"{fast_s / args.number * 1000:>12.2f}"
+            f"{soup_s / fast_s:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""
+End-to-end throughput of pyairbnb against the local replay server.
+
+Runs `get_details`, `search_all`, room page parsing and standardization and
+reports items per second, p50/p99 latency per call and peak traced memory
+of each. Nothing leaves the machine: requests go to `replay_server.py`,
+whose latency and error rate can be set to mimic the real site.
+
+    $ python benchmarks/bench_pipeline.py --rooms 100 --concurrency 8 --latency 0.05
+"""
+
+import statistics
+import time
+import tracemalloc
+from argparse import ArgumentParser, Namespace
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
+
+from fixtures import make_search_results
+from replay_server import ReplayServer
+
+from pyairbnb import parse, standardize
+from pyairbnb.api import Api
+from pyairbnb.keystore import ApiKeyStore
+from pyairbnb.ratelimit import RetryPolicy
+from pyairbnb.start import get_details, search_all
+
+
+class Result(NamedTuple):
+    name: str
+    items: int
+    seconds: float
+    latencies: list[float]
+    peak_bytes: int
+
+    def row(self) -> str:
+        p50, p99 = percentiles(self.latencies)
+        return (
+            f"{self.name:<16}{self.items:>8}{self.items / self.seconds:>12.1f}"
+            f"{p50 * 1000:>10.2f}{p99 * 1000:>10.2f}"
+            f"{self.peak_bytes / 2**20:>10.1f}"
+        )
+
+
+def percentiles(latencies: list[float]) -> tuple[float, float]:
+    if len(latencies) < 2:
+        return latencies[0], latencies[0]
+    cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+    return cuts[49], cuts[98]
+
+
+def run(
+    name: str,
+    calls: list[Callable[[], int]],
+    concurrency: int = 1,
+) -> Result:
+    """Runs `calls` on `concurrency` threads; each returns the items it produced."""
+    latencies: list[float] = []
+
+    def timed(call: Callable[[], int]) -> int:
+        started = time.perf_counter()
+        items = call()
+        latencies.append(time.perf_counter() - started)
+        return items
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        items = sum(executor.map(timed, calls))
+    seconds = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return Result(name, items, seconds, latencies, peak)
+
+
+class ProgramArgsNamespace(Namespace):
+    rooms: int
+    searches: int
+    concurrency: int
+    latency: float
+    jitter: float
+    error_rate: float
+
+
+def get_args() -> ProgramArgsNamespace:
+    parser = ArgumentParser()
+    parser.add_argument("--rooms", type=int, default=40)
+    parser.add_argument("--searches", type=int, default=10)
+    parser.add_argument("-c", "--concurrency", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    return parser.parse_args(namespace=ProgramArgsNamespace())
+
+
+def main() -> None:
+    args = get_args()
+    server = ReplayServer(
+        latency=args.latency, jitter=args.jitter, error_rate=args.error_rate
+    )
+    results = []
+    with server, Api(
+        base_url=server.base_url,
+        key_store=ApiKeyStore(),
+        retry_policy=RetryPolicy(backoff_base=0.01),
+        pool_size=args.concurrency,
+    ) as api:
+        room_urls = [f"{server.base_url}/rooms/{i}" for i in range(args.rooms)]
+        results.append(
+            run(
+                "get_details",
+                [
+                    lambda url=url: bool(get_details(api.currency, url, api=api))
+                    for url in room_urls
+                ],
+                args.concurrency,
+            )
+        )
+        results.append(
+            run(
+                "search_all",
+                [
+                    lambda: len(
+                        search_all(
+                            "2025-01-01",
+                            "2025-01-04",
+                            1,
+                            1,
+                            0,
+                            0,
+                            10,
+                            api.currency,
+                            api=api,
+                        )
+                    )
+                    for _ in range(args.searches)
+                ],
+                args.concurrency,
+            )
+        )
+
+    pages = server.recordings.rooms
+    results.append(
+        run(
+            "parse",
+            [
+                lambda body=pages[i % len(pages)]: bool(parse.parse_body_details(body))
+                for i in range(args.rooms)
+            ],
+        )
+    )
+    details = [parse.parse_body_details(body)[0] for body in pages]
+    results.append(
+        run(
+            "from_details",
+            [
+                lambda data=details[i % len(details)]: bool(
+                    standardize.from_details(data)
+                )
+                for i in range(args.rooms * 10)
+            ],
+        )
+    )
+    search_pages = [make_search_results(seed) for seed in range(args.searches)]
+    results.append(
+        run(
+            "from_search",
+            [
+                lambda page=page: len(standardize.from_search(page))
+                for page in search_pages
+            ],
+        )
+    )
+
+    print(
+        f"{'benchmark':<16}{'items':>8}{'items/s':>12}"
+        f"{'p50 ms':>10}{'p99 ms':>10}{'peak MB':>10}"
+    )
+    for result in results:
+        print(result.row())
+    print(f"server: {server.requests} requests, {server.errors} injected errors")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Compares the memory held by standardized search listings as nested dicts
+and as `records.SearchListing` objects, and the cost of `to_dict()`.
+
+Save recorded `searchResults` lists as `benchmarks/fixtures/search*.json` to
+measure them; otherwise synthetic pages from `fixtures.py` are used.
+
+    $ python benchmarks/bench_records.py --pages 200
+"""
+
+import gc
+import json
+import timeit
+import tracemalloc
+from argparse import ArgumentParser, Namespace
+
+from fixtures import load_fixtures, make_search_results
+
+from pyairbnb import standardize
+
+
+def retained_bytes(pages: list[list[dict]], typed: bool) -> tuple[int, int]:
+    """Standardizes every page and returns the listing count and bytes kept."""
+    gc.collect()
+    tracemalloc.start()
+    listings = [
+        listing for page in pages for listing in standardize.from_search(page, typed)
+    ]
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(listings), size
+
+
+class ProgramArgsNamespace(Namespace):
+    pages: int
+    number: int
+
+
+def get_args() -> ProgramArgsNamespace:
+    parser = ArgumentParser()
+    parser.add_argument("-p", "--pages", type=int, default=200)
+    parser.add_argument("-n", "--number", type=int, default=20)
+    return parser.parse_args(namespace=ProgramArgsNamespace())
+
+
+def main() -> None:
+    args = get_args()
+    recorded = [json.loads(text) for _, text in load_fixtures("search*.json")]
+    pages = recorded or [make_search_results(seed) for seed in range(args.pages)]
+
+    count, dict_bytes = retained_bytes(pages, typed=False)
+    _, record_bytes = retained_bytes(pages, typed=True)
+    print(f"{count} listings")
+    print(f"dicts   {dict_bytes / count:>8.0f} bytes/listing")
+    print(f"records {record_bytes / count:>8.0f} bytes/listing")
+    print(f"ratio   {dict_bytes / record_bytes:>8.2f}x")
+
+    listings = standardize.from_search(pages[0], typed=True)
+    to_dict_s = timeit.timeit(
+        lambda: [listing.to_dict() for listing in listings], number=args.number
+    )
+    print(f"to_dict {to_dict_s / args.number / len(listings) * 1e6:>8.2f} us/listing")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,474 @@
+"""
+Synthetic stand-ins for recorded Airbnb pages.
+
+Benchmarks prefer real pages saved under `benchmarks/fixtures/`; these
+generators only fill in when none have been saved, and mimic the size and
+shape of the real thing closely enough for relative timings. The tests
+build their data with them as well; pytest puts `benchmarks/` on the path.
+"""
+
+import json
+import random
+from pathlib import Path
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def load_fixtures(pattern: str) -> list[tuple[str, str]]:
+    """Returns (name, text) for every saved fixture matching `pattern`."""
+    return [
+        (path.name, path.read_text(encoding="utf-8"))
+        for path in sorted(FIXTURES_DIR.glob(pattern))
+    ]
+
+
+def _words(rng: random.Random, n: int) -> str:
+    vocabulary = [
+        "cozy", "apartment", "ocean", "view", "walking", "distance", "beach",
+        "kitchen", "quiet", "neighborhood", "balcony", "sunset", "wifi",
+        "parking", "family", "garden", "terrace", "downtown", "spacious",
+    ]  # fmt: skip
+    return " ".join(rng.choice(vocabulary) for _ in range(n))
+
+
+def make_details_data(seed: int = 0, n_photos: int = 60, n_amenities: int = 80):
+    """Builds a `niobeMinimalClientData` entry shaped like a real room page."""
+    rng = random.Random(seed)
+    sections = [
+        {
+            "sectionId": "DESCRIPTION_DEFAULT",
+            "section": {
+                "__typename": "PdpDescriptionSection",
+                "htmlDescription": {"htmlText": _words(rng, 400)},
+            },
+        },
+        {
+            "sectionId": "PHOTO_TOUR_SCROLLABLE_MODAL",
+            "section": {
+                "__typename": "PhotoTourModalSection",
+                "mediaItems": [
+                    {
+                        "accessibilityLabel": _words(rng, 6),
+                        "baseUrl": f"https://a0.muscache.com/im/pictures/{seed}-{i}.jpg",
+                    }
+                    for i in range(n_photos)
+                ],
+            },
+        },
+        {
+            "sectionId": "AMENITIES_DEFAULT",
+            "section": {
+                "__typename": "AmenitiesSection",
+                "seeAllAmenitiesGroups": [
+                    {
+                        "title": _words(rng, 2),
+                        "amenities": [
+                            {
+                                "title": _words(rng, 3),
+                                "subtitle": _words(rng, 8),
+                                "icon": "SYSTEM_WI_FI",
+                                "available": rng.random() > 0.2,
+                            }
+                            for _ in range(n_amenities // 8)
+                        ],
+                    }
+                    for _ in range(8)
+                ],
+            },
+        },
+        {
+            "sectionId": "POLICIES_DEFAULT",
+            "section": {
+                "__typename": "PoliciesSection",
+                "houseRulesSections": [
+                    {
+                        "title": _words(rng, 2),
+                        "items": [
+                            {"title": _words(rng, 4), "icon": "SYSTEM_CLOCK"}
+                            for _ in range(5)
+                        ]
+                        + [
+                            {
+                                "title": "Additional rules",
+                                "html": {"htmlText": _words(rng, 40)},
+                            }
+                        ],
+                    }
+                    for _ in range(3)
+                ],
+            },
+        },
+        {
+            "sectionId": "LOCATION_DEFAULT",
+            "section": {
+                "__typename": "LocationSection",
+                "seeAllLocationDetails": [
+                    {"title": _words(rng, 3), "content": {"htmlText": _words(rng, 80)}}
+                    for _ in range(3)
+                ],
+            },
+        },
+        {
+            "sectionId": "HIGHLIGHTS_DEFAULT",
+            "section": {
+                "__typename": "PdpHighlightsSection",
+                "highlights": [
+                    {
+                        "title": _words(rng, 3),
+                        "subtitle": _words(rng, 10),
+                        "icon": "SYSTEM_KEY",
+                    }
+                    for _ in range(3)
+                ],
+            },
+        },
+        {
+            "sectionId": "HOST_PROFILE_DEFAULT",
+            "section": {
+                "__typename": "HostProfileSection",
+                "hostAvatar": {"userID": str(1000 + seed)},
+                "title": "Hosted by Ana",
+                "subtitle": "Joined in 2016",
+                "hostProfileDescription": {"htmlText": _words(rng, 60)},
+                "additionalHosts": [{"id": "77", "name": "Luis"}],
+            },
+        },
+    ]
+    # real pages carry dozens of sections nothing in pyairbnb reads
+    sections += [
+        {
+            "sectionId": f"UNUSED_{i}",
+            "section": {"__typename": "UnusedSection", "payload": _words(rng, 200)},
+        }
+        for i in range(40)
+    ]
+    return {
+        "data": {
+            "presentation": {
+                "stayProductDetailPage": {
+                    "sections": {
+                        "metadata": {
+                            "loggingContext": {
+                                "eventDataLogging": {
+                                    "listingLat": -0.74 + seed * 1e-4,
+                                    "listingLng": -90.31,
+                                    "roomType": "Entire rental unit",
+                                    "isSuperhost": True,
+                                    "homeTier": 1,
+                                    "personCapacity": 4,
+                                    "accuracyRating": 4.9,
+                                    "checkinRating": 4.8,
+                                    "cleanlinessRating": 4.9,
+                                    "communicationRating": 5,
+                                    "locationRating": 4.7,
+                                    "valueRating": 4.8,
+                                    "guestSatisfactionOverall": 4.86,
+                                    "visibleReviewCount": 137,
+                                }
+                            }
+                        },
+                        "sbuiData": {
+                            "sectionConfiguration": {
+                                "root": {
+                                    "sections": [
+                                        {
+                                            "sectionData": {
+                                                "__typename": "PdpOverviewV2Section",
+                                                "title": "Entire rental unit",
+                                                "overviewItems": [
+                                                    {"title": "4 guests"},
+                                                    {"title": "2 bedrooms"},
+                                                ],
+                                            }
+                                        }
+                                    ]
+                                }
+                            }
+                        },
+                        "sections": sections,
+                    }
+                }
+            }
+        },
+        "variables": {
+            "id": f"U3RheUxpc3Rpbmc6{seed}",
+            "pdpSectionsRequest": {"p3ImpressionId": f"p3_{seed}_impression"},
+        },
+    }
+
+
+def make_room_html(seed: int = 0, padding_kb: int = 900) -> str:
+    """Builds a room page with the deferred state buried in realistic markup."""
+    rng = random.Random(seed)
+    deferred_state = {
+        "niobeMinimalClientData": [
+            ['StaysPdpSections:{"id":"x"}', make_details_data(seed)],
+        ]
+    }
+    bootstrap = {
+        "layout-init": {
+            "api_config": {
+                "key": "d306zoyjsyarp7ifhu67rjxn52tv0t20",
+                "baseUrl": "/api",
+            },
+            "language": "en",
+            "locale": "en",
+        }
+    }
+    markup = []
+    size = 0
+    while size < padding_kb * 1024 // 2:
+        chunk = (
+            f'<div class="c{rng.randrange(10**6)}"><span data-testid="x">'
+            f'{_words(rng, 12)}</span><a href="/rooms/{rng.randrange(10**9)}">'
+            f"{_words(rng, 3)}</a></div>"
+        )
+        markup.append(chunk)
+        size += len(chunk)
+    half = len(markup) // 2
+    return (
+        '<!doctype html><html lang="en"><head>'
+        f'<script id="data-layout-init" type="application/json">{json.dumps(bootstrap, separators=(",", ":"))}</script>'
+        "</head><body>"
+        + "".join(markup[:half])
+        + '<script id="data-deferred-state-0" data-deferred-state-0="true" type="application/json">'
+        + json.dumps(deferred_state, separators=(",", ":"))
+        + "</script>"
+        + "".join(markup[half:])
+        + "</body></html>"
+    )
+
+
+def make_search_results(seed: int = 0, n: int = 50) -> list[dict]:
+    """Builds a page of `searchResults` shaped like a real search response."""
+    rng = random.Random(seed)
+    results = []
+    for i in range(n):
+        nightly = rng.randrange(40, 400)
+        nights = rng.randrange(2, 8)
+        cleaning = rng.randrange(10, 80)
+        service = round(nightly * nights * 0.14)
+        results.append(
+            {
+                "__typename": "StaySearchResult",
+                "listing": {
+                    "id": str(seed * 10**6 + i),
+                    "roomTypeCategory": "entire_home",
+                    "pdpUrlType": "ROOMS",
+                    "name": _words(rng, 5),
+                    "title": _words(rng, 4),
+                    "listingObjType": "REPRESENTATIVE",
+                    "coordinate": {
+                        "latitude": rng.uniform(-1, 1),
+                        "longitude": rng.uniform(-91, -89),
+                    },
+                    "formattedBadges": [
+                        {"loggingContext": {"badgeType": "GUEST_FAVORITE"}}
+                    ],
+                    "avgRatingLocalized": f"4.{rng.randrange(10)} ({rng.randrange(500)})",
+                    "contextualPictures": [
+                        {"picture": f"https://a0.muscache.com/im/pictures/{i}-{j}.jpg"}
+                        for j in range(6)
+                    ],
+                },
+                "pricingQuote": {
+                    "structuredStayDisplayPrice": {
+                        "primaryLine": {
+                            "price": f"${nightly}",
+                            "qualifier": "night",
+                        },
+                        "secondaryLine": {
+                            "price": f"${nightly * nights + cleaning + service} total"
+                        },
+                        "explanationData": {
+                            "priceDetails": [
+                                {
+                                    "items": [
+                                        {
+                                            "description": f"{nights} nights x ${nightly}",
+                                            "priceString": f"${nightly * nights}",
+                                            "displayComponentType": "DEFAULT_EXPLANATION_LINE_ITEM",
+                                        },
+                                        {
+                                            "description": "Cleaning fee",
+                                            "priceString": f"${cleaning}",
+                                            "displayComponentType": "DEFAULT_EXPLANATION_LINE_ITEM",
+                                        },
+                                        {
+                                            "description": "Airbnb service fee",
+                                            "priceString": f"${service}",
+                                            "displayComponentType": "DEFAULT_EXPLANATION_LINE_ITEM",
+                                        },
+                                    ]
+                                }
+                            ]
+                        },
+                    }
+                },
+            }
+        )
+    return results
+
+
+def make_homepage_html() -> str:
+    """Builds a homepage carrying the API key bootstrap."""
+    return (
+        '<!doctype html><html lang="en"><head><script id="data-layout-init">'
+        '{"api_config":{"key":"d306zoyjsyarp7ifhu67rjxn52tv0t20","baseUrl":"/api"}}'
+        "</script></head><body></body></html>"
+    )
+
+
+def make_map_results(seed: int = 0, n: int = 500) -> list[dict]:
+    """Builds `mapSearchResults` entries, the pins a map search comes with."""
+    return [
+        {"__typename": "StaySearchResult", "listing": listing["listing"]}
+        for listing in make_search_results(seed, n)
+    ]
+
+
+def make_search_response(
+    cursor: str = "",
+    pages: int = 3,
+    page_size: int = 50,
+    map_items: int = 0,
+) -> dict:
+    """
+    Builds a StaysSearch response; cursors are page numbers up to `pages`.
+
+    With `map_items`, the response carries that many map pins ahead of the
+    results, as it does when `includeMapResults` is set.
+    """
+    page = int(cursor or 0)
+    results = make_search_results(page, page_size) if page < pages else []
+    next_cursor = str(page + 1) if page + 1 < pages else None
+    stays_search: dict = {}
+    if map_items:
+        stays_search["mapResults"] = {
+            "mapSearchResults": make_map_results(page, map_items)
+        }
+    stays_search["results"] = {
+        "searchResults": results,
+        "paginationInfo": {"nextPageCursor": next_cursor},
+    }
+    return {"data": {"presentation": {"staysSearch": stays_search}}}
+
+
+def make_reviews_page(offset: int, limit: int, total: int = 120) -> dict:
+    """Builds a StaysPdpReviewsQuery page of reviews [offset, offset + limit)."""
+    rng = random.Random(offset)
+    reviews = [
+        {
+            "id": str(10**9 - i),
+            "createdAt": f"2024-{12 - i * 12 // max(total, 1):02d}-15T10:00:00Z",
+            "rating": rng.randrange(3, 6),
+            "comments": _words(rng, 40),
+            "reviewer": {"id": str(i), "firstName": "Guest"},
+        }
+        for i in range(offset, min(offset + limit, total))
+    ]
+    return {
+        "data": {
+            "presentation": {
+                "stayProductDetailPage": {
+                    "reviews": {
+                        "reviews": reviews,
+                        "metadata": {"reviewsCount": total},
+                    }
+                }
+            }
+        }
+    }
+
+
+def make_calendar(month: int, year: int, count: int = 12) -> dict:
+    """Builds a PdpAvailabilityCalendar response of `count` months."""
+    rng = random.Random(year * 12 + month)
+    months = []
+    for i in range(count):
+        index = year * 12 + month - 1 + i
+        y, m = index // 12, index % 12 + 1
+        months.append(
+            {
+                "month": m,
+                "year": y,
+                "days": [
+                    {
+                        "calendarDate": f"{y}-{m:02d}-{d:02d}",
+                        "available": rng.random() > 0.3,
+                        "minNights": 2,
+                        "maxNights": 365,
+                        "availableForCheckin": True,
+                        "availableForCheckout": True,
+                        "bookable": True,
+                        "price": {"localPriceFormatted": None},
+                    }
+                    for d in range(1, 29)
+                ],
+            }
+        )
+    return {"data": {"merlin": {"pdpAvailabilityCalendar": {"calendarMonths": months}}}}
+
+
+def make_user_profile(user_id: str) -> dict:
+    """Builds a GetUserProfile response."""
+    rng = random.Random(user_id)
+    return {
+        "data": {
+            "presentation": {
+                "userProfileContainer": {
+                    "userProfile": {
+                        "id": user_id,
+                        "smartName": "Ana",
+                        "about": _words(rng, 60),
+                        "isSuperhost": True,
+                        "reviewsReceivedFromGuests": {"count": rng.randrange(1000)},
+                    }
+                }
+            }
+        }
+    }
+
+
+def make_price_sections(nights: int = 3) -> dict:
+    """Builds the StaysPdpSections response of a price quote."""
+    nightly = 120
+    return {
+        "data": {
+            "presentation": {
+                "stayProductDetailPage": {
+                    "sections": {
+                        "sections": [
+                            {
+                                "sectionId": "BOOK_IT_SIDEBAR",
+                                "section": {
+                                    "structuredDisplayPrice": {
+                                        "primaryLine": {
+                                            "price": f"${nightly}",
+                                            "qualifier": "night",
+                                        },
+                                        "explanationData": {
+                                            "priceDetails": [
+                                                {
+                                                    "items": [
+                                                        {
+                                                            "description": f"{nights} nights x ${nightly}",
+                                                            "priceString": f"${nightly * nights}",
+                                                        },
+                                                        {
+                                                            "description": "Cleaning fee",
+                                                            "priceString": "$40",
+                                                        },
+                                                    ]
+                                                }
+                                            ]
+                                        },
+                                    }
+                                },
+                            }
+                        ]
+                    }
+                }
+            }
+        }
+    }
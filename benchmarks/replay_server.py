@@ -0,0 +1,271 @@
+"""
+Local stand-in for airbnb.com that replays recorded or synthetic responses.
+
+Serves the homepage, room pages and the PdpAvailabilityCalendar,
+StaysPdpReviewsQuery, StaysPdpSections, GetUserProfile and StaysSearch
+operations, with optional latency and error injection. Point a client at it
+with `Api(base_url=server.base_url)` and load rooms from
+`f"{server.base_url}/rooms/<id>"`.
+
+Recorded responses are picked up from `benchmarks/fixtures/replay/`:
+`homepage.html`, `room*.html` and `<operationName>.json`. A recorded
+operation is served for the first page of a paginated query and answered
+with an empty page afterwards; anything not recorded is synthesized by
+`fixtures.py`.
+
+    $ python benchmarks/replay_server.py --port 8765 --latency 0.05 --error-rate 0.01
+"""
+
+import json
+import random
+import threading
+import time
+from argparse import ArgumentParser, Namespace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from fixtures import (
+    FIXTURES_DIR,
+    make_calendar,
+    make_homepage_html,
+    make_price_sections,
+    make_reviews_page,
+    make_room_html,
+    make_search_response,
+    make_user_profile,
+)
+
+REPLAY_DIR = FIXTURES_DIR / "replay"
+# distinct synthetic room pages; rooms are mapped onto them by ID
+SYNTHETIC_ROOMS = 4
+# map pins added to synthetic search pages that ask for map results
+MAP_ITEMS = 500
+
+
+class Recordings:
+    """Recorded bodies by route, falling back to synthetic ones."""
+
+    def __init__(self, room_padding_kb: int = 900):
+        self.homepage = self._read("homepage.html") or make_homepage_html()
+        rooms = sorted(REPLAY_DIR.glob("room*.html"))
+        self.rooms = [path.read_text(encoding="utf-8") for path in rooms] or [
+            make_room_html(seed, room_padding_kb) for seed in range(SYNTHETIC_ROOMS)
+        ]
+        self.operations = {
+            path.stem: path.read_bytes() for path in REPLAY_DIR.glob("*.json")
+        }
+
+    @staticmethod
+    def _read(name: str) -> str | None:
+        path = REPLAY_DIR / name
+        return path.read_text(encoding="utf-8") if path.exists() else None
+
+    def room(self, room_id: str) -> str:
+        index = int(room_id) if room_id.isdigit() else 0
+        return self.rooms[index % len(self.rooms)]
+
+    def operation(self, operation: str, variables: dict, body: dict | None) -> bytes:
+        recorded = self.operations.get(operation)
+        if recorded is not None and self._is_first_page(operation, variables, body):
+            return recorded
+        # a recorded first page stands for the whole result; later pages are empty
+        exhausted = recorded is not None
+        match operation:
+            case "PdpAvailabilityCalendar":
+                request = variables["request"]
+                data = make_calendar(
+                    request["month"], request["year"], request.get("count", 12)
+                )
+            case "StaysPdpReviewsQuery":
+                request = variables["pdpReviewsRequest"]
+                offset = int(request["offset"])
+                data = make_reviews_page(offset, 0 if exhausted else request["limit"])
+            case "StaysPdpSections":
+                data = make_price_sections()
+            case "GetUserProfile":
+                data = make_user_profile(variables["userId"])
+            case "StaysSearch":
+                search_variables = body["variables"]
+                data = make_search_response(
+                    search_variables["staysSearchRequest"]["cursor"],
+                    pages=0 if exhausted else 3,
+                    map_items=MAP_ITEMS if search_variables["includeMapResults"] else 0,
+                )
+            case _:
+                data = {"data": {}}
+        return json.dumps(data, separators=(",", ":")).encode()
+
+    @staticmethod
+    def _is_first_page(operation: str, variables: dict, body: dict | None) -> bool:
+        if operation == "StaysPdpReviewsQuery":
+            return int(variables["pdpReviewsRequest"]["offset"]) == 0
+        if operation == "StaysSearch" and body is not None:
+            return not body["variables"]["staysSearchRequest"]["cursor"]
+        return True
+
+
+class ReplayServer:
+    """
+    Threaded HTTP server replaying Airbnb responses.
+
+    Args:
+        host (str): Interface to bind.
+        port (int): Port to bind; 0 picks a free one.
+        latency (float): Seconds added to every response.
+        jitter (float): Extra random latency of up to this many seconds.
+        error_rate (float): Fraction of requests answered with `error_status`.
+        error_status (int): Status of injected errors; sent with Retry-After: 0.
+        room_padding_kb (int): Size of synthetic room pages.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        room_padding_kb: int = 900,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.recordings = Recordings(room_padding_kb)
+        self.requests = 0
+        self.errors = 0
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "ReplayServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        self._server.serve_forever()
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "ReplayServer":
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _inject(self) -> bool:
+        """Sleeps for the configured latency and tells whether to fail the request."""
+        delay = self.latency + random.uniform(0, self.jitter)
+        if delay:
+            time.sleep(delay)
+        failed = random.random() < self.error_rate
+        with self._lock:
+            self.requests += 1
+            self.errors += failed
+        return failed
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                self._respond(None)
+
+            def do_POST(self) -> None:
+                length = int(self.headers.get("Content-Length", 0))
+                self._respond(json.loads(self.rfile.read(length) or b"null"))
+
+            def _respond(self, body: dict | None) -> None:
+                if server._inject():
+                    self._send(server.error_status, b"", "text/plain", retry_after=True)
+                    return
+                parts = urlsplit(self.path)
+                query = {k: v[0] for k, v in parse_qs(parts.query).items()}
+                operation = query.get("operationName")
+                if operation is None and body is not None:
+                    operation = body.get("operationName")
+                if operation:
+                    variables = json.loads(query.get("variables", "{}"))
+                    payload = server.recordings.operation(operation, variables, body)
+                    self._send(200, payload, "application/json")
+                elif parts.path.startswith("/rooms/"):
+                    room = server.recordings.room(parts.path.rsplit("/", 1)[-1])
+                    self._send(200, room.encode(), "text/html; charset=utf-8")
+                elif parts.path in ("", "/"):
+                    homepage = server.recordings.homepage.encode()
+                    self._send(200, homepage, "text/html; charset=utf-8")
+                else:
+                    self._send(404, b"", "text/plain")
+
+            def _send(
+                self,
+                status: int,
+                payload: bytes,
+                content_type: str,
+                retry_after: bool = False,
+            ) -> None:
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(payload)))
+                if retry_after:
+                    self.send_header("Retry-After", "0")
+                self.end_headers()
+                self.wfile.write(payload)
+
+        return Handler
+
+
+class ProgramArgsNamespace(Namespace):
+    host: str
+    port: int
+    latency: float
+    jitter: float
+    error_rate: float
+    error_status: int
+
+
+def get_args() -> ProgramArgsNamespace:
+    parser = ArgumentParser()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=503)
+    return parser.parse_args(namespace=ProgramArgsNamespace())
+
+
+def main() -> None:
+    args = get_args()
+    server = ReplayServer(
+        args.host,
+        args.port,
+        args.latency,
+        args.jitter,
+        args.error_rate,
+        args.error_status,
+    )
+    print(f"replaying on {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.close()
+
+
+if __name__ == "__main__":
+    main()
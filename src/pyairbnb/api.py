@@ -1,155 +1,262 @@
 import base64
 import json
-import re
-from datetime import datetime
-from functools import cached_property
-from typing import Any
-from urllib.parse import urlencode
+import threading
+import time
+from collections.abc import Callable, Collection, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone
+from typing import Any, NamedTuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
 
-from curl_cffi import requests
+from curl_cffi import Curl, CurlOpt, requests
 from curl_cffi.requests import BrowserTypeLiteral, Cookies, Response
+from curl_cffi.requests.exceptions import RequestException
 
-from pyairbnb import parse
+from pyairbnb import jsonlib, parse
+from pyairbnb.cache import ResponseCache, make_cache_key
+from pyairbnb.hostcache import HostCache
+from pyairbnb.keystore import ApiKeyStore, default_key_store
+from pyairbnb.metrics import RequestEvent
+from pyairbnb.proxies import ProxyPool
+from pyairbnb.ratelimit import RateLimiter, RetryPolicy
+from pyairbnb.standardize import DetailView
 from pyairbnb.utils import (
     get_nested_value,
     make_html_headers,
     make_json_headers,
     make_proxies,
+    parse_price_symbol,
 )
 
 DEFAULT_CURRENCY = "USD"
+DEFAULT_IMPERSONATE: BrowserTypeLiteral = "chrome110"
+DEFAULT_POOL_SIZE = 10
+DEFAULT_KEEP_ALIVE_IDLE = 60
 
+HOMEPAGE_URL = "https://www.airbnb.com"
+REVIEWS_PAGE_SIZE = 50
+CALENDAR_MONTHS = 12
+# statuses Airbnb answers with when the X-Airbnb-Api-Key header is rejected
+AUTH_ERROR_STATUSES = frozenset({401, 403})
+# statuses that count against the health of the proxy that got them
+PROXY_FAILURE_STATUSES = frozenset({403, 407, 429})
+
+
+class ReviewWatermark(NamedTuple):
+    """
+    The newest review seen for a listing, as kept by `watermarks.ReviewWatermarks`.
+
+    Pagination stops at the review with `review_id`, or, should that review
+    have been removed, at the first one created on or before `created_at`.
+    """
+
+    review_id: str
+    created_at: str | None = None
+
+
+def parse_created_at(value: str) -> datetime:
+    """
+    Parses a review `createdAt` timestamp, e.g. "2024-05-01T12:00:00Z".
+
+    Raises:
+        ValueError: If `value` is not an ISO 8601 timestamp.
+    """
+    if not isinstance(value, str):
+        raise ValueError(f"Invalid review createdAt: {value!r}")
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    try:
+        created_at = datetime.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f"Invalid review createdAt: {value!r}") from None
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    return created_at
+
+
+class BaseApi:
+    """
+    Transport-independent part of the Airbnb client.
+
+    Holds the configuration shared by `Api` and `AsyncApi` and knows how to
+    build each request and pick the relevant data out of its response, so the
+    two clients only differ in how they send requests.
+    """
 
-class Api:
     def __init__(
         self,
         currency: str = DEFAULT_CURRENCY,
         proxy_url: str | None = None,
         timeout_get: int = 60,
+        impersonate: BrowserTypeLiteral = DEFAULT_IMPERSONATE,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        keep_alive: bool = True,
+        keep_alive_idle: int = DEFAULT_KEEP_ALIVE_IDLE,
+        key_store: ApiKeyStore | None = None,
+        cache: ResponseCache | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        proxy_pool: ProxyPool | None = None,
+        host_cache: HostCache | None = None,
+        base_url: str = HOMEPAGE_URL,
+        on_request: Callable[[RequestEvent], None] | None = None,
     ):
         self.currency = currency
+        self.base_url = base_url.rstrip("/")
+        self.on_request = on_request
+        self.key_store = key_store or default_key_store
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.proxy_pool = proxy_pool
+        self.host_cache = host_cache
         self.proxies = make_proxies(proxy_url)
         self.timeout_get = timeout_get
+        self.impersonate = impersonate
+        self.pool_size = pool_size
+        self.curl_options = {
+            CurlOpt.MAXCONNECTS: pool_size,
+            CurlOpt.TCP_KEEPALIVE: int(keep_alive),
+        }
+        if keep_alive:
+            self.curl_options[CurlOpt.TCP_KEEPIDLE] = keep_alive_idle
 
     @property
-    def json_headers(self) -> dict[str, str]:
-        return make_json_headers(self.api_key)
+    def session_kwargs(self) -> dict[str, Any]:
+        # cookies are always passed explicitly per request, so the session jar
+        # must not accumulate state from one listing into the next
+        return {
+            "proxies": self.proxies,
+            "timeout": self.timeout_get,
+            "impersonate": self.impersonate,
+            "curl_options": self.curl_options,
+            "discard_cookies": True,
+        }
 
-    def get(
-        self,
+    @staticmethod
+    def _request_target(
         url: str,
-        headers: dict[str, str],
         params: dict | list | tuple | None = None,
-        cookies: Cookies | None = None,
-    ) -> Response:
-        return requests.get(
-            url=url,
-            params=params,
-            headers=headers,
-            proxies=self.proxies,
-            cookies=cookies,
-            timeout=self.timeout_get,
-        )
+        json_data: dict[str, Any] | None = None,
+    ) -> tuple[str, str | None]:
+        """Returns the host and GraphQL operation name a request is rate limited under."""
+        parts = urlsplit(url)
+        if json_data and "operationName" in json_data:
+            return parts.netloc, json_data["operationName"]
+        query = dict(parse_qsl(parts.query))
+        if params:
+            query.update(params)
+        return parts.netloc, query.get("operationName")
 
-    def get_json(
+    def _pick_proxy(self, request_kwargs: dict[str, Any]) -> str | None:
+        """Chooses the pool proxy for the next attempt and sets it on `request_kwargs`."""
+        if self.proxy_pool is None:
+            return None
+        proxy_url = self.proxy_pool.choose(request_kwargs.get("cookies"))
+        request_kwargs["proxies"] = make_proxies(proxy_url)
+        return proxy_url
+
+    def _record_response(
         self,
-        url: str,
-        params: dict | list | tuple | None = None,
-        headers: dict[str, str] | None = None,
-        cookies: Cookies | None = None,
-    ):
-        if headers is None:
-            headers = self.json_headers
+        host: str,
+        operation: str | None,
+        proxy_url: str | None,
+        started: float,
+        response: Response,
+    ) -> None:
+        if self.rate_limiter is not None:
+            self.rate_limiter.record(host, operation, response.status_code)
+        if self.proxy_pool is not None and proxy_url is not None:
+            proxy_failed = (
+                response.status_code in PROXY_FAILURE_STATUSES
+                or response.status_code >= 500
+            )
+            self.proxy_pool.record(
+                proxy_url, time.monotonic() - started, ok=not proxy_failed
+            )
+            if response.cookies:
+                self.proxy_pool.pin(response.cookies, proxy_url)
 
-        response = self.get(
-            url=url,
-            headers=headers,
-            params=params,
-            cookies=cookies,
-        )
-        response.raise_for_status()
-        data = response.json()
-        return data
+    def _record_error(self, proxy_url: str | None, started: float) -> None:
+        if self.proxy_pool is not None and proxy_url is not None:
+            self.proxy_pool.record(proxy_url, time.monotonic() - started, ok=False)
 
-    def get_html(
+    def _report(
         self,
-        url: str,
-        use_api_key: bool,
-        header_connection_close: bool,
-        params: dict | list | tuple | None = None,
-    ) -> Response:
-        headers = make_html_headers(
-            api_key=self.api_key if use_api_key else None,
-            connection_close=header_connection_close,
-        )
-        return self.get(
-            url=url,
-            headers=headers,
-            params=params,
+        method: str,
+        host: str,
+        operation: str | None,
+        proxy_url: str | None,
+        started: float,
+        attempt: int,
+        response: Response | None = None,
+        error: BaseException | None = None,
+    ) -> None:
+        """Hands the outcome of a request, retries included, to `on_request`."""
+        if self.on_request is None:
+            return
+        self.on_request(
+            RequestEvent(
+                operation=operation,
+                host=host,
+                method=method,
+                status=None if response is None else response.status_code,
+                latency=time.monotonic() - started,
+                size=0 if response is None else len(response.content),
+                retries=attempt,
+                proxy=proxy_url,
+                error=None if error is None else type(error).__name__,
+            )
         )
 
-    def post(
+    def _cache_lookup(
         self,
         url: str,
-        params: dict[str, Any],
-        json_data: dict[str, Any],
-        headers: dict[str, str],
-        impersonate: BrowserTypeLiteral = "chrome110",
-    ) -> Response:
-        url_parsed = f"{url}?{urlencode(params)}"
-        return requests.post(
-            url=url_parsed,
-            json=json_data,
-            headers=headers,
-            proxies=self.proxies,
-            impersonate=impersonate,
-        )
+        params: dict | list | tuple | None,
+    ) -> tuple[tuple[str, str] | None, Any]:
+        """Returns the cache key of a request and its cached data, if any."""
+        if self.cache is None:
+            return None, None
+        cache_key = make_cache_key(url, params)
+        if cache_key is None:
+            return None, None
+        body = self.cache.get(cache_key[0])
+        if body is None:
+            return cache_key, None
+        return cache_key, jsonlib.loads(body)
 
-    @cached_property
-    def api_key(self) -> str:
-        response: Response = self.get_html(
-            url="https://www.airbnb.com",
-            use_api_key=False,
-            header_connection_close=False,
-        )
-        response.raise_for_status()
-        body = response.text
-        match = re.search(r'"api_config":{"key":"(.+?)"', body)
-        if not match:
-            raise AttributeError("could not extract API key from response text")
-        api_key = match.group(1)
-        return api_key
-
-    def get_details(
+    def _cache_store(
         self,
-        room_url: str,
-    ) -> tuple[dict[str, Any], dict[str, Any], Cookies]:
-        response: Response = self.get_html(
-            url=room_url,
-            use_api_key=False,
-            header_connection_close=False,
-        )
-        response.raise_for_status()
+        cache_key: tuple[str, str] | None,
+        response: Response,
+    ) -> None:
+        if self.cache is not None and cache_key is not None:
+            self.cache.set(*cache_key, response.content)
 
-        data_formatted, price_dependency_input = parse.parse_body_details_wrapper(
-            response.text
-        )
-        cookies = response.cookies
+    @staticmethod
+    def _is_auth_error(response: Response) -> bool:
+        return response.status_code in AUTH_ERROR_STATUSES
 
-        return data_formatted, price_dependency_input, cookies
+    @staticmethod
+    def _parse_api_key(body: str) -> str:
+        api_key = parse.extract_api_config_key(body)
+        if api_key is None:
+            raise AttributeError("could not extract API key from response text")
+        return api_key
 
-    def get_calendar(
+    def _calendar_url(
         self,
         room_id: str,
         month: int | None = None,
         year: int | None = None,
-    ):
+        count: int = CALENDAR_MONTHS,
+    ) -> str:
         month = month or datetime.now().month
         year = year or datetime.now().year
-        endpoint = "https://www.airbnb.com/api/v3/PdpAvailabilityCalendar/8f08e03c7bd16fcad3c92a3592c19a8b559a0d0855a84028d1163d4733ed9ade/"
+        endpoint = f"{self.base_url}/api/v3/PdpAvailabilityCalendar/8f08e03c7bd16fcad3c92a3592c19a8b559a0d0855a84028d1163d4733ed9ade/"
         variables_data = {
             "request": {
-                "count": 12,
+                "count": count,
                 "listingId": room_id,
                 "month": month,
                 "year": year,
@@ -170,45 +277,31 @@ class Api:
             "variables": data_raw_variables,
             "extensions": data_raw_extension,
         }
-        url = f"{endpoint}?{urlencode(query)}"
+        return f"{endpoint}?{urlencode(query)}"
 
-        data = self.get_json(url)
-        calendar = get_nested_value(
+    @staticmethod
+    def _parse_calendar(data: dict) -> list:
+        return get_nested_value(
             data,
             key_path="data.merlin.pdpAvailabilityCalendar.calendarMonths",
             default=[],
         )
-        return calendar
-
-    def get_reviews(
-        self,
-        product_id: str,
-    ) -> list:
-        offset = 0
-        all_reviews: list = []
-        while True:
-            reviews = self._get_reviews_from_offset(offset, product_id)
-            offset = offset + 50
-            if len(reviews) == 0:
-                break
-            all_reviews.extend(reviews)
-        return all_reviews
 
-    def _get_reviews_from_offset(
+    def _reviews_url(
         self,
         offset: int,
         product_id: str,
     ) -> str:
-        endpoint = "https://www.airbnb.com/api/v3/StaysPdpReviewsQuery/dec1c8061483e78373602047450322fd474e79ba9afa8d3dbbc27f504030f91d/"
+        endpoint = f"{self.base_url}/api/v3/StaysPdpReviewsQuery/dec1c8061483e78373602047450322fd474e79ba9afa8d3dbbc27f504030f91d/"
         variables_data = {
             "id": product_id,
             "pdpReviewsRequest": {
                 "fieldSelector": "for_p3_translation_only",
                 "forPreview": False,
-                "limit": 50,
+                "limit": REVIEWS_PAGE_SIZE,
                 "offset": f"{offset}",
                 "showingTranslationButton": False,
-                "first": 50,
+                "first": REVIEWS_PAGE_SIZE,
                 "sortingPreference": "MOST_RECENT",
                 "numberOfAdults": "1",
                 "numberOfChildren": "0",
@@ -232,22 +325,81 @@ class Api:
             "variables": data_raw_variables,
             "extensions": data_raw_extension,
         }
-        url = f"{endpoint}?{urlencode(query)}"
-
-        data = self.get_json(url)
+        return f"{endpoint}?{urlencode(query)}"
 
-        reviews = get_nested_value(
+    @staticmethod
+    def _parse_reviews(data: dict) -> list:
+        return get_nested_value(
             data,
             key_path="data.presentation.stayProductDetailPage.reviews.reviews",
             default={},
         )
-        return reviews
 
-    def get_host_details(
-        self,
-        host_id: str,
-        cookies: Cookies,
-    ):
+    @staticmethod
+    def _parse_reviews_count(data: dict) -> int | None:
+        return get_nested_value(
+            data,
+            key_path="data.presentation.stayProductDetailPage.reviews.metadata.reviewsCount",
+        )
+
+    @staticmethod
+    def _is_watermark(review: dict, since: str | date | ReviewWatermark) -> bool:
+        """
+        Whether `review` has the ID `since`, was created by the date `since`,
+        or is the watermark `since` or older.
+
+        Raises:
+            ValueError: If a date comparison meets a review without a valid
+                `createdAt`.
+        """
+        if isinstance(since, ReviewWatermark):
+            if review.get("id") == since.review_id:
+                return True
+            if since.created_at is None:
+                return False
+            since = parse_created_at(since.created_at)
+        elif isinstance(since, str):
+            return review.get("id") == since
+        created_at = parse_created_at(review.get("createdAt"))
+        if not isinstance(since, datetime):
+            return created_at.date() <= since
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return created_at <= since
+
+    @classmethod
+    def _reviews_until(
+        cls,
+        reviews: list,
+        since: str | date | ReviewWatermark | None,
+    ) -> tuple[list, bool]:
+        """Returns the reviews newer than `since` and whether `since` was reached."""
+        if since is None:
+            return reviews, False
+        for index, review in enumerate(reviews):
+            if cls._is_watermark(review, since):
+                return reviews[:index], True
+        return reviews, False
+
+    @staticmethod
+    def _review_offsets(start: int, review_count: int) -> range:
+        """Offsets of the pages from `start` needed to cover `review_count` reviews."""
+        return range(start, int(review_count), REVIEWS_PAGE_SIZE)
+
+    @staticmethod
+    def _next_review_offset(offset: int, page: list, review_count: int) -> int | None:
+        """
+        Where to keep paginating after the last page scheduled from `review_count`.
+
+        The count can lag behind the listing: a full last page that ends past
+        it means there may be more. A full page that ends exactly at the count
+        does not, which saves requesting a trailing empty page.
+        """
+        if len(page) == REVIEWS_PAGE_SIZE and offset + len(page) > review_count:
+            return offset + REVIEWS_PAGE_SIZE
+        return None
+
+    def _host_details_request(self, host_id: str) -> tuple[str, dict[str, str]]:
         # Encode the host ID to match Airbnb's required format
         host_id = "User:" + host_id
         user_id = base64.b64encode(host_id.encode()).decode("utf-8")
@@ -274,16 +426,10 @@ class Api:
                 }
             ),
         }
+        url = f"{self.base_url}/api/v3/GetUserProfile/a56d8909f271740ccfef23dd6c34d098f194f4a6e7157f244814c5610b8ad76a"
+        return url, params
 
-        data = self.get_json(
-            url="https://www.airbnb.com/api/v3/GetUserProfile/a56d8909f271740ccfef23dd6c34d098f194f4a6e7157f244814c5610b8ad76a",
-            params=params,
-            cookies=cookies,
-        )
-
-        return data
-
-    def get_search(
+    def _search_request(
         self,
         check_in: str,
         check_out: str,
@@ -293,7 +439,8 @@ class Api:
         sw_long: float,
         zoom_value: int,
         cursor: str = "",
-    ):
+        include_map: bool = True,
+    ) -> tuple[str, dict[str, str], dict[str, Any]]:
         treatment = [
             "feed_map_decouple_m11_treatment",
             "stays_search_rehydration_treatment_desktop",
@@ -308,13 +455,12 @@ class Api:
 
         days = difference.days
 
-        base_url = "https://www.airbnb.com/api/v3/StaysSearch/d4d9503616dc72ab220ed8dcf17f166816dccb2593e7b4625c91c3fce3a3b3d6"
+        base_url = f"{self.base_url}/api/v3/StaysSearch/d4d9503616dc72ab220ed8dcf17f166816dccb2593e7b4625c91c3fce3a3b3d6"
         query_params = {
             "operationName": "StaysSearch",
             "locale": "en",
             "currency": self.currency,
         }
-        url_parsed = f"{base_url}?{urlencode(query_params)}"
         raw_params = [
             {"filterName": "cdnCacheSafe", "filterValues": ["false"]},
             {"filterName": "channel", "filterValues": ["EXPLORE"]},
@@ -352,7 +498,7 @@ class Api:
                 },
             },
             "variables": {
-                "includeMapResults": True,
+                "includeMapResults": include_map,
                 "isLeanTreatment": False,
                 "staysMapSearchRequestV2": {
                     "cursor": cursor,
@@ -375,39 +521,24 @@ class Api:
                 },
             },
         }
+        return base_url, query_params, input_data
 
-        headers = make_html_headers(
-            self.api_key,
-            connection_close=True,
-        )
-
-        response = requests.post(
-            url_parsed,
-            json=input_data,
-            headers=headers,
-            proxies=self.proxies,
-            impersonate="chrome110",
-        )
-
-        data = response.json()
-
-        to_return = get_nested_value(
+    @staticmethod
+    def _parse_search(data: dict) -> dict:
+        return get_nested_value(
             data,
             "data.presentation.staysSearch.results",
             {},
         )
 
-        return to_return
-
-    def get_price(
+    def _price_url(
         self,
         product_id: str,
         impression_id: str,
-        cookies: Cookies,
         check_in: str,
         check_out: str,
-    ) -> dict:
-        endpoint = "https://www.airbnb.com/api/v3/StaysPdpSections/80c7889b4b0027d99ffea830f6c0d4911a6e863a957cbe1044823f0fc746bf1f"
+    ) -> str:
+        endpoint = f"{self.base_url}/api/v3/StaysPdpSections/80c7889b4b0027d99ffea830f6c0d4911a6e863a957cbe1044823f0fc746bf1f"
         extension = {
             "persistedQuery": {
                 "version": 1,
@@ -475,18 +606,10 @@ class Api:
             "variables": data_raw_variables,
             "extensions": data_raw_extension,
         }
-        url = f"{endpoint}?{urlencode(query)}"
-
-        session = requests.Session()
-
-        for name in cookies:
-            session.cookies.set(name, cookies[name])
-
-        response = session.get(url, headers=self.json_headers, proxies=self.proxies)
-
-        response.raise_for_status()
-        data = response.json()
+        return f"{endpoint}?{urlencode(query)}"
 
+    @staticmethod
+    def _parse_price(data: dict) -> dict:
         sections = get_nested_value(
             data,
             key_path="data.presentation.stayProductDetailPage.sections.sections",
@@ -521,3 +644,570 @@ class Api:
                         final_data["details"][item["description"]] = item["priceString"]
                 return final_data
         return {}
+
+    @staticmethod
+    def _price_row(
+        check_in: str,
+        check_out: str,
+        price: dict,
+        error: Exception | None = None,
+    ) -> dict:
+        """
+        Flattens a `_parse_price` result into one row of a price table; a
+        quote that failed with `error` gets a row with no prices.
+        """
+
+        def amount(price_string: Any) -> float | None:
+            if not isinstance(price_string, str) or not price_string:
+                return None
+            return parse_price_symbol(price_string)[0]
+
+        main = price.get("main", {})
+        price_string = main.get("price")
+        return {
+            "check_in": check_in,
+            "check_out": check_out,
+            "available": bool(price),
+            "price": amount(price_string),
+            "discounted_price": amount(main.get("discountedPrice")),
+            "original_price": amount(main.get("originalPrice")),
+            "currency_symbol": (
+                parse_price_symbol(price_string)[1]
+                if isinstance(price_string, str)
+                else ""
+            ),
+            "qualifier": main.get("qualifier") or "",
+            "details": {
+                description: amount(price_string)
+                for description, price_string in price.get("details", {}).items()
+            },
+            "error": error,
+        }
+
+
+class ThreadSession(requests.Session):
+    """
+    curl_cffi session that keeps track of the curl handle of every thread.
+
+    curl_cffi opens one handle, with its own connection pool, per thread
+    using a session, but `Session.close` only frees the calling thread's.
+    This one frees them all, and `close_finished_threads` frees those of
+    threads that have exited, e.g. the workers of a fan-out that is over.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._handles: dict[threading.Thread, Curl] = {}
+        self._handles_lock = threading.Lock()
+
+    @property
+    def curl(self) -> Curl:
+        curl = super().curl
+        thread = threading.current_thread()
+        if self._handles.get(thread) is not curl:
+            with self._handles_lock:
+                self._handles[thread] = curl
+        return curl
+
+    def close_finished_threads(self) -> None:
+        """Frees the handles of the threads that are no longer running."""
+        with self._handles_lock:
+            finished = [thread for thread in self._handles if not thread.is_alive()]
+            handles = [self._handles.pop(thread) for thread in finished]
+        for handle in handles:
+            handle.close()
+
+    def close(self) -> None:
+        self._closed = True
+        with self._handles_lock:
+            handles = list(self._handles.values())
+            self._handles.clear()
+        for handle in handles:
+            handle.close()
+
+
+class Api(BaseApi):
+    """
+    Airbnb client holding one long-lived curl_cffi session.
+
+    All requests made through an instance share the session's connection pool,
+    so TLS handshakes are only paid once per host. Threads get a handle of
+    their own: those of the worker threads of `get_reviews` and `get_prices`
+    are freed when the fan-out is over, and `close()` frees the rest. Close
+    it with `close()` or use it as a context manager.
+
+    Args:
+        currency (str): Currency for pricing information.
+        proxy_url (str): Proxy URL.
+        timeout_get (int): Request timeout in seconds.
+        impersonate (str): Browser profile to impersonate.
+        pool_size (int): Maximum number of cached connections per session handle.
+        keep_alive (bool): Whether to send TCP keep-alive probes on idle connections.
+        keep_alive_idle (int): Idle seconds before the first keep-alive probe.
+        key_store (ApiKeyStore): Where the API key is cached; shared process-wide by default.
+        cache (ResponseCache): Optional cache for GraphQL responses fetched by `get_json`.
+        rate_limiter (RateLimiter): Optional limiter, can be shared by several clients.
+        retry_policy (RetryPolicy): Backoff for 429/5xx and network errors; retries 3 times by default.
+        proxy_pool (ProxyPool): Proxies to rotate through per request; overrides proxy_url.
+        host_cache (HostCache): Optional cache of host profiles shared across listings.
+        base_url (str): Origin the API requests go to, e.g. a local replay server.
+        on_request (callable): Called with a `RequestEvent` after each request and its retries.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.session = ThreadSession(**self.session_kwargs)
+
+    def close(self) -> None:
+        self.session.close()
+
+    def close_finished_threads(self) -> None:
+        """Frees the curl handles of threads that have exited since using the client."""
+        self.session.close_finished_threads()
+
+    def __enter__(self) -> "Api":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    @property
+    def json_headers(self) -> dict[str, str]:
+        return make_json_headers(self.api_key)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: dict | list | tuple | None = None,
+        json_data: dict[str, Any] | None = None,
+        **kwargs,
+    ) -> Response:
+        """
+        Sends a request through the rate limiter, retrying per `retry_policy`.
+
+        The last response is returned once retries are exhausted, so callers
+        still decide how to handle its status.
+        """
+        host, operation = self._request_target(url, params, json_data)
+        first_started = time.monotonic()
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                time.sleep(self.rate_limiter.reserve(host, operation))
+            self.retry_policy.sent()
+            proxy_url = self._pick_proxy(kwargs)
+            started = time.monotonic()
+            response: Response | None
+            try:
+                response = self.session.request(
+                    method, url, params=params, json=json_data, **kwargs
+                )
+            except RequestException as error:
+                self._record_error(proxy_url, started)
+                if not self.retry_policy.should_retry(attempt, None):
+                    self._report(
+                        method,
+                        host,
+                        operation,
+                        proxy_url,
+                        first_started,
+                        attempt,
+                        error=error,
+                    )
+                    raise
+                response = None
+            else:
+                self._record_response(host, operation, proxy_url, started, response)
+                if not self.retry_policy.should_retry(attempt, response):
+                    self._report(
+                        method,
+                        host,
+                        operation,
+                        proxy_url,
+                        first_started,
+                        attempt,
+                        response,
+                    )
+                    return response
+            time.sleep(self.retry_policy.delay(attempt, response))
+            attempt += 1
+
+    def get(
+        self,
+        url: str,
+        headers: dict[str, str],
+        params: dict | list | tuple | None = None,
+        cookies: Cookies | None = None,
+    ) -> Response:
+        return self.request(
+            "GET",
+            url=url,
+            params=params,
+            headers=headers,
+            cookies=cookies,
+        )
+
+    def get_json(
+        self,
+        url: str,
+        params: dict | list | tuple | None = None,
+        headers: dict[str, str] | None = None,
+        cookies: Cookies | None = None,
+    ):
+        cache_key, cached = self._cache_lookup(url, params)
+        if cached is not None:
+            return cached
+
+        use_api_key = headers is None
+        if headers is None:
+            headers = self.json_headers
+
+        response = self.get(
+            url=url,
+            headers=headers,
+            params=params,
+            cookies=cookies,
+        )
+        if use_api_key and self._is_auth_error(response):
+            self.key_store.invalidate(headers["X-Airbnb-Api-Key"])
+            response = self.get(
+                url=url,
+                headers=self.json_headers,
+                params=params,
+                cookies=cookies,
+            )
+        response.raise_for_status()
+        data = jsonlib.loads(response.content)
+        self._cache_store(cache_key, response)
+        return data
+
+    def get_html(
+        self,
+        url: str,
+        use_api_key: bool,
+        header_connection_close: bool,
+        params: dict | list | tuple | None = None,
+    ) -> Response:
+        headers = make_html_headers(
+            api_key=self.api_key if use_api_key else None,
+            connection_close=header_connection_close,
+        )
+        return self.get(
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+    def post(
+        self,
+        url: str,
+        params: dict[str, Any],
+        json_data: dict[str, Any],
+        headers: dict[str, str],
+        impersonate: BrowserTypeLiteral | None = None,
+    ) -> Response:
+        url_parsed = f"{url}?{urlencode(params)}"
+        return self.request(
+            "POST",
+            url=url_parsed,
+            json_data=json_data,
+            headers=headers,
+            impersonate=impersonate or self.impersonate,
+        )
+
+    @property
+    def api_key(self) -> str:
+        return self.key_store.get_or_fetch(self._fetch_api_key)
+
+    def _fetch_api_key(self) -> str:
+        response: Response = self.get_html(
+            url=self.base_url,
+            use_api_key=False,
+            header_connection_close=False,
+        )
+        response.raise_for_status()
+        return self._parse_api_key(response.text)
+
+    def get_details(
+        self,
+        room_url: str,
+        sections: Collection[str] | None = None,
+    ) -> tuple[dict[str, Any], dict[str, Any], Cookies]:
+        view, language, price_dependency_input, cookies = self.get_details_view(
+            room_url
+        )
+        data_formatted = view.to_dict(sections)
+        data_formatted["language"] = language
+        return data_formatted, price_dependency_input, cookies
+
+    def get_details_view(
+        self,
+        room_url: str,
+    ) -> tuple[DetailView, str, dict[str, Any], Cookies]:
+        """
+        Fetches a room page and returns it as a lazy `standardize.DetailView`,
+        along with its language, price request inputs and cookies.
+
+        Nothing is standardized until a field is read, so callers that only
+        need the cookies and IDs, or a few fields, skip the rest of the page.
+        """
+        response: Response = self.get_html(
+            url=room_url,
+            use_api_key=False,
+            header_connection_close=False,
+        )
+        response.raise_for_status()
+
+        view, language, price_dependency_input = parse.parse_body_details_view(
+            response.content
+        )
+        # the page's first "key" may be anything; only share its api_config key
+        api_key = parse.extract_api_config_key(response.content)
+        if api_key is not None:
+            self.key_store.offer(api_key)
+        return view, language, price_dependency_input, response.cookies
+
+    def get_calendar(
+        self,
+        room_id: str,
+        month: int | None = None,
+        year: int | None = None,
+        count: int = CALENDAR_MONTHS,
+    ):
+        data = self.get_json(self._calendar_url(room_id, month, year, count))
+        return self._parse_calendar(data)
+
+    def get_reviews(
+        self,
+        product_id: str,
+        review_count: int | None = None,
+        concurrency: int = 1,
+        since: str | date | ReviewWatermark | None = None,
+    ) -> list:
+        """
+        Fetches every review of a listing, most recent first.
+
+        With `concurrency` above 1 all page offsets are scheduled up front from
+        `review_count` (e.g. `rating.review_count` of `standardize.from_details`)
+        or, when it is not given, from the total reported by the first page, and
+        fetched by that many threads. Pages are reassembled in order.
+
+        With `since`, only reviews newer than it are returned: pages are fetched
+        one by one and pagination stops at the review with that ID, at the
+        first review created on or before that date or datetime, or at either
+        for a `ReviewWatermark`. See `watermarks.ReviewWatermarks` to keep
+        track of it across runs.
+        """
+        if since is not None or concurrency <= 1:
+            return self._get_reviews_sequential(product_id, 0, since)
+
+        if review_count is not None:
+            review_count = int(review_count)
+        all_reviews: list = []
+        first_page: list = []
+        start = 0
+        if not review_count:
+            first_page, review_count = self._get_reviews_page(0, product_id)
+            if review_count is None:
+                return first_page + self._get_reviews_sequential(
+                    product_id, REVIEWS_PAGE_SIZE
+                )
+            all_reviews.extend(first_page)
+            start = REVIEWS_PAGE_SIZE
+
+        offsets = self._review_offsets(start, review_count)
+        try:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                pages = list(
+                    executor.map(
+                        lambda offset: self._get_reviews_from_offset(
+                            offset, product_id
+                        ),
+                        offsets,
+                    )
+                )
+        finally:
+            self.close_finished_threads()
+        for reviews in pages:
+            all_reviews.extend(reviews)
+
+        if pages:
+            next_offset = self._next_review_offset(offsets[-1], pages[-1], review_count)
+        else:
+            next_offset = self._next_review_offset(0, first_page, review_count)
+        if next_offset is not None:
+            all_reviews.extend(self._get_reviews_sequential(product_id, next_offset))
+        return all_reviews
+
+    def _get_reviews_sequential(
+        self,
+        product_id: str,
+        offset: int,
+        since: str | date | ReviewWatermark | None = None,
+    ) -> list:
+        all_reviews: list = []
+        while True:
+            reviews = self._get_reviews_from_offset(offset, product_id)
+            offset = offset + REVIEWS_PAGE_SIZE
+            if len(reviews) == 0:
+                break
+            reviews, reached_watermark = self._reviews_until(reviews, since)
+            all_reviews.extend(reviews)
+            if reached_watermark:
+                break
+        return all_reviews
+
+    def _get_reviews_page(
+        self,
+        offset: int,
+        product_id: str,
+    ) -> tuple[list, int | None]:
+        data = self.get_json(self._reviews_url(offset, product_id))
+        return self._parse_reviews(data), self._parse_reviews_count(data)
+
+    def _get_reviews_from_offset(
+        self,
+        offset: int,
+        product_id: str,
+    ) -> list:
+        reviews, _ = self._get_reviews_page(offset, product_id)
+        return reviews
+
+    def get_host_details(
+        self,
+        host_id: str,
+        cookies: Cookies,
+    ):
+        if self.host_cache is None:
+            return self._fetch_host_details(host_id, cookies)
+        return self.host_cache.get_or_fetch(
+            host_id, lambda: self._fetch_host_details(host_id, cookies)
+        )
+
+    def _fetch_host_details(
+        self,
+        host_id: str,
+        cookies: Cookies,
+    ):
+        url, params = self._host_details_request(host_id)
+        data = self.get_json(
+            url=url,
+            params=params,
+            cookies=cookies,
+        )
+
+        return data
+
+    def get_search(
+        self,
+        check_in: str,
+        check_out: str,
+        ne_lat: float,
+        ne_long: float,
+        sw_lat: float,
+        sw_long: float,
+        zoom_value: int,
+        cursor: str = "",
+        include_map: bool = True,
+    ):
+        """
+        Fetches one page of search results.
+
+        Args:
+            include_map (bool): Ask for the map pins too; pyairbnb does not use them.
+
+        Returns:
+            dict: `data.presentation.staysSearch.results` of the response.
+        """
+        url, query_params, input_data = self._search_request(
+            check_in,
+            check_out,
+            ne_lat,
+            ne_long,
+            sw_lat,
+            sw_long,
+            zoom_value,
+            cursor,
+            include_map,
+        )
+        headers = make_html_headers(self.api_key)
+
+        response = self.post(
+            url,
+            params=query_params,
+            json_data=input_data,
+            headers=headers,
+        )
+        if self._is_auth_error(response):
+            self.key_store.invalidate(headers["X-Airbnb-Api-Key"])
+            response = self.post(
+                url,
+                params=query_params,
+                json_data=input_data,
+                headers=make_html_headers(self.api_key),
+            )
+        response.raise_for_status()
+
+        data = jsonlib.loads(response.content)
+
+        return self._parse_search(data)
+
+    def get_price(
+        self,
+        product_id: str,
+        impression_id: str,
+        cookies: Cookies,
+        check_in: str,
+        check_out: str,
+    ) -> dict:
+        url = self._price_url(product_id, impression_id, check_in, check_out)
+        data = self.get_json(url, cookies=cookies)
+        return self._parse_price(data)
+
+    def get_prices(
+        self,
+        product_id: str,
+        impression_id: str,
+        cookies: Cookies,
+        date_ranges: Iterable[tuple[str, str]],
+        concurrency: int = 4,
+    ) -> list[dict]:
+        """
+        Quotes a listing for many stays at once.
+
+        Every quote reuses the impression ID and cookies of one room page
+        (see `get_details`) and the client's session, and at most
+        `concurrency` quotes are in flight at a time.
+
+        Args:
+            product_id (str): Product ID from `get_details`.
+            impression_id (str): Impression ID from `get_details`.
+            cookies (Cookies): Cookies of the room page.
+            date_ranges (Iterable): (check_in, check_out) pairs.
+            concurrency (int): Maximum number of quotes fetched at the same time.
+
+        Returns:
+            list: One row per date range, in input order, with the nightly,
+            discounted and original price, the currency symbol and the
+            amount of every line of the price breakdown; `available` is
+            False and the prices None when the stay cannot be booked. A
+            quote that fails does not stop the others: its row has no
+            prices and the exception in `error`, which is None otherwise.
+        """
+
+        def quote(date_range: tuple[str, str]) -> dict:
+            check_in, check_out = date_range
+            try:
+                price = self.get_price(
+                    product_id, impression_id, cookies, check_in, check_out
+                )
+            except Exception as error:
+                return self._price_row(check_in, check_out, {}, error)
+            return self._price_row(check_in, check_out, price)
+
+        try:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                return list(executor.map(quote, date_ranges))
+        finally:
+            self.close_finished_threads()
@@ -0,0 +1,467 @@
+import asyncio
+import time
+from collections.abc import Collection, Iterable
+from datetime import date
+from typing import Any
+from urllib.parse import urlencode
+
+from curl_cffi import requests
+from curl_cffi.requests import BrowserTypeLiteral, Cookies, Response
+from curl_cffi.requests.exceptions import RequestException
+
+from pyairbnb import jsonlib, parse
+from pyairbnb.api import (
+    CALENDAR_MONTHS,
+    REVIEWS_PAGE_SIZE,
+    BaseApi,
+    ReviewWatermark,
+)
+from pyairbnb.standardize import DetailView
+from pyairbnb.utils import make_html_headers, make_json_headers
+
+
+class AsyncApi(BaseApi):
+    """
+    Asyncio counterpart of `Api`, built on a curl_cffi AsyncSession.
+
+    Every `Api` method is available as a coroutine with the same arguments and
+    return value. `pool_size` also caps how many requests the session runs at
+    once. The API key comes from the same `key_store` as `Api`; when it is
+    missing `get_api_key()` fetches it through the store's locks, so
+    concurrent tasks, threads and processes share a single fetch.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.session = requests.AsyncSession(
+            max_clients=self.pool_size,
+            **self.session_kwargs,
+        )
+        self._api_key_lock = asyncio.Lock()
+
+    async def close(self) -> None:
+        await self.session.close()
+
+    async def __aenter__(self) -> "AsyncApi":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def json_headers(self) -> dict[str, str]:
+        return make_json_headers(await self.get_api_key())
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: dict | list | tuple | None = None,
+        json_data: dict[str, Any] | None = None,
+        **kwargs,
+    ) -> Response:
+        host, operation = self._request_target(url, params, json_data)
+        first_started = time.monotonic()
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                await asyncio.sleep(self.rate_limiter.reserve(host, operation))
+            self.retry_policy.sent()
+            proxy_url = self._pick_proxy(kwargs)
+            started = time.monotonic()
+            response: Response | None
+            try:
+                response = await self.session.request(
+                    method, url, params=params, json=json_data, **kwargs
+                )
+            except RequestException as error:
+                self._record_error(proxy_url, started)
+                if not self.retry_policy.should_retry(attempt, None):
+                    self._report(
+                        method,
+                        host,
+                        operation,
+                        proxy_url,
+                        first_started,
+                        attempt,
+                        error=error,
+                    )
+                    raise
+                response = None
+            else:
+                self._record_response(host, operation, proxy_url, started, response)
+                if not self.retry_policy.should_retry(attempt, response):
+                    self._report(
+                        method,
+                        host,
+                        operation,
+                        proxy_url,
+                        first_started,
+                        attempt,
+                        response,
+                    )
+                    return response
+            await asyncio.sleep(self.retry_policy.delay(attempt, response))
+            attempt += 1
+
+    async def get(
+        self,
+        url: str,
+        headers: dict[str, str],
+        params: dict | list | tuple | None = None,
+        cookies: Cookies | None = None,
+    ) -> Response:
+        return await self.request(
+            "GET",
+            url=url,
+            params=params,
+            headers=headers,
+            cookies=cookies,
+        )
+
+    async def get_json(
+        self,
+        url: str,
+        params: dict | list | tuple | None = None,
+        headers: dict[str, str] | None = None,
+        cookies: Cookies | None = None,
+    ):
+        cache_key, cached = self._cache_lookup(url, params)
+        if cached is not None:
+            return cached
+
+        use_api_key = headers is None
+        if headers is None:
+            headers = await self.json_headers()
+
+        response = await self.get(
+            url=url,
+            headers=headers,
+            params=params,
+            cookies=cookies,
+        )
+        if use_api_key and self._is_auth_error(response):
+            await asyncio.to_thread(
+                self.key_store.invalidate, headers["X-Airbnb-Api-Key"]
+            )
+            response = await self.get(
+                url=url,
+                headers=await self.json_headers(),
+                params=params,
+                cookies=cookies,
+            )
+        response.raise_for_status()
+        data = jsonlib.loads(response.content)
+        self._cache_store(cache_key, response)
+        return data
+
+    async def get_html(
+        self,
+        url: str,
+        use_api_key: bool,
+        header_connection_close: bool,
+        params: dict | list | tuple | None = None,
+    ) -> Response:
+        headers = make_html_headers(
+            api_key=await self.get_api_key() if use_api_key else None,
+            connection_close=header_connection_close,
+        )
+        return await self.get(
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+    async def post(
+        self,
+        url: str,
+        params: dict[str, Any],
+        json_data: dict[str, Any],
+        headers: dict[str, str],
+        impersonate: BrowserTypeLiteral | None = None,
+    ) -> Response:
+        url_parsed = f"{url}?{urlencode(params)}"
+        return await self.request(
+            "POST",
+            url=url_parsed,
+            json_data=json_data,
+            headers=headers,
+            impersonate=impersonate or self.impersonate,
+        )
+
+    async def get_api_key(self) -> str:
+        api_key = self.key_store.get()
+        if api_key is not None:
+            return api_key
+        loop = asyncio.get_running_loop()
+
+        def fetch() -> str:
+            future = asyncio.run_coroutine_threadsafe(self._fetch_api_key(), loop)
+            return future.result()
+
+        # the store's locks block, so wait for them in a thread; the fetch
+        # itself still runs on this loop and its session. `offer` and
+        # `invalidate` wait for the file lock a fetch holds, so they also
+        # run in a thread; only `get` is safe to call on the loop.
+        async with self._api_key_lock:
+            return await asyncio.to_thread(self.key_store.get_or_fetch, fetch)
+
+    async def _fetch_api_key(self) -> str:
+        response: Response = await self.get_html(
+            url=self.base_url,
+            use_api_key=False,
+            header_connection_close=False,
+        )
+        response.raise_for_status()
+        return self._parse_api_key(response.text)
+
+    async def get_details(
+        self,
+        room_url: str,
+        sections: Collection[str] | None = None,
+    ) -> tuple[dict[str, Any], dict[str, Any], Cookies]:
+        view, language, price_dependency_input, cookies = await self.get_details_view(
+            room_url
+        )
+        data_formatted = view.to_dict(sections)
+        data_formatted["language"] = language
+        return data_formatted, price_dependency_input, cookies
+
+    async def get_details_view(
+        self,
+        room_url: str,
+    ) -> tuple[DetailView, str, dict[str, Any], Cookies]:
+        """
+        Fetches a room page and returns it as a lazy `standardize.DetailView`,
+        along with its language, price request inputs and cookies.
+
+        Nothing is standardized until a field is read, so callers that only
+        need the cookies and IDs, or a few fields, skip the rest of the page.
+        """
+        response: Response = await self.get_html(
+            url=room_url,
+            use_api_key=False,
+            header_connection_close=False,
+        )
+        response.raise_for_status()
+
+        view, language, price_dependency_input = parse.parse_body_details_view(
+            response.content
+        )
+        # the page's first "key" may be anything; only share its api_config key
+        api_key = parse.extract_api_config_key(response.content)
+        if api_key is not None and self.key_store.get() is None:
+            await asyncio.to_thread(self.key_store.offer, api_key)
+        return view, language, price_dependency_input, response.cookies
+
+    async def get_calendar(
+        self,
+        room_id: str,
+        month: int | None = None,
+        year: int | None = None,
+        count: int = CALENDAR_MONTHS,
+    ):
+        data = await self.get_json(self._calendar_url(room_id, month, year, count))
+        return self._parse_calendar(data)
+
+    async def get_reviews(
+        self,
+        product_id: str,
+        review_count: int | None = None,
+        concurrency: int = 1,
+        since: str | date | ReviewWatermark | None = None,
+    ) -> list:
+        """
+        Async version of `Api.get_reviews`; pages are fetched as concurrent
+        tasks, at most `concurrency` at a time.
+        """
+        if since is not None or concurrency <= 1:
+            return await self._get_reviews_sequential(product_id, 0, since)
+
+        if review_count is not None:
+            review_count = int(review_count)
+        all_reviews: list = []
+        first_page: list = []
+        start = 0
+        if not review_count:
+            first_page, review_count = await self._get_reviews_page(0, product_id)
+            if review_count is None:
+                return first_page + await self._get_reviews_sequential(
+                    product_id, REVIEWS_PAGE_SIZE
+                )
+            all_reviews.extend(first_page)
+            start = REVIEWS_PAGE_SIZE
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def get_page(offset: int) -> list:
+            async with semaphore:
+                return await self._get_reviews_from_offset(offset, product_id)
+
+        offsets = self._review_offsets(start, review_count)
+        pages = await asyncio.gather(*(get_page(offset) for offset in offsets))
+        for reviews in pages:
+            all_reviews.extend(reviews)
+
+        if pages:
+            next_offset = self._next_review_offset(offsets[-1], pages[-1], review_count)
+        else:
+            next_offset = self._next_review_offset(0, first_page, review_count)
+        if next_offset is not None:
+            all_reviews.extend(
+                await self._get_reviews_sequential(product_id, next_offset)
+            )
+        return all_reviews
+
+    async def _get_reviews_sequential(
+        self,
+        product_id: str,
+        offset: int,
+        since: str | date | ReviewWatermark | None = None,
+    ) -> list:
+        all_reviews: list = []
+        while True:
+            reviews = await self._get_reviews_from_offset(offset, product_id)
+            offset = offset + REVIEWS_PAGE_SIZE
+            if len(reviews) == 0:
+                break
+            reviews, reached_watermark = self._reviews_until(reviews, since)
+            all_reviews.extend(reviews)
+            if reached_watermark:
+                break
+        return all_reviews
+
+    async def _get_reviews_page(
+        self,
+        offset: int,
+        product_id: str,
+    ) -> tuple[list, int | None]:
+        data = await self.get_json(self._reviews_url(offset, product_id))
+        return self._parse_reviews(data), self._parse_reviews_count(data)
+
+    async def _get_reviews_from_offset(
+        self,
+        offset: int,
+        product_id: str,
+    ) -> list:
+        reviews, _ = await self._get_reviews_page(offset, product_id)
+        return reviews
+
+    async def get_host_details(
+        self,
+        host_id: str,
+        cookies: Cookies,
+    ):
+        if self.host_cache is None:
+            return await self._fetch_host_details(host_id, cookies)
+        return await self.host_cache.async_get_or_fetch(
+            host_id, lambda: self._fetch_host_details(host_id, cookies)
+        )
+
+    async def _fetch_host_details(
+        self,
+        host_id: str,
+        cookies: Cookies,
+    ):
+        url, params = self._host_details_request(host_id)
+        data = await self.get_json(
+            url=url,
+            params=params,
+            cookies=cookies,
+        )
+
+        return data
+
+    async def get_search(
+        self,
+        check_in: str,
+        check_out: str,
+        ne_lat: float,
+        ne_long: float,
+        sw_lat: float,
+        sw_long: float,
+        zoom_value: int,
+        cursor: str = "",
+        include_map: bool = True,
+    ):
+        """
+        Fetches one page of search results.
+
+        Args:
+            include_map (bool): Ask for the map pins too; pyairbnb does not use them.
+
+        Returns:
+            dict: `data.presentation.staysSearch.results` of the response.
+        """
+        url, query_params, input_data = self._search_request(
+            check_in,
+            check_out,
+            ne_lat,
+            ne_long,
+            sw_lat,
+            sw_long,
+            zoom_value,
+            cursor,
+            include_map,
+        )
+        headers = make_html_headers(await self.get_api_key())
+
+        response = await self.post(
+            url,
+            params=query_params,
+            json_data=input_data,
+            headers=headers,
+        )
+        if self._is_auth_error(response):
+            await asyncio.to_thread(
+                self.key_store.invalidate, headers["X-Airbnb-Api-Key"]
+            )
+            response = await self.post(
+                url,
+                params=query_params,
+                json_data=input_data,
+                headers=make_html_headers(await self.get_api_key()),
+            )
+        response.raise_for_status()
+
+        data = jsonlib.loads(response.content)
+
+        return self._parse_search(data)
+
+    async def get_price(
+        self,
+        product_id: str,
+        impression_id: str,
+        cookies: Cookies,
+        check_in: str,
+        check_out: str,
+    ) -> dict:
+        url = self._price_url(product_id, impression_id, check_in, check_out)
+        data = await self.get_json(url, cookies=cookies)
+        return self._parse_price(data)
+
+    async def get_prices(
+        self,
+        product_id: str,
+        impression_id: str,
+        cookies: Cookies,
+        date_ranges: Iterable[tuple[str, str]],
+        concurrency: int = 4,
+    ) -> list[dict]:
+        """Async version of `Api.get_prices`."""
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def quote(check_in: str, check_out: str) -> dict:
+            async with semaphore:
+                try:
+                    price = await self.get_price(
+                        product_id, impression_id, cookies, check_in, check_out
+                    )
+                except Exception as error:
+                    return self._price_row(check_in, check_out, {}, error)
+            return self._price_row(check_in, check_out, price)
+
+        return list(
+            await asyncio.gather(
+                *(quote(check_in, check_out) for check_in, check_out in date_ranges)
+            )
+        )
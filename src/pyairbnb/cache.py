@@ -0,0 +1,222 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any
+from urllib.parse import parse_qsl, urlsplit
+
+DEFAULT_CACHE_TTL = 60 * 60
+DEFAULT_OPERATION_TTLS = {
+    "PdpAvailabilityCalendar": 60 * 60,
+    "StaysPdpReviewsQuery": 24 * 60 * 60,
+    "GetUserProfile": 24 * 60 * 60,
+    "StaysPdpSections": 15 * 60,
+}
+DEFAULT_CACHE_MAX_BYTES = 512 * 1024 * 1024
+# eviction frees entries down to this share of max_bytes, so that it does not
+# have to run again on the very next write
+EVICT_TARGET_RATIO = 0.9
+# writes after which expired entries are purged and the stored size recounted,
+# which also picks up what other processes sharing the database wrote
+EVICT_INTERVAL = 1000
+
+# variables that change on every page load without changing the response
+VOLATILE_VARIABLES = frozenset({"p3ImpressionId"})
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    operation TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+CREATE INDEX IF NOT EXISTS responses_expires_at ON responses (expires_at);
+"""
+
+
+def _drop_volatile(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {
+            k: _drop_volatile(v)
+            for k, v in value.items()
+            if k not in VOLATILE_VARIABLES
+        }
+    if isinstance(value, list):
+        return [_drop_volatile(v) for v in value]
+    return value
+
+
+def make_cache_key(
+    url: str,
+    params: dict | list | tuple | None = None,
+) -> tuple[str, str] | None:
+    """
+    Derives a cache key from a GraphQL GET request.
+
+    The key covers the host, the operation name, its variables and the
+    currency, so the same request always maps to the same entry regardless of
+    parameter order or per-page-load identifiers, and the same request sent
+    to another domain or a replay server does not. Returns None for
+    non-GraphQL requests.
+
+    Returns:
+        tuple: The key and the operation name.
+    """
+    parts = urlsplit(url)
+    query = dict(parse_qsl(parts.query))
+    if params:
+        query.update(params)
+    operation = query.get("operationName")
+    if not operation:
+        return None
+    try:
+        variables = _drop_volatile(json.loads(query.get("variables", "null")))
+    except ValueError:
+        variables = query.get("variables")
+    canonical = json.dumps(
+        [
+            parts.netloc.lower(),
+            operation,
+            variables,
+            query.get("currency"),
+            query.get("locale"),
+        ],
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest(), operation
+
+
+class ResponseCache:
+    """
+    SQLite-backed cache of raw GraphQL response bodies.
+
+    Entries expire after the TTL of their operation and the least recently
+    used ones are evicted once the stored bodies exceed `max_bytes`. The size
+    of the stored bodies is kept as a running total, so writes stay cheap
+    until eviction is due; it is recounted every `EVICT_INTERVAL` writes.
+    The database can be shared by several threads and processes.
+
+    Args:
+        path (str): SQLite database file; ':memory:' keeps the cache in-process.
+        ttls (dict): Seconds to keep each operation's responses, by operation name.
+        default_ttl (float): Seconds to keep responses of operations not in `ttls`.
+        max_bytes (int): Total body size above which old entries are evicted.
+        bypass (bool): Skip lookups and always hit the network; responses are still stored.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike = ":memory:",
+        ttls: dict[str, float] | None = None,
+        default_ttl: float = DEFAULT_CACHE_TTL,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+        bypass: bool = False,
+    ):
+        self.ttls = DEFAULT_OPERATION_TTLS | (ttls or {})
+        self.default_ttl = default_ttl
+        self.max_bytes = max_bytes
+        self.bypass = bypass
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path,
+            timeout=30,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        if path != ":memory:":
+            self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(SCHEMA)
+        self._writes = 0
+        self._bytes = self._stored_bytes()
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def get(self, key: str) -> bytes | None:
+        if self.bypass:
+            return None
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT body FROM responses WHERE key = ? AND expires_at > ?",
+                (key, now),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._connection.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self.hits += 1
+            return row[0]
+
+    def set(self, key: str, operation: str, body: bytes) -> None:
+        now = time.time()
+        ttl = self.ttls.get(operation, self.default_ttl)
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (key, operation, body, len(body), now + ttl, now),
+            )
+            self._bytes += len(body) - (0 if row is None else row[0])
+            self._writes += 1
+            if self._bytes > self.max_bytes or self._writes >= EVICT_INTERVAL:
+                self._evict(now)
+
+    def _stored_bytes(self) -> int:
+        (total,) = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        return total
+
+    def _evict(self, now: float) -> None:
+        self._writes = 0
+        self._connection.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+        total = self._stored_bytes()
+        self._bytes = total
+        if total <= self.max_bytes:
+            return
+        to_free = total - int(self.max_bytes * EVICT_TARGET_RATIO)
+        freed = 0
+        keys = []
+        for key, size in self._connection.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        ):
+            keys.append((key,))
+            freed += size
+            if freed >= to_free:
+                break
+        self._connection.executemany("DELETE FROM responses WHERE key = ?", keys)
+        self.evictions += len(keys)
+        self._bytes = total - freed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+            self._bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            entries, size = self._connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": entries,
+            "bytes": size,
+        }
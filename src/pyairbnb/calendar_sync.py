@@ -0,0 +1,252 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Any, NamedTuple
+
+from pyairbnb import jsonlib
+from pyairbnb.api import CALENDAR_MONTHS, Api
+
+# months from the current one that are refetched on every sync
+DEFAULT_NEAR_MONTHS = 2
+# seconds after which a month further out is refetched; longer than a daily poll
+# so that such a poll only fetches the near months
+DEFAULT_FAR_MAX_AGE = 7 * 24 * 60 * 60
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS calendar_months (
+    listing_id TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    month INTEGER NOT NULL,
+    hash TEXT NOT NULL,
+    days BLOB NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (listing_id, year, month)
+);
+"""
+
+
+def _add_months(year: int, month: int, n: int) -> tuple[int, int]:
+    index = year * 12 + month - 1 + n
+    return index // 12, index % 12 + 1
+
+
+def _hash_days(days: list) -> str:
+    canonical = json.dumps(days, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def _runs(indexes: list[int]) -> list[tuple[int, int]]:
+    """Groups sorted indexes into (first, count) runs of consecutive values."""
+    runs: list[tuple[int, int]] = []
+    for index in indexes:
+        if runs and runs[-1][0] + runs[-1][1] == index:
+            runs[-1] = (runs[-1][0], runs[-1][1] + 1)
+        else:
+            runs.append((index, 1))
+    return runs
+
+
+def diff_days(old_days: list, new_days: list) -> list[dict[str, Any]]:
+    """
+    Compares two lists of calendar days by `calendarDate`.
+
+    Returns:
+        list: One {"date", "old", "new"} dict per added, removed or changed day;
+        "old" or "new" is None for added and removed days.
+    """
+    old_by_date = {day.get("calendarDate"): day for day in old_days}
+    changes = []
+    for day in new_days:
+        date = day.get("calendarDate")
+        old_day = old_by_date.pop(date, None)
+        if old_day != day:
+            changes.append({"date": date, "old": old_day, "new": day})
+    for date, old_day in old_by_date.items():
+        changes.append({"date": date, "old": old_day, "new": None})
+    return changes
+
+
+class CalendarSyncResult(NamedTuple):
+    """What one `CalendarSync.sync` call fetched and what changed."""
+
+    changes: list[dict[str, Any]]
+    months_fetched: int
+    months_changed: int
+    requests: int
+
+
+class CalendarSync:
+    """
+    Keeps calendar snapshots per listing and refetches only what is due.
+
+    Every month of a listing's calendar is stored with a content hash and the
+    time it was fetched. A sync refetches the `near_months` closest months,
+    months never fetched, and months older than `far_max_age`, grouping them
+    into as few requests as there are consecutive runs. A fetched month whose
+    hash matches the snapshot only has its timestamp refreshed; the others
+    are diffed day by day and stored. Months that have passed are dropped.
+
+    Args:
+        api (Api): Client used to fetch calendars.
+        path (str): SQLite database file; ':memory:' keeps snapshots in-process.
+        months (int): Number of months from the current one to keep in sync.
+        near_months (int): Leading months refetched on every sync.
+        far_max_age (float): Seconds after which later months are refetched.
+    """
+
+    def __init__(
+        self,
+        api: Api,
+        path: str | os.PathLike = ":memory:",
+        months: int = CALENDAR_MONTHS,
+        near_months: int = DEFAULT_NEAR_MONTHS,
+        far_max_age: float = DEFAULT_FAR_MAX_AGE,
+    ):
+        self.api = api
+        self.months = months
+        self.near_months = near_months
+        self.far_max_age = far_max_age
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path,
+            timeout=30,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        if path != ":memory:":
+            self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def _window(self) -> list[tuple[int, int]]:
+        today = datetime.now()
+        return [_add_months(today.year, today.month, i) for i in range(self.months)]
+
+    def _snapshot(self, listing_id: str) -> dict[tuple[int, int], tuple[str, float]]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT year, month, hash, fetched_at FROM calendar_months"
+                " WHERE listing_id = ?",
+                (listing_id,),
+            ).fetchall()
+        return {
+            (year, month): (hash_, fetched_at)
+            for year, month, hash_, fetched_at in rows
+        }
+
+    def _due_months(
+        self,
+        window: list[tuple[int, int]],
+        snapshot: dict[tuple[int, int], tuple[str, float]],
+        now: float,
+        full: bool,
+    ) -> list[int]:
+        due = []
+        for index, year_month in enumerate(window):
+            stored = snapshot.get(year_month)
+            if (
+                full
+                or index < self.near_months
+                or stored is None
+                or now - stored[1] >= self.far_max_age
+            ):
+                due.append(index)
+        return due
+
+    def sync(self, room_id: str, full: bool = False) -> CalendarSyncResult:
+        """
+        Brings the stored calendar of a listing up to date.
+
+        Args:
+            room_id (str): The listing to sync.
+            full (bool): Refetch every month regardless of age.
+
+        Returns:
+            CalendarSyncResult: The changed days and how much was fetched.
+        """
+        listing_id = str(room_id)
+        now = time.time()
+        window = self._window()
+        snapshot = self._snapshot(listing_id)
+        runs = _runs(self._due_months(window, snapshot, now, full))
+
+        changes: list[dict[str, Any]] = []
+        months_fetched = 0
+        months_changed = 0
+        for first, count in runs:
+            year, month = window[first]
+            for calendar_month in self.api.get_calendar(room_id, month, year, count):
+                year_month = (calendar_month["year"], calendar_month["month"])
+                days = calendar_month.get("days", [])
+                months_fetched += 1
+                hash_ = _hash_days(days)
+                stored = snapshot.get(year_month)
+                if stored is not None and stored[0] == hash_:
+                    self._touch(listing_id, year_month, now)
+                    continue
+                months_changed += 1
+                changes.extend(diff_days(self._days(listing_id, year_month), days))
+                self._store(listing_id, year_month, hash_, days, now)
+
+        self._drop_before(listing_id, window[0])
+        return CalendarSyncResult(changes, months_fetched, months_changed, len(runs))
+
+    def calendar(self, room_id: str) -> list[dict[str, Any]]:
+        """Returns the stored calendar in the shape of `Api.get_calendar`."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT year, month, days FROM calendar_months"
+                " WHERE listing_id = ? ORDER BY year, month",
+                (str(room_id),),
+            ).fetchall()
+        return [
+            {"month": month, "year": year, "days": jsonlib.loads(days)}
+            for year, month, days in rows
+        ]
+
+    def _days(self, listing_id: str, year_month: tuple[int, int]) -> list:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT days FROM calendar_months"
+                " WHERE listing_id = ? AND year = ? AND month = ?",
+                (listing_id, *year_month),
+            ).fetchone()
+        return [] if row is None else jsonlib.loads(row[0])
+
+    def _store(
+        self,
+        listing_id: str,
+        year_month: tuple[int, int],
+        hash_: str,
+        days: list,
+        now: float,
+    ) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO calendar_months VALUES (?, ?, ?, ?, ?, ?)",
+                (listing_id, *year_month, hash_, jsonlib.dumps(days), now),
+            )
+
+    def _touch(self, listing_id: str, year_month: tuple[int, int], now: float) -> None:
+        with self._lock:
+            self._connection.execute(
+                "UPDATE calendar_months SET fetched_at = ?"
+                " WHERE listing_id = ? AND year = ? AND month = ?",
+                (now, listing_id, *year_month),
+            )
+
+    def _drop_before(self, listing_id: str, year_month: tuple[int, int]) -> None:
+        year, month = year_month
+        with self._lock:
+            self._connection.execute(
+                "DELETE FROM calendar_months"
+                " WHERE listing_id = ? AND (year < ? OR (year = ? AND month < ?))",
+                (listing_id, year, year, month),
+            )
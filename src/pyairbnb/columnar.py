@@ -0,0 +1,213 @@
+import math
+import os
+import shutil
+from collections.abc import Iterable
+from typing import Any
+
+from pyairbnb.records import SearchListing
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+DEFAULT_BATCH_SIZE = 10_000
+# initial width of the string columns of .npy files; a batch holding a longer
+# value widens the column, rewriting the rows already written
+NPY_STRING_LENGTH = 32
+
+# column name, numpy dtype and pyarrow type name of every exported column
+COLUMNS = (
+    ("room_id", "i8", "int64"),
+    ("latitude", "f8", "float64"),
+    ("longitude", "f8", "float64"),
+    ("price_unit", "f8", "float64"),
+    ("price_total", "f8", "float64"),
+    ("currency_symbol", f"U{NPY_STRING_LENGTH}", "string"),
+    ("cleaning_fee", "f8", "float64"),
+    ("airbnb_fee", "f8", "float64"),
+    ("rating", "f8", "float64"),
+    ("review_count", "i8", "int64"),
+    ("category", f"U{NPY_STRING_LENGTH}", "string"),
+)
+COLUMN_NAMES = tuple(name for name, _, _ in COLUMNS)
+
+
+def _row(listing: SearchListing | dict) -> tuple:
+    if isinstance(listing, dict):
+        listing = SearchListing.from_dict(listing)
+    price = listing.price
+    return (
+        listing.room_id,
+        listing.coordinates.latitude,
+        listing.coordinates.longitude,
+        price.amount,
+        price.total.amount,
+        price.total.currency_symbol,
+        listing.cleaning_fee.amount if listing.cleaning_fee else None,
+        listing.airbnb_fee.amount if listing.airbnb_fee else None,
+        listing.rating,
+        int(listing.review_count),
+        listing.category,
+    )
+
+
+class ColumnarWriter:
+    """
+    Streams search listings to a columnar file in fixed-size batches.
+
+    Listings (`records.SearchListing` objects or the dicts of
+    `standardize.from_search`) are buffered column by column and written
+    every `batch_size` rows, so a crawl of any size can be exported with
+    only one batch in memory. Missing prices and fees are written as nulls
+    in Parquet and NaN in .npy files.
+
+    Parquet needs pyarrow. Without it a NumPy structured array is written
+    in the .npy format: batches are appended to a `.part` file next to
+    `path`, which becomes the final file on `close()`. String columns start
+    `NPY_STRING_LENGTH` characters wide and are widened, to the next power
+    of two, as soon as a batch holds a longer value.
+
+    Args:
+        path (str): Output file.
+        format (str): 'parquet' or 'npy'; defaults to Parquet if pyarrow is installed.
+        batch_size (int): Rows per written batch (a Parquet row group).
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        format: str | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        if format is None:
+            format = "npy" if pa is None else "parquet"
+        if format == "parquet" and pa is None:
+            raise ImportError("Writing Parquet requires pyarrow.")
+        if format == "npy" and np is None:
+            raise ImportError("Writing .npy files requires numpy.")
+        if format not in ("parquet", "npy"):
+            raise ValueError(f"Unknown columnar format: {format!r}")
+        self.path = os.fspath(path)
+        self.format = format
+        self.batch_size = batch_size
+        self.rows_written = 0
+        self._columns: list[list[Any]] = [[] for _ in COLUMNS]
+        self._parquet_writer = None
+        self._part_file = None
+        if format == "parquet":
+            schema = pa.schema(
+                [(name, pa.type_for_alias(type_)) for name, _, type_ in COLUMNS]
+            )
+            self._parquet_writer = pq.ParquetWriter(self.path, schema)
+        else:
+            self._dtype = np.dtype([(name, dtype) for name, dtype, _ in COLUMNS])
+            self._part_file = open(f"{self.path}.part", "wb")
+
+    def __enter__(self) -> "ColumnarWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def write(self, listings: Iterable[SearchListing | dict]) -> None:
+        columns = self._columns
+        for listing in listings:
+            for column, value in zip(columns, _row(listing)):
+                column.append(value)
+            if len(columns[0]) >= self.batch_size:
+                self.flush()
+
+    def flush(self) -> None:
+        count = len(self._columns[0])
+        if not count:
+            return
+        if self._parquet_writer is not None:
+            self._parquet_writer.write_batch(
+                pa.record_batch(self._columns, schema=self._parquet_writer.schema)
+            )
+        else:
+            self._fit_strings()
+            batch = np.empty(count, dtype=self._dtype)
+            for name, column in zip(COLUMN_NAMES, self._columns):
+                batch[name] = [math.nan if value is None else value for value in column]
+            batch.tofile(self._part_file)
+        self.rows_written += count
+        for column in self._columns:
+            column.clear()
+
+    def _fit_strings(self) -> None:
+        """Widens the string columns of the .npy dtype to fit the buffered batch."""
+        fields = []
+        widened = False
+        for (name, _, type_), column in zip(COLUMNS, self._columns):
+            dtype = self._dtype[name]
+            if type_ == "string":
+                length = max(
+                    (len(value) for value in column if isinstance(value, str)),
+                    default=0,
+                )
+                if length > dtype.itemsize // 4:
+                    dtype = np.dtype(f"U{1 << (length - 1).bit_length()}")
+                    widened = True
+            fields.append((name, dtype))
+        if not widened:
+            return
+        dtype = np.dtype(fields)
+        if self.rows_written:
+            part_path = self._part_file.name
+            self._part_file.close()
+            rows = np.fromfile(part_path, dtype=self._dtype).astype(dtype)
+            self._part_file = open(part_path, "wb")
+            rows.tofile(self._part_file)
+        self._dtype = dtype
+
+    def close(self) -> None:
+        if self._parquet_writer is None and self._part_file is None:
+            return
+        self.flush()
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+            self._parquet_writer = None
+            return
+        part_path = self._part_file.name
+        self._part_file.close()
+        self._part_file = None
+        header = {
+            "descr": np.lib.format.dtype_to_descr(self._dtype),
+            "fortran_order": False,
+            "shape": (self.rows_written,),
+        }
+        with open(self.path, "wb") as f, open(part_path, "rb") as part:
+            np.lib.format.write_array_header_1_0(f, header)
+            shutil.copyfileobj(part, f)
+        os.remove(part_path)
+
+
+def write_columns(
+    listings: Iterable[SearchListing | dict],
+    path: str | os.PathLike,
+    format: str | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """
+    Writes search listings to a columnar file, e.g. straight from `start.iter_search`.
+
+    Args:
+        listings (Iterable): Search listings, as records or dicts.
+        path (str): Output file.
+        format (str): 'parquet' or 'npy'; defaults to Parquet if pyarrow is installed.
+        batch_size (int): Rows per written batch.
+
+    Returns:
+        int: The number of rows written.
+    """
+    with ColumnarWriter(path, format, batch_size) as writer:
+        writer.write(listings)
+    return writer.rows_written
@@ -0,0 +1,206 @@
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future
+from typing import Any
+
+from pyairbnb import jsonlib
+
+DEFAULT_HOST_TTL = 24 * 60 * 60
+DEFAULT_MAX_HOSTS = 10_000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS hosts (
+    host_id TEXT PRIMARY KEY,
+    body BLOB NOT NULL,
+    fetched_at REAL NOT NULL
+);
+"""
+
+
+class HostCache:
+    """
+    Host profiles by host ID, shared by every listing of the same host.
+
+    Profiles are kept in an in-memory LRU of `max_entries` hosts and, if
+    `path` is given, in SQLite so later runs can reuse them. Entries older
+    than `ttl` seconds are refetched. Concurrent lookups of a host that is
+    being fetched wait for that fetch instead of starting their own; if the
+    task leading an async fetch is cancelled, a waiting task takes it over.
+
+    The same dict is handed to every listing of a host, so treat it as
+    read-only.
+
+    Args:
+        max_entries (int): Hosts kept in memory.
+        ttl (float): Seconds a profile stays valid.
+        path (str): Optional SQLite database file to persist profiles in.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_HOSTS,
+        ttl: float = DEFAULT_HOST_TTL,
+        path: str | os.PathLike | None = None,
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.shared = 0
+        self._entries: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+        self._inflight: dict[str, Future] = {}
+        self._async_inflight: dict[str, asyncio.Future] = {}
+        self._lock = threading.Lock()
+        self._connection = None
+        if path is not None:
+            self._connection = sqlite3.connect(
+                path,
+                timeout=30,
+                check_same_thread=False,
+                isolation_level=None,
+            )
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.executescript(SCHEMA)
+
+    @property
+    def saved_calls(self) -> int:
+        """Host requests avoided so far, from cache hits and shared fetches."""
+        return self.hits + self.shared
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _lookup(self, host_id: str) -> Any | None:
+        # callers hold self._lock
+        now = time.time()
+        entry = self._entries.get(host_id)
+        if entry is None and self._connection is not None:
+            row = self._connection.execute(
+                "SELECT body, fetched_at FROM hosts WHERE host_id = ?", (host_id,)
+            ).fetchone()
+            if row is not None:
+                entry = (jsonlib.loads(row[0]), row[1])
+                self._remember(host_id, entry)
+        if entry is None or now - entry[1] >= self.ttl:
+            return None
+        self._entries.move_to_end(host_id)
+        return entry[0]
+
+    def _remember(self, host_id: str, entry: tuple[Any, float]) -> None:
+        self._entries[host_id] = entry
+        self._entries.move_to_end(host_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get(self, host_id: str) -> Any | None:
+        with self._lock:
+            return self._lookup(host_id)
+
+    def set(self, host_id: str, data: Any) -> None:
+        now = time.time()
+        with self._lock:
+            self._remember(host_id, (data, now))
+            if self._connection is not None:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO hosts VALUES (?, ?, ?)",
+                    (host_id, jsonlib.dumps(data), now),
+                )
+
+    def get_or_fetch(self, host_id: str, fetch: Callable[[], Any]) -> Any:
+        """Returns the cached profile or fetches it once for all concurrent callers."""
+        with self._lock:
+            data = self._lookup(host_id)
+            if data is not None:
+                self.hits += 1
+                return data
+            future = self._inflight.get(host_id)
+            leader = future is None
+            if leader:
+                future = self._inflight[host_id] = Future()
+                self.misses += 1
+            else:
+                self.shared += 1
+        if not leader:
+            return future.result()
+
+        try:
+            data = fetch()
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        else:
+            self.set(host_id, data)
+            future.set_result(data)
+            return data
+        finally:
+            with self._lock:
+                del self._inflight[host_id]
+
+    async def async_get_or_fetch(
+        self,
+        host_id: str,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Async `get_or_fetch`; shares a fetch between the tasks of one loop."""
+        with self._lock:
+            data = self._lookup(host_id)
+            if data is not None:
+                self.hits += 1
+                return data
+            future = self._async_inflight.get(host_id)
+            leader = future is None
+            if leader:
+                future = asyncio.get_running_loop().create_future()
+                self._async_inflight[host_id] = future
+                self.misses += 1
+            else:
+                self.shared += 1
+        if not leader:
+            # unlike awaiting the future, wait() does not cancel it when this
+            # task is cancelled, and returns when the leader's fetch is, so
+            # both cases are told apart without Task.cancelling() (3.11+)
+            await asyncio.wait((future,))
+            if not future.cancelled():
+                return future.result()
+            # the leading task was cancelled, not this one: try again, the first
+            # waiter to get here leading the new fetch
+            with self._lock:
+                self.shared -= 1
+            return await self.async_get_or_fetch(host_id, fetch)
+
+        try:
+            data = await fetch()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as error:
+            future.set_exception(error)
+            # nobody may be waiting; mark the exception as retrieved
+            future.exception()
+            raise
+        else:
+            self.set(host_id, data)
+            future.set_result(data)
+            return data
+        finally:
+            with self._lock:
+                del self._async_inflight[host_id]
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            entries = len(self._entries)
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "shared": self.shared,
+            "saved_calls": self.saved_calls,
+            "entries": entries,
+        }
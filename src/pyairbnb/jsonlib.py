@@ -0,0 +1,85 @@
+import json
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+JSONInput = bytes | bytearray | memoryview | str
+
+
+class Backend(NamedTuple):
+    """A JSON implementation: decode from bytes or str, encode to bytes."""
+
+    name: str
+    loads: Callable[[JSONInput], Any]
+    dumps: Callable[[Any], bytes]
+
+
+def _stdlib_loads(data: JSONInput) -> Any:
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def _stdlib_dumps(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+BACKENDS: dict[str, Backend] = {"json": Backend("json", _stdlib_loads, _stdlib_dumps)}
+
+if msgspec is not None:
+    _msgspec_decoder = msgspec.json.Decoder()
+
+    def _msgspec_loads(data: JSONInput) -> Any:
+        try:
+            return _msgspec_decoder.decode(data)
+        except msgspec.DecodeError as error:
+            raise ValueError(str(error)) from error
+
+    BACKENDS["msgspec"] = Backend("msgspec", _msgspec_loads, msgspec.json.encode)
+
+if orjson is not None:
+    BACKENDS["orjson"] = Backend("orjson", orjson.loads, orjson.dumps)
+
+# fastest first; the first one installed is used unless set_backend says otherwise
+PREFERRED_BACKENDS = ("orjson", "msgspec", "json")
+
+backend = next(BACKENDS[name] for name in PREFERRED_BACKENDS if name in BACKENDS)
+
+
+def set_backend(name: str) -> None:
+    """
+    Selects the JSON implementation used for responses, pages and caches.
+
+    Args:
+        name (str): One of "orjson", "msgspec" or "json" (the standard library).
+    """
+    global backend
+    if name not in PREFERRED_BACKENDS:
+        raise ValueError(f"Unknown JSON backend: {name!r}")
+    if name not in BACKENDS:
+        raise ImportError(f"The {name} JSON backend requires {name}.")
+    backend = BACKENDS[name]
+
+
+def loads(data: JSONInput) -> Any:
+    """
+    Decodes JSON from bytes, a memoryview slice or str.
+
+    Raises:
+        ValueError: If `data` is not valid JSON, whatever the backend.
+    """
+    return backend.loads(data)
+
+
+def dumps(value: Any) -> bytes:
+    """Encodes `value` as compact UTF-8 JSON."""
+    return backend.dumps(value)
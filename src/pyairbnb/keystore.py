@@ -0,0 +1,137 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows
+    fcntl = None  # type: ignore[assignment]
+
+DEFAULT_API_KEY_TTL = 24 * 60 * 60
+
+
+class ApiKeyStore:
+    """
+    Thread and process safe cache for the Airbnb API key.
+
+    The key is kept in memory and, if `path` is given, in a small JSON file so
+    other processes can reuse it. Entries older than `ttl` seconds are ignored.
+    The file is replaced atomically and, where `fcntl` is available, fetches
+    are serialized through a lock file so concurrent processes only hit the
+    homepage once.
+
+    Args:
+        path (str): Optional file to persist the key in.
+        ttl (float): Seconds after which a stored key is considered stale.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike | None = None,
+        ttl: float = DEFAULT_API_KEY_TTL,
+    ):
+        self.path = Path(path) if path is not None else None
+        self.ttl = ttl
+        self._lock = threading.RLock()
+        # held for the whole of a fetch; `get` never waits for it
+        self._fetch_lock = threading.Lock()
+        self._key: str | None = None
+        self._fetched_at = 0.0
+
+    def _is_fresh(self, fetched_at: float) -> bool:
+        return time.time() - fetched_at < self.ttl
+
+    def _read_file(self) -> tuple[str, float] | None:
+        if self.path is None:
+            return None
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                stored = json.load(f)
+            return stored["key"], float(stored["fetched_at"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _write_file(self, key: str, fetched_at: float) -> None:
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"key": key, "fetched_at": fetched_at}, f)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        if self.path is None or fcntl is None:
+            yield
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(f"{self.path}.lock", "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def get(self) -> str | None:
+        """Returns the stored key, or None if there is no fresh one."""
+        with self._lock:
+            if self._key is not None and self._is_fresh(self._fetched_at):
+                return self._key
+            stored = self._read_file()
+            if stored is not None and self._is_fresh(stored[1]):
+                self._key, self._fetched_at = stored
+                return self._key
+            return None
+
+    def _store(self, key: str) -> None:
+        self._key = key
+        self._fetched_at = time.time()
+        self._write_file(key, self._fetched_at)
+
+    def set(self, key: str) -> None:
+        with self._file_lock(), self._lock:
+            self._store(key)
+
+    def offer(self, key: str) -> None:
+        """Stores `key` unless a fresh key is already known."""
+        if self.get() is not None:
+            return
+        with self._file_lock(), self._lock:
+            if self.get() is None:
+                self._store(key)
+
+    def get_or_fetch(self, fetch: Callable[[], str]) -> str:
+        """Returns the stored key, calling `fetch` at most once across waiters if missing."""
+        key = self.get()
+        if key is not None:
+            return key
+        with self._fetch_lock, self._file_lock():
+            # another thread or process may have stored it while we waited
+            key = self.get()
+            if key is None:
+                key = fetch()
+                with self._lock:
+                    self._store(key)
+            return key
+
+    def invalidate(self, key: str) -> None:
+        """Forgets `key` after it was rejected; a newer key is left untouched."""
+        with self._file_lock(), self._lock:
+            if self._key == key:
+                self._key = None
+            stored = self._read_file()
+            if stored is not None and stored[0] == key and self.path is not None:
+                self.path.unlink(missing_ok=True)
+
+
+default_key_store = ApiKeyStore()
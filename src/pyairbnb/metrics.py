@@ -0,0 +1,287 @@
+import bisect
+import threading
+from collections.abc import Iterable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import NamedTuple
+from urllib.parse import urlsplit
+
+# seconds; upper bounds of the request latency histogram buckets
+DEFAULT_LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# bytes; upper bounds of the response size histogram buckets
+DEFAULT_SIZE_BUCKETS = (1 << 10, 10 << 10, 100 << 10, 1 << 20, 5 << 20, 20 << 20)
+# label used for requests that are not GraphQL operations, e.g. room pages
+PAGE_OPERATION = "page"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class RequestEvent(NamedTuple):
+    """
+    One request made by `Api` or `AsyncApi`, reported once its retries are over.
+
+    `status` is None when the last attempt failed without a response, in
+    which case `error` holds the exception class name. `latency` covers every
+    attempt and the backoff between them; `retries` counts attempts after
+    the first.
+    """
+
+    operation: str | None
+    host: str
+    method: str
+    status: int | None
+    latency: float
+    size: int
+    retries: int
+    proxy: str | None
+    error: str | None = None
+
+
+def proxy_label(proxy_url: str | None) -> str:
+    """Host and port of a proxy, without the credentials its URL may carry."""
+    if proxy_url is None:
+        return "direct"
+    parts = urlsplit(proxy_url)
+    if parts.hostname is None:
+        return "unknown"
+    return f"{parts.hostname}:{parts.port}" if parts.port else parts.hostname
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the shape Prometheus expects."""
+
+    def __init__(self, buckets: Iterable[float]):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        """Returns (upper bound, count of values up to it) pairs ending at +Inf."""
+        bounds = [format_value(bucket) for bucket in self.buckets] + ["+Inf"]
+        total = 0
+        cumulative = []
+        for bound, count in zip(bounds, self.counts):
+            total += count
+            cumulative.append((bound, total))
+        return cumulative
+
+    def quantile(self, q: float) -> float | None:
+        """Estimates a quantile as the upper bound of the bucket it falls in."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        total = 0
+        for bucket, count in zip(self.buckets, self.counts):
+            total += count
+            if total >= rank:
+                return bucket
+        return float("inf")
+
+
+class MetricsAggregator:
+    """
+    In-process counters and histograms fed by request events.
+
+    Pass an instance as `on_request` to a client; several clients can share
+    one. Requests are counted per operation and status, per proxy, and with
+    their retries and bytes received; latency and response size go into
+    per-operation histograms. `snapshot()` summarises them for logging and
+    `to_prometheus()` renders them in the Prometheus text format.
+
+    Args:
+        latency_buckets (tuple): Upper bounds of the latency buckets, in seconds.
+        size_buckets (tuple): Upper bounds of the response size buckets, in bytes.
+        namespace (str): Prefix of the exported metric names.
+    """
+
+    def __init__(
+        self,
+        latency_buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS,
+        size_buckets: Iterable[float] = DEFAULT_SIZE_BUCKETS,
+        namespace: str = "pyairbnb",
+    ):
+        self.latency_buckets = tuple(latency_buckets)
+        self.size_buckets = tuple(size_buckets)
+        self.namespace = namespace
+        self.requests: dict[tuple[str, str], int] = {}
+        self.retries: dict[str, int] = {}
+        self.bytes: dict[str, int] = {}
+        self.proxy_requests: dict[tuple[str, bool], int] = {}
+        self.latency: dict[str, Histogram] = {}
+        self.size: dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event: RequestEvent) -> None:
+        self.record(event)
+
+    def record(self, event: RequestEvent) -> None:
+        operation = event.operation or PAGE_OPERATION
+        status = str(event.status) if event.status is not None else "error"
+        ok = event.status is not None and event.status < 400
+        proxy_key = (proxy_label(event.proxy), ok)
+        with self._lock:
+            self.requests[operation, status] = (
+                self.requests.get((operation, status), 0) + 1
+            )
+            self.retries[operation] = self.retries.get(operation, 0) + event.retries
+            self.bytes[operation] = self.bytes.get(operation, 0) + event.size
+            self.proxy_requests[proxy_key] = self.proxy_requests.get(proxy_key, 0) + 1
+            if operation not in self.latency:
+                self.latency[operation] = Histogram(self.latency_buckets)
+                self.size[operation] = Histogram(self.size_buckets)
+            self.latency[operation].observe(event.latency)
+            self.size[operation].observe(event.size)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.requests.clear()
+            self.retries.clear()
+            self.bytes.clear()
+            self.proxy_requests.clear()
+            self.latency.clear()
+            self.size.clear()
+
+    def snapshot(self) -> dict[str, dict]:
+        """
+        Summarises the requests seen so far per operation.
+
+        Returns:
+            dict: Per operation, its request count, error count (no response or
+            a status of 400 and above), retries, bytes, mean latency and the
+            latency bucket holding its p50 and p99.
+        """
+        with self._lock:
+            summary = {}
+            for operation, histogram in self.latency.items():
+                statuses = {
+                    status: count
+                    for (name, status), count in self.requests.items()
+                    if name == operation
+                }
+                errors = sum(
+                    count
+                    for status, count in statuses.items()
+                    if status == "error" or int(status) >= 400
+                )
+                summary[operation] = {
+                    "requests": histogram.count,
+                    "errors": errors,
+                    "statuses": statuses,
+                    "retries": self.retries[operation],
+                    "bytes": self.bytes[operation],
+                    "latency_mean": histogram.sum / histogram.count,
+                    "latency_p50": histogram.quantile(0.5),
+                    "latency_p99": histogram.quantile(0.99),
+                }
+            return summary
+
+    def to_prometheus(self) -> str:
+        """Renders every metric in the Prometheus text exposition format."""
+        prefix = self.namespace
+        lines: list[str] = []
+        with self._lock:
+            lines += [
+                f"# HELP {prefix}_requests_total Requests by operation and final status.",
+                f"# TYPE {prefix}_requests_total counter",
+            ]
+            for (operation, status), count in sorted(self.requests.items()):
+                labels = format_labels(operation=operation, status=status)
+                lines.append(f"{prefix}_requests_total{labels} {count}")
+
+            lines += [
+                f"# HELP {prefix}_retries_total Attempts beyond the first.",
+                f"# TYPE {prefix}_retries_total counter",
+            ]
+            for operation, count in sorted(self.retries.items()):
+                labels = format_labels(operation=operation)
+                lines.append(f"{prefix}_retries_total{labels} {count}")
+
+            lines += [
+                f"# HELP {prefix}_response_bytes_total Response bytes received.",
+                f"# TYPE {prefix}_response_bytes_total counter",
+            ]
+            for operation, count in sorted(self.bytes.items()):
+                labels = format_labels(operation=operation)
+                lines.append(f"{prefix}_response_bytes_total{labels} {count}")
+
+            lines += [
+                f"# HELP {prefix}_proxy_requests_total Requests by proxy and outcome.",
+                f"# TYPE {prefix}_proxy_requests_total counter",
+            ]
+            for (proxy, ok), count in sorted(self.proxy_requests.items()):
+                labels = format_labels(proxy=proxy, outcome="ok" if ok else "error")
+                lines.append(f"{prefix}_proxy_requests_total{labels} {count}")
+
+            for name, help_text, histograms in (
+                (
+                    "request_duration_seconds",
+                    "Request latency including retries.",
+                    self.latency,
+                ),
+                ("response_size_bytes", "Response body size.", self.size),
+            ):
+                lines += [
+                    f"# HELP {prefix}_{name} {help_text}",
+                    f"# TYPE {prefix}_{name} histogram",
+                ]
+                for operation, histogram in sorted(histograms.items()):
+                    for bound, count in histogram.cumulative():
+                        labels = format_labels(operation=operation, le=bound)
+                        lines.append(f"{prefix}_{name}_bucket{labels} {count}")
+                    labels = format_labels(operation=operation)
+                    lines.append(
+                        f"{prefix}_{name}_sum{labels} {format_value(histogram.sum)}"
+                    )
+                    lines.append(f"{prefix}_{name}_count{labels} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+def format_value(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+def format_labels(**labels: str) -> str:
+    pairs = (f'{name}="{escape_label(value)}"' for name, value in labels.items())
+    return "{" + ",".join(pairs) + "}"
+
+
+def escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def serve_prometheus(
+    aggregator: MetricsAggregator,
+    port: int = 9464,
+    host: str = "127.0.0.1",
+) -> ThreadingHTTPServer:
+    """
+    Serves `aggregator.to_prometheus()` on every path from a daemon thread.
+
+    The metrics name the hosts and proxies in use, so they are only served on
+    the loopback interface unless `host` says otherwise, e.g. "0.0.0.0" for a
+    scraper on another machine.
+
+    Returns:
+        ThreadingHTTPServer: The running server; call `shutdown()` to stop it.
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args) -> None:
+            pass
+
+        def do_GET(self) -> None:
+            payload = aggregator.to_prometheus().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
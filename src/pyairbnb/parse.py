@@ -1,46 +1,186 @@
-import json
 import re
+from collections.abc import Collection
 from typing import Any
 
 from bs4 import BeautifulSoup
 
-from pyairbnb import standardize, utils
+from pyairbnb import jsonlib, standardize, utils
 
-regexApiKey = re.compile(r'"key":".+?"')
-regexLanguage = re.compile(r'"language":".+?"')
+regexLanguageOrApiKey = re.compile(r'"(language|key)":"(.+?)"')
+regexApiConfigKey = re.compile(r'"api_config":{"key":"(.+?)"')
+# anything remove_space would rewrite: whitespace other than a single plain space
+regexSpaceToNormalize = re.compile(r"[^\S ]|  ")
+regexWhitespace = re.compile(r"\s*")
 
+DEFERRED_STATE_ID = 'id="data-deferred-state-0"'
+SCRIPT_OPEN = "<script"
+SCRIPT_CLOSE = "</script>"
 
-def parse_body_details_wrapper(body: str):
-    data_raw, language, api_key = parse_body_details(body)
-    data_formatted = standardize.from_details(data_raw)
+# the same for pages kept as UTF-8 bytes; bytes patterns only know ASCII
+# whitespace, so the other characters str's \s matches are spelled out
+regexLanguageOrApiKeyBytes = re.compile(rb'"(language|key)":"(.+?)"')
+regexApiConfigKeyBytes = re.compile(rb'"api_config":{"key":"(.+?)"')
+regexNonAsciiSpaceBytes = re.compile(
+    rb"\xc2[\x85\xa0]|\xe1\x9a\x80|\xe2(?:\x80[\x80-\x8a\xa8\xa9\xaf]|\x81\x9f)"
+    rb"|\xe3\x80\x80"
+)
+regexWhitespaceBytes = re.compile(rb"\s*")
+ASCII_SPACES_TO_NORMALIZE = b"\t\n\v\f\r\x1c\x1d\x1e\x1f"
+
+DEFERRED_STATE_ID_BYTES = DEFERRED_STATE_ID.encode()
+SCRIPT_OPEN_BYTES = SCRIPT_OPEN.encode()
+SCRIPT_CLOSE_BYTES = SCRIPT_CLOSE.encode()
+
+
+def parse_body_details_wrapper(
+    body: str | bytes,
+    sections: Collection[str] | None = None,
+):
+    view, language, price_dependency_input = parse_body_details_view(body)
+    data_formatted = view.to_dict(sections)
     data_formatted["language"] = language
+    return data_formatted, price_dependency_input
+
+
+def parse_body_details_view(
+    body: str | bytes,
+) -> tuple[standardize.DetailView, str, dict[str, Any]]:
+    """
+    Parses a room page without standardizing any of it up front.
+
+    Returns:
+        tuple: A `standardize.DetailView` of the page, its language and the
+        IDs and API key the price requests depend on.
+    """
+    data_raw, language, api_key = parse_body_details(body)
     price_dependency_input = {
         "product_id": data_raw["variables"]["id"],
         "impression_id": data_raw["variables"]["pdpSectionsRequest"]["p3ImpressionId"],
         "api_key": api_key,
     }
-    return data_formatted, price_dependency_input
+    return standardize.DetailView(data_raw), language, price_dependency_input
+
+
+def parse_body_details(body: str | bytes) -> tuple[Any, str, str]:
+    data = extract_deferred_state(body)
+    if data is None:
+        data = extract_deferred_state_soup(body)
+
+    language, api_key = extract_language_and_api_key(body)
+
+    details_data = data["niobeMinimalClientData"][0][1]
+    return details_data, language, api_key
+
 
+def extract_deferred_state(body: str | bytes) -> Any | None:
+    """
+    Decodes the `data-deferred-state-0` script straight out of `body`.
 
-def parse_body_details(body: str) -> tuple[Any, str, str]:
+    The tag is located by string offsets and the JSON is decoded from its
+    position in the page without building a DOM; a page given as bytes is
+    decoded through a memoryview, so the blob is never copied or turned
+    into a str. Returns None if the page does not have the expected shape,
+    so callers can fall back to `extract_deferred_state_soup`.
+    """
+    if isinstance(body, str):
+        state_id, script_open, script_close, tag_end = (
+            DEFERRED_STATE_ID,
+            SCRIPT_OPEN,
+            SCRIPT_CLOSE,
+            ">",
+        )
+        whitespace = regexWhitespace
+    else:
+        state_id, script_open, script_close, tag_end = (
+            DEFERRED_STATE_ID_BYTES,
+            SCRIPT_OPEN_BYTES,
+            SCRIPT_CLOSE_BYTES,
+            b">",
+        )
+        whitespace = regexWhitespaceBytes
+
+    id_index = body.find(state_id)
+    if id_index == -1:
+        return None
+    tag_start = body.rfind(script_open, 0, id_index)
+    if tag_start == -1 or body.find(tag_end, tag_start, id_index) != -1:
+        return None
+    content_start = body.find(tag_end, id_index)
+    if content_start == -1:
+        return None
+    content_start = whitespace.match(body, content_start + 1).end()
+    content_end = body.find(script_close, content_start)
+    if content_end == -1:
+        return None
+
+    # keep the output identical to the remove_space based path: only pay for
+    # a copy when the blob actually holds whitespace that would be collapsed
+    if isinstance(body, str):
+        if regexSpaceToNormalize.search(body, content_start, content_end):
+            return _decode_or_none(utils.remove_space(body[content_start:content_end]))
+        return _decode_or_none(body[content_start:content_end])
+
+    if _has_space_to_normalize(body[content_start:content_end]):
+        content = body[content_start:content_end].decode("utf-8", "replace")
+        return _decode_or_none(utils.remove_space(content))
+    return _decode_or_none(memoryview(body)[content_start:content_end])
+
+
+def _has_space_to_normalize(content: bytes) -> bool:
+    """`regexSpaceToNormalize.search` for UTF-8 bytes, mostly without a regex."""
+    if b"  " in content:
+        return True
+    if len(content.translate(None, ASCII_SPACES_TO_NORMALIZE)) != len(content):
+        return True
+    return not content.isascii() and bool(regexNonAsciiSpaceBytes.search(content))
+
+
+def _decode_or_none(html_data: jsonlib.JSONInput) -> Any | None:
+    try:
+        return jsonlib.loads(html_data)
+    except ValueError:
+        return None
+
+
+def extract_deferred_state_soup(body: str | bytes) -> Any:
+    """Slow but lenient extraction of the deferred state through BeautifulSoup."""
     soup = BeautifulSoup(body, "html.parser")
     data_deferred_state = soup.select("#data-deferred-state-0")[0].getText()
     html_data = utils.remove_space(data_deferred_state)
+    return jsonlib.loads(html_data)
 
-    language_match = regexLanguage.search(body)
-    if not language_match:
-        raise AttributeError("could not extract language from response text")
-    language = language_match.group()
-    language = language.replace('"language":"', "")
-    language = language.replace('"', "")
 
-    api_key_match = regexApiKey.search(body)
-    if not api_key_match:
+def extract_language_and_api_key(body: str | bytes) -> tuple[str, str]:
+    """Finds the first language and API key of the page in a single scan."""
+    found: dict[str, str] = {}
+    if isinstance(body, str):
+        for match in regexLanguageOrApiKey.finditer(body):
+            found.setdefault(match.group(1), match.group(2))
+            if len(found) == 2:
+                break
+    else:
+        for match in regexLanguageOrApiKeyBytes.finditer(body):
+            found.setdefault(match.group(1).decode(), match.group(2).decode())
+            if len(found) == 2:
+                break
+
+    if "language" not in found:
+        raise AttributeError("could not extract language from response text")
+    if "key" not in found:
         raise AttributeError("could not extract API key from response text")
-    api_key = api_key_match.group()
-    api_key = api_key.replace('"key":"', "")
-    api_key = api_key.replace('"', "")
+    return found["language"], found["key"]
 
-    data = json.loads(html_data)
-    details_data = data["niobeMinimalClientData"][0][1]
-    return details_data, language, api_key
+
+def extract_api_config_key(body: str | bytes) -> str | None:
+    """
+    Finds the key of the page's `api_config`, the one the homepage serves.
+
+    Unlike `extract_language_and_api_key`, which takes the first `"key"` of
+    the page, only this key is safe to share with other clients; returns
+    None if the page has no `api_config`.
+    """
+    if isinstance(body, str):
+        match = regexApiConfigKey.search(body)
+        return match.group(1) if match else None
+    match = regexApiConfigKeyBytes.search(body)
+    return match.group(1).decode() if match else None
@@ -0,0 +1,145 @@
+import random
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
+
+DEFAULT_COOLDOWN = 60.0
+DEFAULT_FAILURE_THRESHOLD = 3
+DEFAULT_LATENCY_ALPHA = 0.3
+# seconds of latency a proxy failing every request is considered to cost
+ERROR_PENALTY = 5.0
+MAX_PINNED_COOKIES = 10_000
+
+
+class ProxyStats:
+    """Running health figures of one proxy."""
+
+    def __init__(self, url: str):
+        self.url = url
+        self.requests = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.latency: float | None = None
+        self.recent_error_rate = 0.0
+        self.quarantined_until = 0.0
+
+    @property
+    def error_rate(self) -> float:
+        return self.failures / self.requests if self.requests else 0.0
+
+    def score(self) -> float:
+        """Lower is better; untried proxies score 0 so each gets sampled."""
+        if self.latency is None:
+            return 0.0
+        return self.latency + self.recent_error_rate * ERROR_PENALTY
+
+    def to_dict(self, now: float) -> dict:
+        return {
+            "requests": self.requests,
+            "failures": self.failures,
+            "error_rate": self.error_rate,
+            "recent_error_rate": self.recent_error_rate,
+            "latency": self.latency,
+            "quarantined": self.quarantined_until > now,
+            "quarantined_for": max(0.0, self.quarantined_until - now),
+        }
+
+
+class ProxyPool:
+    """
+    Picks a proxy per request, favouring fast and reliable ones.
+
+    Each pick compares two random healthy proxies and keeps the one with the
+    lower score (average latency plus a penalty for recent errors), which
+    steers traffic to good exits without piling everything onto a single one.
+    A proxy failing `failure_threshold` times in a row is quarantined for
+    `cooldown` seconds.
+
+    Cookies set by a response are pinned to the proxy that received them,
+    and later requests carrying any of those cookies (e.g. the price and host
+    calls following a room page) go through the same proxy while it is healthy.
+
+    Args:
+        proxy_urls (Iterable[str]): Proxy URLs, e.g. from `utils.parse_proxy`.
+        cooldown (float): Seconds a failing proxy is kept out of rotation.
+        failure_threshold (int): Consecutive failures before quarantine.
+        latency_alpha (float): Weight of the newest sample in the latency and error averages.
+    """
+
+    def __init__(
+        self,
+        proxy_urls: Iterable[str],
+        cooldown: float = DEFAULT_COOLDOWN,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        latency_alpha: float = DEFAULT_LATENCY_ALPHA,
+    ):
+        self._proxies = {url: ProxyStats(url) for url in proxy_urls}
+        if not self._proxies:
+            raise ValueError("ProxyPool needs at least one proxy URL.")
+        self.cooldown = cooldown
+        self.failure_threshold = failure_threshold
+        self.latency_alpha = latency_alpha
+        self._pinned: OrderedDict[tuple[str, str], str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def choose(self, cookies: Mapping[str, str] | None = None) -> str:
+        now = time.monotonic()
+        with self._lock:
+            pinned = self._pinned_proxy(cookies)
+            if pinned is not None and self._proxies[pinned].quarantined_until <= now:
+                return pinned
+            healthy = [
+                stats
+                for stats in self._proxies.values()
+                if stats.quarantined_until <= now
+            ]
+            if not healthy:
+                # everything is cooling down; use whichever comes back first
+                return min(
+                    self._proxies.values(), key=lambda stats: stats.quarantined_until
+                ).url
+            candidates = random.sample(healthy, min(2, len(healthy)))
+            return min(candidates, key=ProxyStats.score).url
+
+    def record(self, proxy_url: str, latency: float, ok: bool) -> None:
+        with self._lock:
+            stats = self._proxies[proxy_url]
+            stats.requests += 1
+            if stats.latency is None:
+                stats.latency = latency
+            else:
+                stats.latency += self.latency_alpha * (latency - stats.latency)
+            stats.recent_error_rate += self.latency_alpha * (
+                (0.0 if ok else 1.0) - stats.recent_error_rate
+            )
+            if ok:
+                stats.consecutive_failures = 0
+                return
+            stats.failures += 1
+            stats.consecutive_failures += 1
+            if stats.consecutive_failures >= self.failure_threshold:
+                stats.quarantined_until = time.monotonic() + self.cooldown
+                stats.consecutive_failures = 0
+
+    def pin(self, cookies: Mapping[str, str], proxy_url: str) -> None:
+        with self._lock:
+            for item in cookies.items():
+                self._pinned[item] = proxy_url
+                self._pinned.move_to_end(item)
+            while len(self._pinned) > MAX_PINNED_COOKIES:
+                self._pinned.popitem(last=False)
+
+    def _pinned_proxy(self, cookies: Mapping[str, str] | None) -> str | None:
+        if not cookies:
+            return None
+        for item in cookies.items():
+            proxy_url = self._pinned.get(item)
+            if proxy_url is not None:
+                return proxy_url
+        return None
+
+    def stats(self) -> dict[str, dict]:
+        now = time.monotonic()
+        with self._lock:
+            return {url: stats.to_dict(now) for url, stats in self._proxies.items()}
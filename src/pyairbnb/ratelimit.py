@@ -0,0 +1,205 @@
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from curl_cffi.requests import Response
+
+DEFAULT_RATE = 5.0
+DEFAULT_BURST = 10
+DEFAULT_MIN_RATE = 0.2
+DEFAULT_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+THROTTLE_STATUSES = frozenset({429, 503})
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket whose rate adapts to throttling.
+
+    `reserve()` takes a token and returns how long the caller must wait before
+    using it, so the same bucket serves threads (`time.sleep`) and asyncio
+    (`asyncio.sleep`). Throttled responses halve the rate down to `min_rate`;
+    each success wins back a small step up to the configured rate.
+
+    Args:
+        rate (float): Tokens added per second.
+        burst (int): Maximum number of tokens the bucket holds.
+        min_rate (float): Lowest rate throttling can push the bucket down to.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        min_rate: float = DEFAULT_MIN_RATE,
+    ):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min(min_rate, rate)
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated_at
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._updated_at = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def throttled(self) -> None:
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+
+    def succeeded(self) -> None:
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 20)
+
+
+class RateLimiter:
+    """
+    Token buckets per host and per GraphQL operation.
+
+    A request waits for both its host's bucket and its operation's bucket.
+    Hosts and operations without an explicit limit get `rate`/`burst`;
+    pass `operation_rates` to give some operations their own limits.
+
+    Args:
+        rate (float): Default requests per second for each host.
+        burst (int): Default burst size for each host.
+        host_rates (dict): Per-host (rate, burst) overrides.
+        operation_rates (dict): Per-operation (rate, burst) limits.
+        min_rate (float): Lowest rate throttling can push a bucket down to.
+    """
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE,
+        burst: int = DEFAULT_BURST,
+        host_rates: dict[str, tuple[float, int]] | None = None,
+        operation_rates: dict[str, tuple[float, int]] | None = None,
+        min_rate: float = DEFAULT_MIN_RATE,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.host_rates = host_rates or {}
+        self.operation_rates = operation_rates or {}
+        self.min_rate = min_rate
+        self._buckets: dict[tuple[str, str], TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, kind: str, name: str) -> TokenBucket | None:
+        with self._lock:
+            bucket = self._buckets.get((kind, name))
+            if bucket is None:
+                if kind == "host":
+                    rate, burst = self.host_rates.get(name, (self.rate, self.burst))
+                elif name in self.operation_rates:
+                    rate, burst = self.operation_rates[name]
+                else:
+                    return None
+                bucket = TokenBucket(rate, burst, self.min_rate)
+                self._buckets[(kind, name)] = bucket
+            return bucket
+
+    def _buckets_for(self, host: str, operation: str | None) -> list[TokenBucket]:
+        buckets = [self._bucket("host", host)]
+        if operation:
+            buckets.append(self._bucket("operation", operation))
+        return [bucket for bucket in buckets if bucket is not None]
+
+    def reserve(self, host: str, operation: str | None = None) -> float:
+        """Takes a token for the request and returns the seconds to wait first."""
+        return max(bucket.reserve() for bucket in self._buckets_for(host, operation))
+
+    def record(self, host: str, operation: str | None, status_code: int) -> None:
+        """Feeds a response status back so throttling slows the buckets down."""
+        for bucket in self._buckets_for(host, operation):
+            if status_code in THROTTLE_STATUSES:
+                bucket.throttled()
+            else:
+                bucket.succeeded()
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter, honouring Retry-After.
+
+    Retries are drawn from a shared budget that earns `budget_ratio` of a
+    retry for every request sent, so a failing upstream gets a bounded
+    amount of extra traffic instead of a retry storm.
+
+    Args:
+        max_retries (int): Retries per request on top of the first attempt.
+        backoff_base (float): Delay scale in seconds; doubles on each attempt.
+        backoff_max (float): Upper bound for a single delay, Retry-After included.
+        retry_statuses (frozenset): Response statuses worth retrying.
+        budget_ratio (float): Retries earned per request sent.
+        budget_max (float): Maximum number of retries the budget can hold.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        retry_statuses: frozenset[int] = DEFAULT_RETRY_STATUSES,
+        budget_ratio: float = 0.2,
+        budget_max: float = 20.0,
+    ):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = retry_statuses
+        self.budget_ratio = budget_ratio
+        self.budget_max = budget_max
+        self._budget = budget_max
+        self._lock = threading.Lock()
+
+    def sent(self) -> None:
+        with self._lock:
+            self._budget = min(self.budget_max, self._budget + self.budget_ratio)
+
+    def _withdraw(self) -> bool:
+        with self._lock:
+            if self._budget < 1:
+                return False
+            self._budget -= 1
+            return True
+
+    def should_retry(self, attempt: int, response: Response | None) -> bool:
+        """Whether a request should be retried after `response` (None for a network error)."""
+        if attempt >= self.max_retries:
+            return False
+        if response is not None and response.status_code not in self.retry_statuses:
+            return False
+        return self._withdraw()
+
+    def delay(self, attempt: int, response: Response | None) -> float:
+        retry_after = parse_retry_after(response) if response is not None else None
+        if retry_after is not None:
+            return min(self.backoff_max, retry_after)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+
+
+def parse_retry_after(response: Response) -> float | None:
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
@@ -1,37 +1,125 @@
 import re
+from collections.abc import Collection
+from functools import cached_property
 from typing import Any
 
-from pyairbnb import utils
+from pyairbnb import records, utils
 
 regex_number = re.compile(r"\d+")
 
+# from_details output keys and the page sections they are built from
+DETAIL_SECTIONS: dict[str, tuple[str, ...]] = {
+    "host": ("PdpHostOverviewDefaultSection", "HostProfileSection"),
+    "sub_description": ("PdpOverviewV2Section",),
+    "images": ("PhotoTourModalSection",),
+    "house_rules": ("PoliciesSection",),
+    "location_descriptions": ("LocationSection",),
+    "title": ("PdpTitleSection",),
+    "highlights": ("PdpHighlightsSection",),
+    "description": ("PdpDescriptionSection",),
+    "amenities": ("AmenitiesSection",),
+}
 
-def from_search(results) -> list:
+path_typename = utils.KeyPath("__typename")
+path_listing = utils.KeyPath("listing")
+path_structured_stay_display_price = utils.KeyPath(
+    "pricingQuote.structuredStayDisplayPrice"
+)
+path_room_type_category = utils.KeyPath("roomTypeCategory")
+path_pdp_url_type = utils.KeyPath("pdpUrlType")
+path_name = utils.KeyPath("name")
+path_title = utils.KeyPath("title")
+path_listing_obj_type = utils.KeyPath("listingObjType")
+path_primary_line_qualifier = utils.KeyPath("primaryLine.qualifier")
+path_coordinate_latitude = utils.KeyPath("coordinate.latitude")
+path_coordinate_longitude = utils.KeyPath("coordinate.longitude")
+path_formatted_badges = utils.KeyPath("formattedBadges")
+path_logging_context_badge_type = utils.KeyPath("loggingContext.badgeType")
+path_avg_rating_localized = utils.KeyPath("avgRatingLocalized")
+path_primary_line_original_price = utils.KeyPath("primaryLine.originalPrice")
+path_primary_line_price = utils.KeyPath("primaryLine.price")
+path_primary_line_discounted_price = utils.KeyPath("primaryLine.discountedPrice")
+path_secondary_line_price = utils.KeyPath("secondaryLine.price")
+path_contextual_pictures = utils.KeyPath("contextualPictures")
+path_picture = utils.KeyPath("picture")
+path_explanation_data_price_details = utils.KeyPath("explanationData.priceDetails")
+path_items = utils.KeyPath("items")
+path_listing_lat = utils.KeyPath("listingLat")
+path_listing_lng = utils.KeyPath("listingLng")
+path_room_type = utils.KeyPath("roomType")
+path_is_superhost = utils.KeyPath("isSuperhost")
+path_home_tier = utils.KeyPath("homeTier")
+path_person_capacity = utils.KeyPath("personCapacity")
+path_accuracy_rating = utils.KeyPath("accuracyRating")
+path_checkin_rating = utils.KeyPath("checkinRating")
+path_cleanliness_rating = utils.KeyPath("cleanlinessRating")
+path_communication_rating = utils.KeyPath("communicationRating")
+path_location_rating = utils.KeyPath("locationRating")
+path_value_rating = utils.KeyPath("valueRating")
+path_guest_satisfaction_overall = utils.KeyPath("guestSatisfactionOverall")
+path_visible_review_count = utils.KeyPath("visibleReviewCount")
+path_pdp_sbui_data = utils.KeyPath(
+    "data.presentation.stayProductDetailPage.sections.sbuiData"
+)
+path_section_configuration_root_sections = utils.KeyPath(
+    "sectionConfiguration.root.sections"
+)
+path_section_data_typename = utils.KeyPath("sectionData.__typename")
+path_section_data_host_id = utils.KeyPath(
+    "sectionData.hostAvatar.loggingEventData.eventData.pdpContext.hostId"
+)
+path_section_data_title = utils.KeyPath("sectionData.title")
+path_section_data_overview_items = utils.KeyPath("sectionData.overviewItems")
+path_pdp_sections = utils.KeyPath(
+    "data.presentation.stayProductDetailPage.sections.sections"
+)
+path_section_typename = utils.KeyPath("section.__typename")
+path_section_host_avatar_user_id = utils.KeyPath("section.hostAvatar.userID")
+path_section_title = utils.KeyPath("section.title")
+path_section_subtitle = utils.KeyPath("section.subtitle")
+path_section_host_profile_description_html_text = utils.KeyPath(
+    "section.hostProfileDescription.htmlText"
+)
+path_section_additional_hosts = utils.KeyPath("section.additionalHosts")
+path_section_media_items = utils.KeyPath("section.mediaItems")
+path_section_house_rules_sections = utils.KeyPath("section.houseRulesSections")
+path_html_html_text = utils.KeyPath("html.htmlText")
+path_section_see_all_location_details = utils.KeyPath("section.seeAllLocationDetails")
+path_content_html_text = utils.KeyPath("content.htmlText")
+path_section_highlights = utils.KeyPath("section.highlights")
+path_section_html_description_html_text = utils.KeyPath(
+    "section.htmlDescription.htmlText"
+)
+path_section_see_all_amenities_groups = utils.KeyPath("section.seeAllAmenitiesGroups")
+
+
+def from_search(results, typed: bool = False) -> list:
+    """
+    Standardizes raw `searchResults`.
+
+    Returns dicts, or `records.SearchListing` objects when `typed` is True.
+    """
     datas = []
     for result in results:
-        type_name = utils.get_nested_value(result, "__typename", "")
+        type_name = path_typename.get(result, "")
         if type_name != "StaySearchResult":
             continue
-        lt = utils.get_nested_value(result, "listing", {})
-        pr = utils.get_nested_value(
-            result, "pricingQuote.structuredStayDisplayPrice", {}
-        )
+        lt = path_listing.get(result, {})
+        pr = path_structured_stay_display_price.get(result, {})
         data = {
             "room_id": int(lt["id"]),
-            "category": utils.get_nested_value(lt, "roomTypeCategory", ""),
-            "kind": utils.get_nested_value(lt, "pdpUrlType", ""),
-            "name": utils.get_nested_value(lt, "name", ""),
-            "title": utils.get_nested_value(lt, "title", ""),
-            "type": utils.get_nested_value(lt, "listingObjType", ""),
+            "category": path_room_type_category.get(lt, ""),
+            "kind": path_pdp_url_type.get(lt, ""),
+            "name": path_name.get(lt, ""),
+            "title": path_title.get(lt, ""),
+            "type": path_listing_obj_type.get(lt, ""),
             "long_stay_discount": {},
             "fee": {
                 "airbnb": {},
                 "cleaning": {},
             },
             "price": {
-                "unit": {
-                    "qualifier": utils.get_nested_value(pr, "primaryLine.qualifier", "")
-                },
+                "unit": {"qualifier": path_primary_line_qualifier.get(pr, "")},
                 "total": {},
                 "break_down": [],
             },
@@ -42,16 +130,14 @@ def from_search(results) -> list:
             "images": [],
             "badges": [],
             "coordinates": {
-                "latitude": utils.get_nested_value(lt, "coordinate.latitude", 0),
-                "longitud": utils.get_nested_value(lt, "coordinate.longitude", 0),
+                "latitude": path_coordinate_latitude.get(lt, 0),
+                "longitud": path_coordinate_longitude.get(lt, 0),
             },
         }
-        for badge in utils.get_nested_value(lt, "formattedBadges", []):
-            data["badges"].append(
-                utils.get_nested_value(badge, "loggingContext.badgeType", "")
-            )
+        for badge in path_formatted_badges.get(lt, []):
+            data["badges"].append(path_logging_context_badge_type.get(badge, ""))
 
-        avg_rating_localized = utils.get_nested_value(lt, "avgRatingLocalized", "")
+        avg_rating_localized = path_avg_rating_localized.get(lt, "")
         splitted = avg_rating_localized.split(" ")
         if len(splitted) == 2:
             rating = float(splitted[0])
@@ -63,21 +149,21 @@ def from_search(results) -> list:
                 )
             review_count = review_count_match.group()
             data["rating"]["reviewCount"] = review_count
-        price_to_use = utils.get_nested_value(pr, "primaryLine.originalPrice", "")
+        price_to_use = path_primary_line_original_price.get(pr, "")
         if price_to_use == "":
-            price_to_use = utils.get_nested_value(pr, "primaryLine.price", "")
+            price_to_use = path_primary_line_price.get(pr, "")
 
         if price_to_use != "":
             amount, currency = utils.parse_price_symbol(price_to_use)
             data["price"]["unit"]["curency_symbol"] = currency
             data["price"]["unit"]["amount"] = amount
 
-        discounted_price = utils.get_nested_value(pr, "primaryLine.discountedPrice", "")
+        discounted_price = path_primary_line_discounted_price.get(pr, "")
         if discounted_price != "":
             amount, _ = utils.parse_price_symbol(discounted_price)
             data["price"]["unit"]["discount"] = amount
 
-        splitted = utils.get_nested_value(pr, "secondaryLine.price", "").split(" ")
+        splitted = path_secondary_line_price.get(pr, "").split(" ")
         price_to_use = ""
         match len(splitted):
             case 1:
@@ -94,15 +180,13 @@ def from_search(results) -> list:
         amount, currency = utils.parse_price_symbol(price_to_use)
         data["price"]["total"]["currency_symbol"] = currency
         data["price"]["total"]["amount"] = amount
-        for image_data in utils.get_nested_value(lt, "contextualPictures", []):
-            img = {"url": utils.get_nested_value(image_data, "picture", "")}
+        for image_data in path_contextual_pictures.get(lt, []):
+            img = {"url": path_picture.get(image_data, "")}
             data["images"].append(img)
-        for price_detail in utils.get_nested_value(
-            pr, "explanationData.priceDetails", []
-        ):
+        for price_detail in path_explanation_data_price_details.get(pr, []):
             if "items" not in price_detail:
                 continue
-            for item in utils.get_nested_value(price_detail, "items", []):
+            for item in path_items.get(price_detail, []):
                 amount, currency = utils.parse_price_symbol(item["priceString"])
                 data["price"]["break_down"].append(
                     {
@@ -125,179 +209,310 @@ def from_search(results) -> list:
                             case "Airbnb service fee":
                                 data["fee"]["airbnb"]["amount"] = amount
                                 data["fee"]["airbnb"]["currency_symbol"] = currency
-        datas.append(data)
+        datas.append(records.SearchListing.from_dict(data) if typed else data)
 
     return datas
 
 
-def from_details(meta) -> dict[str, Any]:
-    ev = meta["data"]["presentation"]["stayProductDetailPage"]["sections"]["metadata"][
-        "loggingContext"
-    ]["eventDataLogging"]
-    data = {
-        "coordinates": {
-            "latitude": utils.get_nested_value(ev, "listingLat", 0),
-            "longitude": utils.get_nested_value(ev, "listingLng", 0),
-        },
-        "room_type": utils.get_nested_value(ev, "roomType", ""),
-        "is_super_host": utils.get_nested_value(ev, "isSuperhost", ""),
-        "home_tier": utils.get_nested_value(ev, "homeTier", ""),
-        "person_capacity": utils.get_nested_value(ev, "personCapacity", 0),
-        "rating": {
-            "accuracy": utils.get_nested_value(ev, "accuracyRating", 0),
-            "checking": utils.get_nested_value(ev, "checkinRating", 0),
-            "cleanliness": utils.get_nested_value(ev, "cleanlinessRating", 0),
-            "communication": utils.get_nested_value(ev, "communicationRating", 0),
-            "location": utils.get_nested_value(ev, "locationRating", 0),
-            "value": utils.get_nested_value(ev, "valueRating", 0),
-            "guest_satisfaction": utils.get_nested_value(
-                ev, "guestSatisfactionOverall", 0
-            ),
-            "review_count": utils.get_nested_value(ev, "visibleReviewCount", 0),
-        },
-        "house_rules": {
-            "aditional": "",
-            "general": [],
-        },
-        "host": {
-            "id": "",
-            "name": "",
-            "joined_on": "",
-            "description": "",
-        },
-        "sub_description": {
-            "title": "",
-            "items": [],
-        },
-        "amenities": [],
-        "co_hosts": [],
-        "images": [],
-        "location_descriptions": [],
-        "highlights": [],
-    }
-
-    sd = utils.get_nested_value(
-        meta, "data.presentation.stayProductDetailPage.sections.sbuiData"
-    )
-    for section in utils.get_nested_value(sd, "sectionConfiguration.root.sections", []):
-        type_name = utils.get_nested_value(section, "sectionData.__typename", "")
-        if type_name == "PdpHostOverviewDefaultSection":
-            data["host"] = {
-                "id": utils.get_nested_value(
-                    section,
-                    "sectionData.hostAvatar.loggingEventData.eventData.pdpContext.hostId",
-                    "",
-                ),
-                "name": utils.get_nested_value(section, "sectionData.title", ""),
-            }
-        elif type_name == "PdpOverviewV2Section":
-            data["sub_description"]["title"] = utils.get_nested_value(
-                section, "sectionData.title", ""
-            )
-            for item in utils.get_nested_value(
-                section, "sectionData.overviewItems", []
-            ):
-                data["sub_description"]["items"].append(
-                    utils.get_nested_value(item, "title", "")
-                )
+def _empty_host() -> dict[str, str]:
+    return {"id": "", "name": "", "joined_on": "", "description": ""}
 
-    for section in utils.get_nested_value(
-        meta, "data.presentation.stayProductDetailPage.sections.sections", []
-    ):
-        type_name = utils.get_nested_value(section, "section.__typename", "")
-        match type_name:
-            case "HostProfileSection":
-                data["host"]["id"] = utils.get_nested_value(
-                    section, "section.hostAvatar.userID", ""
-                )
-                data["host"]["name"] = utils.get_nested_value(
-                    section, "section.title", ""
-                )
-                data["host"]["joined_on"] = utils.get_nested_value(
-                    section, "section.subtitle", ""
-                )
-                data["host"]["description"] = utils.get_nested_value(
-                    section, "section.hostProfileDescription.htmlText", ""
-                )
-                for cohost in utils.get_nested_value(
-                    section, "section.additionalHosts", []
-                ):
-                    data["co_hosts"].append(
-                        {"id": cohost.get("id", ""), "name": cohost.get("name", "")}
-                    )
-            case "PhotoTourModalSection":
-                for media_item in utils.get_nested_value(
-                    section, "section.mediaItems", []
-                ):
-                    img = {
-                        "title": media_item.get("accessibilityLabel", ""),
-                        "url": media_item.get("baseUrl", ""),
-                    }
-                    data["images"].append(img)
-            case "PoliciesSection":
-                for house_rules_section in utils.get_nested_value(
-                    section, "section.houseRulesSections", []
-                ):
-                    house_rule = {
-                        "title": house_rules_section.get("title", ""),
-                        "values": [],
-                    }
-                    for item in house_rules_section.get("items", []):
-                        if item.get("title", "") == "Additional rules":
-                            data["house_rules"]["aditional"] = utils.get_nested_value(
-                                item, "html.htmlText", ""
-                            )
-                            continue
-                        house_rule["values"].append(
-                            {
-                                "title": item.get("title", ""),
-                                "icon": item.get("icon", ""),
-                            }
-                        )
-
-                    data["house_rules"]["general"].append(house_rule)
-            case "LocationSection":
-                for location_detail in utils.get_nested_value(
-                    section, "section.seeAllLocationDetails", []
-                ):
-                    see_all_location_detail = {
-                        "title": location_detail.get("title", ""),
-                        "content": utils.get_nested_value(
-                            location_detail, "content.htmlText"
-                        ),
-                    }
-                    data["location_descriptions"].append(see_all_location_detail)
-            case "PdpTitleSection":
-                data["title"] = section.get("title", "")
-            case "PdpHighlightsSection":
-                for highliting_data in utils.get_nested_value(
-                    section, "section.highlights", []
-                ):
-                    highliting = {
-                        "title": highliting_data.get("title", ""),
-                        "subtitle": highliting_data.get("subtitle", ""),
-                        "icon": highliting_data.get("icon", ""),
+
+def _build_host(root_sections: list, sections: list) -> dict[str, str]:
+    host = _empty_host()
+    for section in root_sections:
+        host = {
+            "id": path_section_data_host_id.get(section, ""),
+            "name": path_section_data_title.get(section, ""),
+        }
+    for section in sections:
+        host["id"] = path_section_host_avatar_user_id.get(section, "")
+        host["name"] = path_section_title.get(section, "")
+        host["joined_on"] = path_section_subtitle.get(section, "")
+        host["description"] = path_section_host_profile_description_html_text.get(
+            section, ""
+        )
+    return host
+
+
+def _build_co_hosts(sections: list) -> list:
+    return [
+        {"id": cohost.get("id", ""), "name": cohost.get("name", "")}
+        for section in sections
+        for cohost in path_section_additional_hosts.get(section, [])
+    ]
+
+
+def _build_sub_description(root_sections: list) -> dict[str, Any]:
+    sub_description: dict[str, Any] = {"title": "", "items": []}
+    for section in root_sections:
+        sub_description["title"] = path_section_data_title.get(section, "")
+        for item in path_section_data_overview_items.get(section, []):
+            sub_description["items"].append(path_title.get(item, ""))
+    return sub_description
+
+
+def _build_images(sections: list) -> list:
+    return [
+        {
+            "title": media_item.get("accessibilityLabel", ""),
+            "url": media_item.get("baseUrl", ""),
+        }
+        for section in sections
+        for media_item in path_section_media_items.get(section, [])
+    ]
+
+
+def _build_house_rules(sections: list) -> dict[str, Any]:
+    house_rules: dict[str, Any] = {"aditional": "", "general": []}
+    for section in sections:
+        for house_rules_section in path_section_house_rules_sections.get(section, []):
+            house_rule = {
+                "title": house_rules_section.get("title", ""),
+                "values": [],
+            }
+            for item in house_rules_section.get("items", []):
+                if item.get("title", "") == "Additional rules":
+                    house_rules["aditional"] = path_html_html_text.get(item, "")
+                    continue
+                house_rule["values"].append(
+                    {
+                        "title": item.get("title", ""),
+                        "icon": item.get("icon", ""),
                     }
-                    data["highlights"].append(highliting)
-            case "PdpDescriptionSection":
-                data["description"] = utils.get_nested_value(
-                    section, "section.htmlDescription.htmlText", ""
                 )
-            case "AmenitiesSection":
-                for amenity_group_raw in utils.get_nested_value(
-                    section, "section.seeAllAmenitiesGroups", []
-                ):
-                    amenity_group = {
-                        "title": amenity_group_raw.get("title", ""),
-                        "values": [],
-                    }
-                    for amenity_raw in amenity_group_raw.get("amenities", []):
-                        amenity = {
+            house_rules["general"].append(house_rule)
+    return house_rules
+
+
+def _build_location_descriptions(sections: list) -> list:
+    return [
+        {
+            "title": location_detail.get("title", ""),
+            "content": path_content_html_text.get(location_detail),
+        }
+        for section in sections
+        for location_detail in path_section_see_all_location_details.get(section, [])
+    ]
+
+
+def _build_highlights(sections: list) -> list:
+    return [
+        {
+            "title": highliting_data.get("title", ""),
+            "subtitle": highliting_data.get("subtitle", ""),
+            "icon": highliting_data.get("icon", ""),
+        }
+        for section in sections
+        for highliting_data in path_section_highlights.get(section, [])
+    ]
+
+
+def _build_amenities(sections: list) -> list:
+    amenities = []
+    for section in sections:
+        for amenity_group_raw in path_section_see_all_amenities_groups.get(section, []):
+            amenities.append(
+                {
+                    "title": amenity_group_raw.get("title", ""),
+                    "values": [
+                        {
                             "title": amenity_raw.get("title", ""),
                             "subtitle": amenity_raw.get("subtitle", ""),
                             "icon": amenity_raw.get("icon", ""),
                             "available": amenity_raw.get("available", ""),
                         }
-                        amenity_group["values"].append(amenity)
-                    data["amenities"].append(amenity_group)
-    return data
+                        for amenity_raw in amenity_group_raw.get("amenities", [])
+                    ],
+                }
+            )
+    return amenities
+
+
+class DetailView:
+    """
+    Lazily standardized room page.
+
+    The page sections are indexed by `__typename` once; each attribute is
+    standardized the first time it is read and cached, so reading a couple
+    of fields costs little more than the index. `to_dict()` returns what
+    `from_details` returns. Cached values are shared with the returned
+    dicts, so treat them as read-only.
+
+    Args:
+        meta (dict): The page data from `parse.parse_body_details`.
+    """
+
+    def __init__(self, meta):
+        self._ev = meta["data"]["presentation"]["stayProductDetailPage"]["sections"][
+            "metadata"
+        ]["loggingContext"]["eventDataLogging"]
+        self._root_sections: dict[str, list] = {}
+        sd = path_pdp_sbui_data.get(meta)
+        for section in path_section_configuration_root_sections.get(sd, []):
+            type_name = path_section_data_typename.get(section, "")
+            self._root_sections.setdefault(type_name, []).append(section)
+        # insertion order keeps the order in which section types first appear
+        self._sections: dict[str, list] = {}
+        for section in path_pdp_sections.get(meta, []):
+            type_name = path_section_typename.get(section, "")
+            self._sections.setdefault(type_name, []).append(section)
+
+    def _root(self, type_name: str) -> list:
+        return self._root_sections.get(type_name, [])
+
+    def _of(self, type_name: str) -> list:
+        return self._sections.get(type_name, [])
+
+    @cached_property
+    def coordinates(self) -> dict[str, float]:
+        return {
+            "latitude": path_listing_lat.get(self._ev, 0),
+            "longitude": path_listing_lng.get(self._ev, 0),
+        }
+
+    @property
+    def room_type(self) -> str:
+        return path_room_type.get(self._ev, "")
+
+    @property
+    def is_super_host(self) -> bool | str:
+        return path_is_superhost.get(self._ev, "")
+
+    @property
+    def home_tier(self) -> int | str:
+        return path_home_tier.get(self._ev, "")
+
+    @property
+    def person_capacity(self) -> int:
+        return path_person_capacity.get(self._ev, 0)
+
+    @cached_property
+    def rating(self) -> dict[str, Any]:
+        ev = self._ev
+        return {
+            "accuracy": path_accuracy_rating.get(ev, 0),
+            "checking": path_checkin_rating.get(ev, 0),
+            "cleanliness": path_cleanliness_rating.get(ev, 0),
+            "communication": path_communication_rating.get(ev, 0),
+            "location": path_location_rating.get(ev, 0),
+            "value": path_value_rating.get(ev, 0),
+            "guest_satisfaction": path_guest_satisfaction_overall.get(ev, 0),
+            "review_count": path_visible_review_count.get(ev, 0),
+        }
+
+    @cached_property
+    def house_rules(self) -> dict[str, Any]:
+        return _build_house_rules(self._of("PoliciesSection"))
+
+    @cached_property
+    def host(self) -> dict[str, str]:
+        return _build_host(
+            self._root("PdpHostOverviewDefaultSection"),
+            self._of("HostProfileSection"),
+        )
+
+    @cached_property
+    def co_hosts(self) -> list:
+        return _build_co_hosts(self._of("HostProfileSection"))
+
+    @cached_property
+    def sub_description(self) -> dict[str, Any]:
+        return _build_sub_description(self._root("PdpOverviewV2Section"))
+
+    @cached_property
+    def amenities(self) -> list:
+        return _build_amenities(self._of("AmenitiesSection"))
+
+    @cached_property
+    def images(self) -> list:
+        return _build_images(self._of("PhotoTourModalSection"))
+
+    @cached_property
+    def location_descriptions(self) -> list:
+        return _build_location_descriptions(self._of("LocationSection"))
+
+    @cached_property
+    def highlights(self) -> list:
+        return _build_highlights(self._of("PdpHighlightsSection"))
+
+    @property
+    def title(self) -> str | None:
+        """The title, or None if the page has no title section."""
+        sections = self._of("PdpTitleSection")
+        return sections[-1].get("title", "") if sections else None
+
+    @property
+    def description(self) -> str | None:
+        """The description, or None if the page has no description section."""
+        sections = self._of("PdpDescriptionSection")
+        if not sections:
+            return None
+        return path_section_html_description_html_text.get(sections[-1], "")
+
+    def to_dict(self, sections: Collection[str] | None = None) -> dict[str, Any]:
+        """
+        Builds the dict `from_details` returns.
+
+        Args:
+            sections (Collection[str]): Keys of `DETAIL_SECTIONS` to build; None
+                builds all of them. Sections left out keep their empty defaults.
+        """
+        if sections is None:
+            sections = DETAIL_SECTIONS.keys()
+        else:
+            unknown = set(sections) - DETAIL_SECTIONS.keys()
+            if unknown:
+                raise ValueError(f"Unknown detail sections: {sorted(unknown)}")
+        with_host = "host" in sections
+        data = {
+            "coordinates": self.coordinates,
+            "room_type": self.room_type,
+            "is_super_host": self.is_super_host,
+            "home_tier": self.home_tier,
+            "person_capacity": self.person_capacity,
+            "rating": self.rating,
+            "house_rules": (
+                self.house_rules
+                if "house_rules" in sections
+                else {"aditional": "", "general": []}
+            ),
+            "host": self.host if with_host else _empty_host(),
+            "sub_description": (
+                self.sub_description
+                if "sub_description" in sections
+                else {"title": "", "items": []}
+            ),
+            "amenities": self.amenities if "amenities" in sections else [],
+            "co_hosts": self.co_hosts if with_host else [],
+            "images": self.images if "images" in sections else [],
+            "location_descriptions": (
+                self.location_descriptions
+                if "location_descriptions" in sections
+                else []
+            ),
+            "highlights": self.highlights if "highlights" in sections else [],
+        }
+        for type_name in self._sections:
+            if type_name == "PdpTitleSection" and "title" in sections:
+                data["title"] = self.title
+            elif type_name == "PdpDescriptionSection" and "description" in sections:
+                data["description"] = self.description
+        return data
+
+
+def from_details(meta, sections: Collection[str] | None = None) -> dict[str, Any]:
+    """
+    Standardizes the data of a room page.
+
+    Use `DetailView` instead to standardize only the fields that are read.
+
+    Args:
+        meta (dict): The page data from `parse.parse_body_details`.
+        sections (Collection[str]): Keys of `DETAIL_SECTIONS` to build; None
+            builds all of them. Sections left out keep their empty defaults.
+
+    Returns:
+        dict: The room details.
+    """
+    return DetailView(meta).to_dict(sections)
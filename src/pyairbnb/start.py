@@ -1,10 +1,86 @@
+import asyncio
+from collections.abc import AsyncIterator, Collection, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import asynccontextmanager, closing, contextmanager
+from dataclasses import dataclass
 from http.cookiejar import reach  # type: ignore[attr-defined]
+from itertools import islice
+from typing import NamedTuple
 from urllib.parse import urlparse
 
 from curl_cffi.requests.cookies import Cookies
 
 from pyairbnb import standardize
-from pyairbnb.api import Api
+from pyairbnb.api import HOMEPAGE_URL, Api
+from pyairbnb.async_api import AsyncApi
+from pyairbnb.hostcache import HostCache
+from pyairbnb.records import DetailRecord, SearchListing
+from pyairbnb.utils import get_nested_value
+
+# requests get_details can make after loading the room page
+DETAIL_FETCHES = frozenset({"calendar", "reviews", "price", "host"})
+
+
+@contextmanager
+def _use_api(
+    api: Api | None,
+    currency: str,
+    proxy_url: str | None,
+    **api_kwargs,
+) -> Iterator[Api]:
+    """Yields the caller's Api untouched, or a temporary one closed on exit."""
+    if api is not None:
+        yield api
+        return
+    with Api(currency=currency, proxy_url=proxy_url, **api_kwargs) as temporary_api:
+        yield temporary_api
+
+
+@asynccontextmanager
+async def _use_async_api(
+    api: AsyncApi | None,
+    currency: str,
+    proxy_url: str | None,
+) -> AsyncIterator[AsyncApi]:
+    """Async counterpart of `_use_api`."""
+    if api is not None:
+        yield api
+        return
+    async with AsyncApi(currency=currency, proxy_url=proxy_url) as temporary_api:
+        yield temporary_api
+
+
+def _resolve_room(
+    room_url: str | None,
+    room_id: str | None,
+    domain: str,
+    base_url: str = HOMEPAGE_URL,
+) -> tuple[str, str]:
+    if room_url is None and room_id is None:
+        raise ValueError("Either room_url or room_id must be provided.")
+
+    # a client pointed away from airbnb.com, e.g. at a replay server, serves
+    # the room pages too
+    origin = f"https://{domain}" if base_url == HOMEPAGE_URL else base_url
+    _room_url = room_url or f"{origin}/rooms/{room_id}"
+    _room_id = room_id or urlparse(_room_url).path.split("/")[-1]
+    return _room_url, _room_id
+
+
+def _resolve_include(
+    include: Collection[str] | None,
+    sections: Collection[str] | None,
+) -> tuple[frozenset[str], Collection[str] | None]:
+    """Validates `include` and adds the host section the host fetch needs."""
+    if include is None:
+        return DETAIL_FETCHES, sections
+    include = frozenset(include)
+    unknown = include - DETAIL_FETCHES
+    if unknown:
+        raise ValueError(f"Unknown detail fetches: {sorted(unknown)}")
+    if "host" in include and sections is not None:
+        sections = {*sections, "host"}
+    return include, sections
 
 
 def get_details(
@@ -15,43 +91,82 @@ def get_details(
     check_in: str | None = None,
     check_out: str | None = None,
     proxy_url: str | None = None,
-) -> dict:
+    api: Api | None = None,
+    reviews_concurrency: int = 1,
+    typed: bool = False,
+    include: Collection[str] | None = None,
+    sections: Collection[str] | None = None,
+) -> dict | DetailRecord:
     """
     Retrieves all details (calendar, reviews, price, and host details) for a specified room.
 
     Args:
         room_url (str): The room URL (optional if room_id is provided).
         room_id (int): The room ID (optional if room_url is provided).
-        domain (str): The domain (default is 'www.airbnb.com').
+        domain (str): The domain (default is 'www.airbnb.com'); room IDs are
+            loaded from the `base_url` of an `api` pointed elsewhere instead.
         currency (str): Currency for pricing information.
         check_in (str): Check-in date for price information.
         check_out (str): Check-out date for price information.
         proxy_url (str): Proxy URL.
+        api (Api): Existing client to reuse; currency and proxy_url are ignored if given.
+        reviews_concurrency (int): Review pages fetched in parallel (1 fetches them one by one).
+        typed (bool): Return a `records.DetailRecord` instead of a dict.
+        include (Collection[str]): Requests to make after the room page, out of
+            `DETAIL_FETCHES`; None makes all of them. Skipped ones are left out.
+        sections (Collection[str]): `standardize.DETAIL_SECTIONS` to build from
+            the room page; None builds all of them.
 
     Returns:
         dict: A dictionary with all room details.
     """
-    if room_url is None and room_id is None:
-        raise ValueError("Either room_url or room_id must be provided.")
+    include, sections = _resolve_include(include, sections)
 
-    _room_url = room_url or f"https://{domain}/rooms/{room_id}"
-    _room_id = room_id or urlparse(_room_url).path.split("/")[-1]
+    with _use_api(api, currency, proxy_url) as api:
+        _room_url, _room_id = _resolve_room(room_url, room_id, domain, api.base_url)
+        return _get_details(
+            api,
+            _room_url,
+            _room_id,
+            domain,
+            check_in,
+            check_out,
+            reviews_concurrency,
+            typed,
+            include,
+            sections,
+        )
 
-    api = Api(
-        currency=currency,
-        proxy_url=proxy_url,
-    )
-    data, price_input, cookies = api.get_details(_room_url)
+
+def _get_details(
+    api: Api,
+    room_url: str,
+    room_id: str,
+    domain: str,
+    check_in: str | None,
+    check_out: str | None,
+    reviews_concurrency: int,
+    typed: bool = False,
+    include: Collection[str] = DETAIL_FETCHES,
+    sections: Collection[str] | None = None,
+) -> dict | DetailRecord:
+    data, price_input, cookies = api.get_details(room_url, sections)
     cookies = Cookies(cookies.get_dict(domain=reach(domain)))
 
     product_id = price_input["product_id"]
 
     # Get calendar and reviews data
-    data["calendar"] = api.get_calendar(_room_id)
-    data["reviews"] = api.get_reviews(product_id)
+    if "calendar" in include:
+        data["calendar"] = api.get_calendar(room_id)
+    if "reviews" in include:
+        data["reviews"] = api.get_reviews(
+            product_id,
+            review_count=data["rating"]["review_count"],
+            concurrency=reviews_concurrency,
+        )
 
     # Get price data if check-in and check-out dates are provided
-    if check_in and check_out:
+    if "price" in include and check_in and check_out:
         price_data = api.get_price(
             product_id,
             price_input["impression_id"],
@@ -62,10 +177,374 @@ def get_details(
         data["price"] = price_data
 
     # Get host details
-    host_id = data["host"]["id"]
-    data["host_details"] = api.get_host_details(host_id, cookies)
+    if "host" in include:
+        host_id = data["host"]["id"]
+        data["host_details"] = api.get_host_details(host_id, cookies)
 
-    return data
+    return DetailRecord.from_dict(data) if typed else data
+
+
+def get_prices(
+    currency: str,
+    date_ranges: Iterable[tuple[str, str]],
+    room_url: str | None = None,
+    room_id: str | None = None,
+    domain: str = "www.airbnb.com",
+    proxy_url: str | None = None,
+    api: Api | None = None,
+    concurrency: int = 4,
+) -> list[dict]:
+    """
+    Retrieves a price table of a room over many check-in/check-out pairs.
+
+    The room page is loaded once for the impression ID and cookies that all
+    quotes reuse; see `Api.get_prices` for the shape of the rows.
+
+    Args:
+        currency (str): Currency for pricing information.
+        date_ranges (Iterable): (check_in, check_out) pairs.
+        room_url (str): The room URL (optional if room_id is provided).
+        room_id (int): The room ID (optional if room_url is provided).
+        domain (str): The domain (default is 'www.airbnb.com'); room IDs are
+            loaded from the `base_url` of an `api` pointed elsewhere instead.
+        proxy_url (str): Proxy URL.
+        api (Api): Existing client to reuse; currency and proxy_url are ignored if given.
+        concurrency (int): Maximum number of quotes fetched at the same time.
+
+    Returns:
+        list: One price row per date range, in input order.
+    """
+    with _use_api(api, currency, proxy_url) as api:
+        _room_url, _ = _resolve_room(room_url, room_id, domain, api.base_url)
+        _, _, price_input, cookies = api.get_details_view(_room_url)
+        return api.get_prices(
+            price_input["product_id"],
+            price_input["impression_id"],
+            Cookies(cookies.get_dict(domain=reach(domain))),
+            date_ranges,
+            concurrency,
+        )
+
+
+@dataclass
+class DetailsBatchStats:
+    """Counters of a `get_details_many` batch, updated while it runs."""
+
+    rooms_fetched: int = 0
+    rooms_failed: int = 0
+    # host profile requests answered by the host cache or a concurrent fetch
+    host_calls_saved: int = 0
+
+
+def get_details_many(
+    room_ids: Iterable[str],
+    currency: str,
+    domain: str = "www.airbnb.com",
+    check_in: str | None = None,
+    check_out: str | None = None,
+    proxy_url: str | None = None,
+    api: Api | None = None,
+    concurrency: int = 8,
+    reviews_concurrency: int = 1,
+    typed: bool = False,
+    stats: DetailsBatchStats | None = None,
+    include: Collection[str] | None = None,
+    sections: Collection[str] | None = None,
+) -> Iterator[tuple[str, dict | DetailRecord | Exception]]:
+    """
+    Retrieves the details of many rooms in parallel over one shared Api.
+
+    Results are yielded as each room completes, not in input order. A failing
+    room, including one whose ID cannot be turned into a room URL, yields its
+    exception instead of aborting the batch. Room IDs are read
+    lazily and at most `concurrency` rooms are in flight at once, so neither
+    the input nor the results need to fit in memory.
+
+    Host profiles are fetched once per host through the Api's `host_cache`;
+    the temporary Api created when `api` is not given always has one, while
+    a given `api` is used with whatever host cache it was created with.
+
+    Args:
+        room_ids (Iterable[str]): Room IDs to fetch.
+        domain (str): The domain (default is 'www.airbnb.com'); room IDs are
+            loaded from the `base_url` of an `api` pointed elsewhere instead.
+        currency (str): Currency for pricing information.
+        check_in (str): Check-in date for price information.
+        check_out (str): Check-out date for price information.
+        proxy_url (str): Proxy URL.
+        api (Api): Existing client to reuse; currency and proxy_url are ignored if given.
+        concurrency (int): Maximum number of rooms fetched at the same time.
+        reviews_concurrency (int): Review pages fetched in parallel per room.
+        typed (bool): Yield `records.DetailRecord` objects instead of dicts.
+        include (Collection[str]): Requests to make per room, as in `get_details`.
+        sections (Collection[str]): Room page sections to build, as in `get_details`.
+        stats (DetailsBatchStats): Optional counters to update while the batch runs.
+
+    Yields:
+        tuple: The room ID and either its details dict or the raised exception.
+    """
+    if stats is None:
+        stats = DetailsBatchStats()
+    include, sections = _resolve_include(include, sections)
+    room_ids_iter = iter(room_ids)
+    host_cache = HostCache() if api is None else None
+    with _use_api(api, currency, proxy_url, host_cache=host_cache) as api:
+        saved_at_start = api.host_cache.saved_calls if api.host_cache else 0
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        pending: dict[Future, str] = {}
+
+        def get_room_details(room_id: str) -> dict | DetailRecord:
+            room_url, room_id = _resolve_room(None, room_id, domain, api.base_url)
+            return _get_details(
+                api,
+                room_url,
+                room_id,
+                domain,
+                check_in,
+                check_out,
+                reviews_concurrency,
+                typed,
+                include,
+                sections,
+            )
+
+        def submit(room_ids_batch: Iterable[str]) -> None:
+            for room_id in room_ids_batch:
+                pending[executor.submit(get_room_details, room_id)] = room_id
+
+        try:
+            submit(islice(room_ids_iter, concurrency))
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    room_id = pending.pop(future)
+                    error = future.exception()
+                    if error is None:
+                        stats.rooms_fetched += 1
+                    else:
+                        stats.rooms_failed += 1
+                    if api.host_cache is not None:
+                        stats.host_calls_saved = (
+                            api.host_cache.saved_calls - saved_at_start
+                        )
+                    yield room_id, future.result() if error is None else error
+                submit(islice(room_ids_iter, len(done)))
+        finally:
+            executor.shutdown(cancel_futures=True)
+            api.close_finished_threads()
+
+
+async def async_get_details(
+    currency: str,
+    room_url: str | None = None,
+    room_id: str | None = None,
+    domain: str = "www.airbnb.com",
+    check_in: str | None = None,
+    check_out: str | None = None,
+    proxy_url: str | None = None,
+    api: AsyncApi | None = None,
+    reviews_concurrency: int = 1,
+    typed: bool = False,
+    include: Collection[str] | None = None,
+    sections: Collection[str] | None = None,
+) -> dict | DetailRecord:
+    """
+    Async version of `get_details`.
+
+    Once the room page has been parsed, the calendar, reviews, price and host
+    details requests run concurrently, so latency is bounded by the slowest of
+    them rather than their sum.
+
+    Args:
+        room_url (str): The room URL (optional if room_id is provided).
+        room_id (int): The room ID (optional if room_url is provided).
+        domain (str): The domain (default is 'www.airbnb.com'); room IDs are
+            loaded from the `base_url` of an `api` pointed elsewhere instead.
+        currency (str): Currency for pricing information.
+        check_in (str): Check-in date for price information.
+        check_out (str): Check-out date for price information.
+        proxy_url (str): Proxy URL.
+        api (AsyncApi): Existing client to reuse; currency and proxy_url are ignored if given.
+        reviews_concurrency (int): Review pages fetched in parallel (1 fetches them one by one).
+        typed (bool): Return a `records.DetailRecord` instead of a dict.
+        include (Collection[str]): Requests to make after the room page, out of
+            `DETAIL_FETCHES`; None makes all of them. Skipped ones are left out.
+        sections (Collection[str]): `standardize.DETAIL_SECTIONS` to build from
+            the room page; None builds all of them.
+
+    Returns:
+        dict: A dictionary with all room details.
+    """
+    include, sections = _resolve_include(include, sections)
+
+    async with _use_async_api(api, currency, proxy_url) as api:
+        _room_url, _room_id = _resolve_room(room_url, room_id, domain, api.base_url)
+        return await _async_get_details(
+            api,
+            _room_url,
+            _room_id,
+            domain,
+            check_in,
+            check_out,
+            reviews_concurrency,
+            typed,
+            include,
+            sections,
+        )
+
+
+async def _async_get_details(
+    api: AsyncApi,
+    room_url: str,
+    room_id: str,
+    domain: str,
+    check_in: str | None,
+    check_out: str | None,
+    reviews_concurrency: int,
+    typed: bool = False,
+    include: Collection[str] = DETAIL_FETCHES,
+    sections: Collection[str] | None = None,
+) -> dict | DetailRecord:
+    data, price_input, cookies = await api.get_details(room_url, sections)
+    cookies = Cookies(cookies.get_dict(domain=reach(domain)))
+
+    product_id = price_input["product_id"]
+
+    requests = {}
+    if "calendar" in include:
+        requests["calendar"] = api.get_calendar(room_id)
+    if "reviews" in include:
+        requests["reviews"] = api.get_reviews(
+            product_id,
+            review_count=data["rating"]["review_count"],
+            concurrency=reviews_concurrency,
+        )
+    if "price" in include and check_in and check_out:
+        requests["price"] = api.get_price(
+            product_id,
+            price_input["impression_id"],
+            cookies,
+            check_in,
+            check_out,
+        )
+    if "host" in include:
+        requests["host_details"] = api.get_host_details(data["host"]["id"], cookies)
+
+    results = await asyncio.gather(*requests.values())
+    data.update(zip(requests, results))
+
+    return DetailRecord.from_dict(data) if typed else data
+
+
+class SearchPage(NamedTuple):
+    """One page of search results and the cursors around it."""
+
+    results: list
+    cursor: str
+    next_cursor: str | None
+
+
+def iter_search_pages(
+    check_in: str,
+    check_out: str,
+    ne_lat: float,
+    ne_long: float,
+    sw_lat: float,
+    sw_long: float,
+    zoom_value: int,
+    currency: str,
+    proxy_url: str | None = None,
+    api: Api | None = None,
+    cursor: str = "",
+    typed: bool = False,
+    include_map: bool = True,
+) -> Iterator[SearchPage]:
+    """
+    Yields standardized search results page by page as each response arrives.
+
+    Each page carries the cursor it was fetched with and the cursor of the
+    next page, so an interrupted crawl can be resumed by passing the last
+    `next_cursor` back as `cursor`.
+
+    Args:
+        check_in (str): Check-in date.
+        check_out (str): Check-out date.
+        ne_lat (float): Latitude of northeast corner.
+        ne_long (float): Longitude of northeast corner.
+        sw_lat (float): Latitude of southwest corner.
+        sw_long (float): Longitude of southwest corner.
+        zoom_value (int): Zoom level.
+        currency (str): Currency for pricing information.
+        proxy_url (str): Proxy URL.
+        api (Api): Existing client to reuse; currency and proxy_url are ignored if given.
+        cursor (str): Cursor of the page to start from (default is the first page).
+        typed (bool): Return `records.SearchListing` objects instead of dicts.
+        include_map (bool): Ask for the map pins too; turning it off shrinks responses.
+
+    Yields:
+        SearchPage: The page's results with its cursor and the next one.
+    """
+    with _use_api(api, currency, proxy_url) as api:
+        while True:
+            results_raw = api.get_search(
+                check_in,
+                check_out,
+                ne_lat,
+                ne_long,
+                sw_lat,
+                sw_long,
+                zoom_value,
+                cursor,
+                include_map,
+            )
+            results = standardize.from_search(
+                results_raw.get("searchResults", []), typed
+            )
+            next_cursor = get_nested_value(results_raw, "paginationInfo.nextPageCursor")
+            if not results:
+                next_cursor = None
+            yield SearchPage(results, cursor, next_cursor)
+            if next_cursor is None:
+                break
+            cursor = next_cursor
+
+
+def iter_search(
+    check_in: str,
+    check_out: str,
+    ne_lat: float,
+    ne_long: float,
+    sw_lat: float,
+    sw_long: float,
+    zoom_value: int,
+    currency: str,
+    proxy_url: str | None = None,
+    api: Api | None = None,
+    cursor: str = "",
+    typed: bool = False,
+    include_map: bool = True,
+) -> Iterator[dict | SearchListing]:
+    """
+    Yields standardized search results one by one, fetching pages on demand.
+
+    Takes the same arguments as `iter_search_pages`.
+    """
+    for page in iter_search_pages(
+        check_in,
+        check_out,
+        ne_lat,
+        ne_long,
+        sw_lat,
+        sw_long,
+        zoom_value,
+        currency,
+        proxy_url,
+        api,
+        cursor,
+        typed,
+        include_map,
+    ):
+        yield from page.results
 
 
 def search_all(
@@ -78,10 +557,15 @@ def search_all(
     zoom_value: int,
     currency: str,
     proxy_url: str | None = None,
+    api: Api | None = None,
+    typed: bool = False,
+    include_map: bool = True,
 ) -> list:
     """
     Performs a paginated search for all rooms within specified geographic bounds.
 
+    Use `iter_search` to process results while the search is still running.
+
     Args:
         check_in (str): Check-in date.
         check_out (str): Check-out date.
@@ -92,19 +576,15 @@ def search_all(
         zoom_value (int): Zoom level.
         currency (str): Currency for pricing information.
         proxy_url (str): Proxy URL.
+        api (Api): Existing client to reuse; currency and proxy_url are ignored if given.
+        typed (bool): Return `records.SearchListing` objects instead of dicts.
+        include_map (bool): Ask for the map pins too; turning it off shrinks responses.
 
     Returns:
         list: A list of all search results.
     """
-    api = Api(
-        currency=currency,
-        proxy_url=proxy_url,
-    )
-
-    all_results = []
-    cursor = ""
-    while True:
-        results_raw = api.get_search(
+    return list(
+        iter_search(
             check_in,
             check_out,
             ne_lat,
@@ -112,18 +592,13 @@ def search_all(
             sw_lat,
             sw_long,
             zoom_value,
-            cursor,
+            currency,
+            proxy_url,
+            api,
+            typed=typed,
+            include_map=include_map,
         )
-        results = standardize.from_search(results_raw.get("searchResults", []))
-        all_results.extend(results)
-        if (
-            not results
-            or "nextPageCursor" not in results_raw["paginationInfo"]
-            or results_raw["paginationInfo"]["nextPageCursor"] is None
-        ):
-            break
-        cursor = results_raw["paginationInfo"]["nextPageCursor"]
-    return all_results
+    )
 
 
 def search_first_page(
@@ -136,6 +611,9 @@ def search_first_page(
     zoom_value: int,
     currency: str,
     proxy_url: str | None = None,
+    api: Api | None = None,
+    typed: bool = False,
+    include_map: bool = True,
 ) -> list:
     """
     Searches the first page of results within specified geographic bounds.
@@ -150,16 +628,14 @@ def search_first_page(
         zoom_value (int): Zoom level.
         currency (str): Currency for pricing information.
         proxy_url (str): Proxy URL.
+        api (Api): Existing client to reuse; currency and proxy_url are ignored if given.
+        typed (bool): Return `records.SearchListing` objects instead of dicts.
+        include_map (bool): Ask for the map pins too; turning it off shrinks responses.
 
     Returns:
         list: A list of search results from the first page.
     """
-    api = Api(
-        currency=currency,
-        proxy_url=proxy_url,
-    )
-
-    results_raw = api.get_search(
+    pages = iter_search_pages(
         check_in,
         check_out,
         ne_lat,
@@ -167,6 +643,11 @@ def search_first_page(
         sw_lat,
         sw_long,
         zoom_value,
+        currency,
+        proxy_url,
+        api,
+        typed=typed,
+        include_map=include_map,
     )
-
-    return standardize.from_search(results_raw)
+    with closing(pages):
+        return next(pages).results
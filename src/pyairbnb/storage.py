@@ -0,0 +1,448 @@
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from typing import Any
+
+from pyairbnb import jsonlib
+from pyairbnb.records import DetailRecord, SearchListing
+
+DEFAULT_BATCH_SIZE = 1_000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS listings (
+    room_id TEXT PRIMARY KEY,
+    host_id TEXT,
+    name TEXT,
+    title TEXT,
+    room_type TEXT,
+    latitude REAL,
+    longitude REAL,
+    rating REAL,
+    review_count INTEGER,
+    price_total REAL,
+    currency_symbol TEXT,
+    search BLOB,
+    details BLOB,
+    search_fetched_at REAL,
+    details_fetched_at REAL
+);
+CREATE INDEX IF NOT EXISTS listings_host_id ON listings (host_id);
+CREATE INDEX IF NOT EXISTS listings_search_fetched_at ON listings (search_fetched_at);
+CREATE INDEX IF NOT EXISTS listings_details_fetched_at
+    ON listings (details_fetched_at);
+
+CREATE TABLE IF NOT EXISTS calendar_days (
+    room_id TEXT NOT NULL,
+    date TEXT NOT NULL,
+    available INTEGER,
+    min_nights INTEGER,
+    max_nights INTEGER,
+    body BLOB NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (room_id, date)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS calendar_days_date ON calendar_days (date, available);
+
+CREATE TABLE IF NOT EXISTS reviews (
+    review_id TEXT PRIMARY KEY,
+    room_id TEXT NOT NULL,
+    created_at TEXT,
+    rating INTEGER,
+    body BLOB NOT NULL,
+    fetched_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS reviews_room_id ON reviews (room_id, created_at);
+
+CREATE TABLE IF NOT EXISTS hosts (
+    host_id TEXT PRIMARY KEY,
+    body BLOB NOT NULL,
+    fetched_at REAL NOT NULL
+);
+"""
+
+UPSERT_SEARCH = """
+INSERT INTO listings (
+    room_id, name, title, latitude, longitude, rating, review_count,
+    price_total, currency_symbol, search, search_fetched_at
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (room_id) DO UPDATE SET
+    name = excluded.name,
+    title = excluded.title,
+    latitude = excluded.latitude,
+    longitude = excluded.longitude,
+    rating = excluded.rating,
+    review_count = excluded.review_count,
+    price_total = excluded.price_total,
+    currency_symbol = excluded.currency_symbol,
+    search = excluded.search,
+    search_fetched_at = excluded.search_fetched_at
+"""
+
+UPSERT_DETAILS = """
+INSERT INTO listings (
+    room_id, host_id, title, room_type, latitude, longitude, review_count,
+    details, details_fetched_at
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (room_id) DO UPDATE SET
+    host_id = excluded.host_id,
+    title = coalesce(excluded.title, listings.title),
+    room_type = excluded.room_type,
+    latitude = excluded.latitude,
+    longitude = excluded.longitude,
+    review_count = excluded.review_count,
+    details = excluded.details,
+    details_fetched_at = excluded.details_fetched_at
+"""
+
+UPSERT_CALENDAR_DAY = """
+INSERT OR REPLACE INTO calendar_days VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+UPSERT_REVIEW = """
+INSERT OR REPLACE INTO reviews VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+UPSERT_HOST = """
+INSERT OR REPLACE INTO hosts VALUES (?, ?, ?)
+"""
+
+# details keys kept in their own tables rather than in the listing row
+DETAIL_CHILD_KEYS = ("calendar", "reviews", "host_details")
+
+
+def _batches(rows: Iterable[tuple], batch_size: int) -> Iterator[list[tuple]]:
+    rows = iter(rows)
+    while batch := list(islice(rows, batch_size)):
+        yield batch
+
+
+def _search_row(listing: dict | SearchListing, fetched_at: float) -> tuple:
+    if isinstance(listing, SearchListing):
+        listing = listing.to_dict()
+    coordinates = listing.get("coordinates", {})
+    rating = listing.get("rating", {})
+    total = listing.get("price", {}).get("total", {})
+    return (
+        str(listing["room_id"]),
+        listing.get("name"),
+        listing.get("title"),
+        coordinates.get("latitude"),
+        coordinates.get("longitud"),
+        rating.get("value"),
+        rating.get("reviewCount"),
+        total.get("amount"),
+        total.get("currency_symbol"),
+        jsonlib.dumps(listing),
+        fetched_at,
+    )
+
+
+class ListingStore:
+    """
+    SQLite store for everything pyairbnb fetches about listings.
+
+    Search listings and room details share the `listings` table, keyed by
+    room ID and indexed by host; each kind of upsert only touches its own
+    columns and timestamp, so a search re-run keeps the details fetched
+    earlier. Calendars are kept per day, reviews per review ID and host
+    profiles per host ID, each with the time it was fetched. The scalar
+    columns are there for indexed queries; the full standardized data is
+    kept alongside as JSON.
+
+    Every upsert runs in a single transaction, written in batches of
+    `batch_size` rows, so a crash never leaves a half-written call behind.
+
+    Args:
+        path (str): SQLite database file; ':memory:' keeps the store in-process.
+        batch_size (int): Rows handed to SQLite per executemany.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike = ":memory:",
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path,
+            timeout=30,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        if path != ":memory:":
+            self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> "ListingStore":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _write(self, statements: Iterable[tuple[str, Iterable[tuple]]]) -> int:
+        """Runs every (sql, rows) pair in one transaction and returns the row count."""
+        count = 0
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                for sql, rows in statements:
+                    for batch in _batches(rows, self.batch_size):
+                        self._connection.executemany(sql, batch)
+                        count += len(batch)
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+        return count
+
+    def upsert_search(
+        self,
+        listings: Iterable[dict | SearchListing],
+        fetched_at: float | None = None,
+    ) -> int:
+        """
+        Stores search listings, e.g. the output of `standardize.from_search`.
+
+        Returns:
+            int: The number of listings written.
+        """
+        fetched_at = time.time() if fetched_at is None else fetched_at
+        rows = (_search_row(listing, fetched_at) for listing in listings)
+        return self._write([(UPSERT_SEARCH, rows)])
+
+    def upsert_details(
+        self,
+        room_id: str,
+        details: dict | DetailRecord,
+        fetched_at: float | None = None,
+    ) -> None:
+        """
+        Stores what `start.get_details` returns for a room.
+
+        The calendar, reviews and host profile, when present, go to their own
+        tables in the same transaction.
+        """
+        if isinstance(details, DetailRecord):
+            details = details.to_dict()
+        room_id = str(room_id)
+        fetched_at = time.time() if fetched_at is None else fetched_at
+        host_id = details.get("host", {}).get("id") or None
+        coordinates = details.get("coordinates", {})
+        listing = {
+            key: value for key, value in details.items() if key not in DETAIL_CHILD_KEYS
+        }
+        statements = [
+            (
+                UPSERT_DETAILS,
+                [
+                    (
+                        room_id,
+                        host_id,
+                        details.get("title"),
+                        details.get("room_type"),
+                        coordinates.get("latitude"),
+                        coordinates.get("longitude"),
+                        details.get("rating", {}).get("review_count"),
+                        jsonlib.dumps(listing),
+                        fetched_at,
+                    )
+                ],
+            )
+        ]
+        if details.get("calendar") is not None:
+            statements.append(
+                (
+                    UPSERT_CALENDAR_DAY,
+                    self._calendar_rows(room_id, details["calendar"], fetched_at),
+                )
+            )
+        if details.get("reviews") is not None:
+            statements.append(
+                (
+                    UPSERT_REVIEW,
+                    self._review_rows(room_id, details["reviews"], fetched_at),
+                )
+            )
+        if host_id is not None and details.get("host_details") is not None:
+            statements.append(
+                (
+                    UPSERT_HOST,
+                    [(host_id, jsonlib.dumps(details["host_details"]), fetched_at)],
+                )
+            )
+        self._write(statements)
+
+    @staticmethod
+    def _calendar_rows(
+        room_id: str,
+        calendar_months: Iterable[dict],
+        fetched_at: float,
+    ) -> Iterator[tuple]:
+        for calendar_month in calendar_months:
+            for day in calendar_month.get("days", []):
+                available = day.get("available")
+                yield (
+                    room_id,
+                    day["calendarDate"],
+                    None if available is None else int(available),
+                    day.get("minNights"),
+                    day.get("maxNights"),
+                    jsonlib.dumps(day),
+                    fetched_at,
+                )
+
+    @staticmethod
+    def _review_rows(
+        room_id: str,
+        reviews: Iterable[dict],
+        fetched_at: float,
+    ) -> Iterator[tuple]:
+        for review in reviews:
+            yield (
+                str(review["id"]),
+                room_id,
+                review.get("createdAt"),
+                review.get("rating"),
+                jsonlib.dumps(review),
+                fetched_at,
+            )
+
+    def upsert_calendar(
+        self,
+        room_id: str,
+        calendar_months: Iterable[dict],
+        fetched_at: float | None = None,
+    ) -> int:
+        """Stores the months returned by `Api.get_calendar`, one row per day."""
+        fetched_at = time.time() if fetched_at is None else fetched_at
+        rows = self._calendar_rows(str(room_id), calendar_months, fetched_at)
+        return self._write([(UPSERT_CALENDAR_DAY, rows)])
+
+    def upsert_reviews(
+        self,
+        room_id: str,
+        reviews: Iterable[dict],
+        fetched_at: float | None = None,
+    ) -> int:
+        """Stores reviews returned by `Api.get_reviews`, keyed by review ID."""
+        fetched_at = time.time() if fetched_at is None else fetched_at
+        rows = self._review_rows(str(room_id), reviews, fetched_at)
+        return self._write([(UPSERT_REVIEW, rows)])
+
+    def upsert_host(
+        self,
+        host_id: str,
+        profile: Any,
+        fetched_at: float | None = None,
+    ) -> None:
+        """Stores a host profile returned by `Api.get_host_details`."""
+        fetched_at = time.time() if fetched_at is None else fetched_at
+        self._write(
+            [(UPSERT_HOST, [(str(host_id), jsonlib.dumps(profile), fetched_at)])]
+        )
+
+    def _query(self, sql: str, parameters: tuple = ()) -> list[tuple]:
+        with self._lock:
+            return self._connection.execute(sql, parameters).fetchall()
+
+    def listing(self, room_id: str) -> dict[str, Any] | None:
+        """
+        Returns what is stored about a room.
+
+        Returns:
+            dict: The "search" and "details" data (None if never stored) with
+            their fetch times, or None if the room is unknown.
+        """
+        rows = self._query(
+            "SELECT search, details, search_fetched_at, details_fetched_at"
+            " FROM listings WHERE room_id = ?",
+            (str(room_id),),
+        )
+        if not rows:
+            return None
+        search, details, search_fetched_at, details_fetched_at = rows[0]
+        return {
+            "search": None if search is None else jsonlib.loads(search),
+            "details": None if details is None else jsonlib.loads(details),
+            "search_fetched_at": search_fetched_at,
+            "details_fetched_at": details_fetched_at,
+        }
+
+    def room_ids_by_host(self, host_id: str) -> list[str]:
+        rows = self._query(
+            "SELECT room_id FROM listings WHERE host_id = ? ORDER BY room_id",
+            (str(host_id),),
+        )
+        return [room_id for (room_id,) in rows]
+
+    def stale_room_ids(self, max_age: float, now: float | None = None) -> list[str]:
+        """
+        Returns the rooms whose details are missing or older than `max_age`.
+
+        Feed them back to `start.get_details_many` for an incremental crawl.
+        """
+        now = time.time() if now is None else now
+        rows = self._query(
+            "SELECT room_id FROM listings"
+            " WHERE details_fetched_at IS NULL OR details_fetched_at < ?"
+            " ORDER BY room_id",
+            (now - max_age,),
+        )
+        return [room_id for (room_id,) in rows]
+
+    def calendar(
+        self,
+        room_id: str,
+        start: str | None = None,
+        end: str | None = None,
+    ) -> list[dict]:
+        """Returns the stored days of a room between two ISO dates, inclusive."""
+        rows = self._query(
+            "SELECT body FROM calendar_days WHERE room_id = ?"
+            " AND date >= coalesce(?, date) AND date <= coalesce(?, date)"
+            " ORDER BY date",
+            (str(room_id), start, end),
+        )
+        return [jsonlib.loads(body) for (body,) in rows]
+
+    def available_room_ids(self, date: str) -> list[str]:
+        """Returns the rooms stored as available on an ISO date."""
+        rows = self._query(
+            "SELECT room_id FROM calendar_days WHERE date = ? AND available = 1"
+            " ORDER BY room_id",
+            (date,),
+        )
+        return [room_id for (room_id,) in rows]
+
+    def reviews(self, room_id: str, since: str | None = None) -> list[dict]:
+        """Returns the stored reviews of a room created after `since`, newest first."""
+        rows = self._query(
+            "SELECT body FROM reviews WHERE room_id = ?"
+            " AND (? IS NULL OR created_at > ?) ORDER BY created_at DESC",
+            (str(room_id), since, since),
+        )
+        return [jsonlib.loads(body) for (body,) in rows]
+
+    def host(self, host_id: str) -> Any | None:
+        rows = self._query(
+            "SELECT body FROM hosts WHERE host_id = ?",
+            (str(host_id),),
+        )
+        return jsonlib.loads(rows[0][0]) if rows else None
+
+    def fetched_at(self, room_id: str) -> tuple[float | None, float | None]:
+        """Returns when the search listing and the details of a room were stored."""
+        rows = self._query(
+            "SELECT search_fetched_at, details_fetched_at FROM listings"
+            " WHERE room_id = ?",
+            (str(room_id),),
+        )
+        return rows[0] if rows else (None, None)
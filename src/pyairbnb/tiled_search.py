@@ -0,0 +1,232 @@
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import NamedTuple
+
+from pyairbnb.api import Api
+from pyairbnb.records import SearchListing
+from pyairbnb.start import _use_api, iter_search_pages
+
+# Airbnb stops paginating a map query at roughly this many listings
+DEFAULT_TILE_SATURATION = 270
+DEFAULT_MAX_DEPTH = 6
+
+
+class Tile(NamedTuple):
+    """A search bounding box and its depth in the quadtree."""
+
+    ne_lat: float
+    ne_long: float
+    sw_lat: float
+    sw_long: float
+    zoom_value: int
+    depth: int = 0
+
+    def split(self) -> list["Tile"]:
+        """Splits the tile into four quadrants, one zoom level closer."""
+        mid_lat = (self.ne_lat + self.sw_lat) / 2
+        mid_long = (self.ne_long + self.sw_long) / 2
+        zoom_value = self.zoom_value + 1
+        depth = self.depth + 1
+        return [
+            Tile(self.ne_lat, self.ne_long, mid_lat, mid_long, zoom_value, depth),
+            Tile(self.ne_lat, mid_long, mid_lat, self.sw_long, zoom_value, depth),
+            Tile(mid_lat, self.ne_long, self.sw_lat, mid_long, zoom_value, depth),
+            Tile(mid_lat, mid_long, self.sw_lat, self.sw_long, zoom_value, depth),
+        ]
+
+
+@dataclass
+class TiledSearchStats:
+    """Coverage counters of a tiled search, updated while it runs."""
+
+    tiles_searched: int = 0
+    tiles_split: int = 0
+    # saturated tiles that could not be split further; listings may be missing
+    tiles_saturated: int = 0
+    # tiles whose search raised; their listings are missing
+    tiles_failed: int = 0
+    pages_fetched: int = 0
+    results_seen: int = 0
+    unique_results: int = 0
+    max_depth_reached: int = 0
+    # (tile, exception) of every failed tile, to search again later
+    failed_tiles: list[tuple[Tile, BaseException]] = field(default_factory=list)
+
+    @property
+    def duplicates(self) -> int:
+        return self.results_seen - self.unique_results
+
+    @property
+    def complete(self) -> bool:
+        return self.tiles_saturated == 0 and self.tiles_failed == 0
+
+
+def _search_tile(
+    api: Api,
+    tile: Tile,
+    check_in: str,
+    check_out: str,
+    typed: bool,
+) -> tuple[list, int]:
+    results: list = []
+    pages = 0
+    for page in iter_search_pages(
+        check_in,
+        check_out,
+        tile.ne_lat,
+        tile.ne_long,
+        tile.sw_lat,
+        tile.sw_long,
+        tile.zoom_value,
+        api.currency,
+        api=api,
+        typed=typed,
+    ):
+        results.extend(page.results)
+        pages += 1
+    return results, pages
+
+
+def iter_search_tiled(
+    check_in: str,
+    check_out: str,
+    ne_lat: float,
+    ne_long: float,
+    sw_lat: float,
+    sw_long: float,
+    zoom_value: int,
+    currency: str,
+    proxy_url: str | None = None,
+    api: Api | None = None,
+    concurrency: int = 4,
+    saturation: int = DEFAULT_TILE_SATURATION,
+    max_depth: int = DEFAULT_MAX_DEPTH,
+    stats: TiledSearchStats | None = None,
+    typed: bool = False,
+) -> Iterator[dict | SearchListing]:
+    """
+    Searches a large area by recursively splitting it into tiles.
+
+    Every tile is searched through all its pages. A tile returning at least
+    `saturation` listings is assumed to have hit Airbnb's per-query cap and
+    is split into four quadrants, which are searched in turn. Tiles are
+    searched concurrently over one shared Api, and listings are yielded once
+    per `room_id` as their tile completes. A tile whose search fails is
+    recorded in `stats.failed_tiles` and the rest of the crawl carries on.
+
+    Args:
+        check_in (str): Check-in date.
+        check_out (str): Check-out date.
+        ne_lat (float): Latitude of northeast corner.
+        ne_long (float): Longitude of northeast corner.
+        sw_lat (float): Latitude of southwest corner.
+        sw_long (float): Longitude of southwest corner.
+        zoom_value (int): Zoom level of the whole area; each split adds one.
+        currency (str): Currency for pricing information.
+        proxy_url (str): Proxy URL.
+        api (Api): Existing client to reuse; currency and proxy_url are ignored if given.
+        concurrency (int): Maximum number of tiles searched at the same time.
+        saturation (int): Result count at which a tile is split.
+        max_depth (int): Maximum number of splits below the whole area.
+        stats (TiledSearchStats): Optional counters to update with coverage statistics.
+        typed (bool): Yield `records.SearchListing` objects instead of dicts.
+
+    Yields:
+        dict: Standardized search results, without duplicates.
+    """
+    if stats is None:
+        stats = TiledSearchStats()
+    seen_room_ids: set[int] = set()
+    root = Tile(ne_lat, ne_long, sw_lat, sw_long, zoom_value)
+
+    with _use_api(api, currency, proxy_url) as api:
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        pending: dict[Future, Tile] = {}
+
+        def submit(tile: Tile) -> None:
+            future = executor.submit(
+                _search_tile, api, tile, check_in, check_out, typed
+            )
+            pending[future] = tile
+
+        try:
+            submit(root)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    tile = pending.pop(future)
+                    error = future.exception()
+                    if error is not None:
+                        stats.tiles_failed += 1
+                        stats.failed_tiles.append((tile, error))
+                        continue
+                    results, pages = future.result()
+                    stats.tiles_searched += 1
+                    stats.pages_fetched += pages
+                    stats.results_seen += len(results)
+                    stats.max_depth_reached = max(stats.max_depth_reached, tile.depth)
+                    if len(results) >= saturation:
+                        if tile.depth < max_depth:
+                            stats.tiles_split += 1
+                            for child in tile.split():
+                                submit(child)
+                        else:
+                            stats.tiles_saturated += 1
+
+                    for result in results:
+                        room_id = result.room_id if typed else result["room_id"]
+                        if room_id in seen_room_ids:
+                            continue
+                        seen_room_ids.add(room_id)
+                        stats.unique_results += 1
+                        yield result
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+
+def search_tiled(
+    check_in: str,
+    check_out: str,
+    ne_lat: float,
+    ne_long: float,
+    sw_lat: float,
+    sw_long: float,
+    zoom_value: int,
+    currency: str,
+    proxy_url: str | None = None,
+    api: Api | None = None,
+    concurrency: int = 4,
+    saturation: int = DEFAULT_TILE_SATURATION,
+    max_depth: int = DEFAULT_MAX_DEPTH,
+    typed: bool = False,
+) -> tuple[list, TiledSearchStats]:
+    """
+    Collects `iter_search_tiled` into a list.
+
+    Takes the same arguments as `iter_search_tiled`.
+
+    Returns:
+        tuple: The unique search results and the coverage statistics.
+    """
+    stats = TiledSearchStats()
+    results = list(
+        iter_search_tiled(
+            check_in,
+            check_out,
+            ne_lat,
+            ne_long,
+            sw_lat,
+            sw_long,
+            zoom_value,
+            currency,
+            proxy_url,
+            api,
+            concurrency,
+            saturation,
+            max_depth,
+            stats,
+            typed,
+        )
+    )
+    return results, stats
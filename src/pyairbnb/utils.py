@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 from typing import Any
 from urllib.parse import quote
 
@@ -12,18 +13,44 @@ def remove_space(value: str) -> str:
     return regex_space.sub(" ", value.strip())
 
 
+class KeyPath:
+    """
+    A dotted key path split once and reusable on any number of dicts.
+
+    `KeyPath("a.b").get(d, default)` behaves like
+    `get_nested_value(d, "a.b", default)`: a missing key, an empty dict or
+    None anywhere along the path yields `default`.
+    """
+
+    __slots__ = ("key_path", "keys")
+
+    def __init__(self, key_path: str):
+        self.key_path = key_path
+        self.keys = tuple(key_path.split("."))
+
+    def __repr__(self) -> str:
+        return f"KeyPath({self.key_path!r})"
+
+    def get(self, d: dict, default: Any = None) -> Any:
+        current = d
+        for key in self.keys:
+            current = current.get(key)
+            if current is None or (isinstance(current, dict) and not current):
+                return default
+        return current
+
+
+@lru_cache(maxsize=1024)
+def compile_key_path(key_path: str) -> KeyPath:
+    return KeyPath(key_path)
+
+
 def get_nested_value(
     d: dict,
     key_path: str,
     default: Any = None,
 ) -> Any:
-    keys = key_path.split(".")
-    current = d
-    for key in keys:
-        current = current.get(key, {})
-        if current == {} or current is None:
-            return default
-    return current
+    return compile_key_path(key_path).get(d, default)
 
 
 def parse_price_symbol(price_raw: str) -> tuple[float, str]:
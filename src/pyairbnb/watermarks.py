@@ -0,0 +1,84 @@
+import os
+import sqlite3
+import threading
+import time
+
+from pyairbnb.api import Api, ReviewWatermark
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS review_watermarks (
+    product_id TEXT PRIMARY KEY,
+    review_id TEXT NOT NULL,
+    created_at TEXT,
+    updated_at REAL NOT NULL
+);
+"""
+
+
+class ReviewWatermarks:
+    """
+    Remembers the most recent review seen per listing.
+
+    `fetch_new` asks `Api.get_reviews` for the reviews newer than the stored
+    watermark, which stops paginating at the first review already seen, or at
+    the first one no newer than it if that review has since been removed, and
+    moves the watermark to the newest review returned. A listing without a
+    watermark gets all its reviews on the first call.
+
+    Args:
+        path (str): SQLite database file; ':memory:' keeps watermarks in-process.
+    """
+
+    def __init__(self, path: str | os.PathLike = ":memory:"):
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path,
+            timeout=30,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        if path != ":memory:":
+            self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def get(self, product_id: str) -> str | None:
+        """Returns the ID of the newest review seen for the listing, if any."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT review_id FROM review_watermarks WHERE product_id = ?",
+                (product_id,),
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def get_watermark(self, product_id: str) -> ReviewWatermark | None:
+        """Returns the ID and creation time of the newest review seen, if any."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT review_id, created_at FROM review_watermarks"
+                " WHERE product_id = ?",
+                (product_id,),
+            ).fetchone()
+        return None if row is None else ReviewWatermark(*row)
+
+    def set(self, product_id: str, review: dict) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO review_watermarks VALUES (?, ?, ?, ?)",
+                (product_id, review["id"], review.get("createdAt"), time.time()),
+            )
+
+    def fetch_new(self, api: Api, product_id: str) -> list:
+        """
+        Fetches the reviews posted since the last call for this listing.
+
+        Returns:
+            list: The new reviews, most recent first.
+        """
+        reviews = api.get_reviews(product_id, since=self.get_watermark(product_id))
+        if reviews:
+            self.set(product_id, reviews[0])
+        return reviews
@@ -0,0 +1,39 @@
+import json
+
+from pyairbnb import cache
+from pyairbnb.cache import ResponseCache, make_cache_key
+
+
+def graphql_url(host: str) -> str:
+    variables = json.dumps({"id": "1", "p3ImpressionId": "abc"})
+    return (
+        f"https://{host}/api/v3/StaysPdpSections"
+        f"?operationName=StaysPdpSections&variables={variables}"
+    )
+
+
+def test_cache_key_depends_on_host():
+    live = make_cache_key(graphql_url("www.airbnb.com"))
+    replay = make_cache_key(graphql_url("127.0.0.1:8080"))
+    assert live[1] == replay[1] == "StaysPdpSections"
+    assert live[0] != replay[0]
+    assert live == make_cache_key(graphql_url("WWW.airbnb.com"))
+
+
+def test_eviction_keeps_total_under_budget():
+    response_cache = ResponseCache(max_bytes=1000)
+    for i in range(50):
+        response_cache.set(str(i), "StaysPdpSections", b"x" * 100)
+    stats = response_cache.stats()
+    assert stats["bytes"] <= 1000
+    assert stats["bytes"] == response_cache._bytes
+    assert response_cache.get("49") is not None
+    assert response_cache.get("0") is None
+
+
+def test_replacing_an_entry_updates_the_running_total(monkeypatch):
+    monkeypatch.setattr(cache, "EVICT_INTERVAL", 10**9)
+    response_cache = ResponseCache(max_bytes=1000)
+    response_cache.set("a", "StaysPdpSections", b"x" * 300)
+    response_cache.set("a", "StaysPdpSections", b"x" * 100)
+    assert response_cache._bytes == response_cache.stats()["bytes"] == 100
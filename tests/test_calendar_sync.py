@@ -0,0 +1,44 @@
+from pyairbnb import calendar_sync
+from pyairbnb.calendar_sync import CalendarSync
+
+
+class FakeApi:
+    def __init__(self):
+        self.calls = []
+
+    def get_calendar(self, room_id, month, year, count):
+        self.calls.append((month, year, count))
+        months = []
+        for i in range(count):
+            year_, month_ = calendar_sync._add_months(year, month, i)
+            days = [{"calendarDate": f"{year_}-{month_:02d}-01", "available": True}]
+            months.append({"month": month_, "year": year_, "days": days})
+        return months
+
+
+def test_daily_sync_fetches_only_near_months(monkeypatch):
+    api = FakeApi()
+    sync = CalendarSync(api, months=12, near_months=2)
+    now = 1_700_000_000.0
+    monkeypatch.setattr(calendar_sync.time, "time", lambda: now)
+
+    first = sync.sync("1")
+    assert first.months_fetched == 12
+
+    now += 24 * 60 * 60
+    second = sync.sync("1")
+    assert second.months_fetched == 2
+    assert second.requests == 1
+    assert api.calls[-1][2] == 2
+    assert second.changes == []
+
+
+def test_far_months_are_refetched_once_stale(monkeypatch):
+    api = FakeApi()
+    sync = CalendarSync(api, months=12, near_months=2)
+    now = 1_700_000_000.0
+    monkeypatch.setattr(calendar_sync.time, "time", lambda: now)
+
+    sync.sync("1")
+    now += calendar_sync.DEFAULT_FAR_MAX_AGE
+    assert sync.sync("1").months_fetched == 12
@@ -0,0 +1,20 @@
+import numpy as np
+from fixtures import make_search_results
+
+from pyairbnb import standardize
+from pyairbnb.columnar import NPY_STRING_LENGTH, write_columns
+
+
+def test_npy_string_columns_widen_to_the_longest_value(tmp_path):
+    listings = standardize.from_search(make_search_results(n=12))
+    categories = ["short", "x" * 77, "y" * 200]
+    for i, listing in enumerate(listings):
+        listing["category"] = categories[i * len(categories) // len(listings)]
+    path = tmp_path / "listings.npy"
+
+    assert write_columns(listings, path, format="npy", batch_size=5) == 12
+
+    rows = np.load(path)
+    assert rows.dtype["category"].itemsize // 4 > NPY_STRING_LENGTH
+    assert list(rows["category"]) == [listing["category"] for listing in listings]
+    assert list(rows["room_id"]) == [int(listing["room_id"]) for listing in listings]
@@ -0,0 +1,268 @@
+import copy
+import json
+from typing import Any
+
+import pytest
+from fixtures import load_fixtures, make_details_data
+
+from pyairbnb import parse, utils
+from pyairbnb.standardize import DETAIL_SECTIONS, DetailView, from_details
+
+
+def eager_from_details(meta, sections=None) -> dict[str, Any]:
+    """The eager from_details DetailView replaced, as the reference for its output."""
+    skipped = {
+        type_name
+        for section, type_names in DETAIL_SECTIONS.items()
+        if sections is not None and section not in sections
+        for type_name in type_names
+    }
+    ev = meta["data"]["presentation"]["stayProductDetailPage"]["sections"]["metadata"][
+        "loggingContext"
+    ]["eventDataLogging"]
+    data = {
+        "coordinates": {
+            "latitude": utils.get_nested_value(ev, "listingLat", 0),
+            "longitude": utils.get_nested_value(ev, "listingLng", 0),
+        },
+        "room_type": utils.get_nested_value(ev, "roomType", ""),
+        "is_super_host": utils.get_nested_value(ev, "isSuperhost", ""),
+        "home_tier": utils.get_nested_value(ev, "homeTier", ""),
+        "person_capacity": utils.get_nested_value(ev, "personCapacity", 0),
+        "rating": {
+            "accuracy": utils.get_nested_value(ev, "accuracyRating", 0),
+            "checking": utils.get_nested_value(ev, "checkinRating", 0),
+            "cleanliness": utils.get_nested_value(ev, "cleanlinessRating", 0),
+            "communication": utils.get_nested_value(ev, "communicationRating", 0),
+            "location": utils.get_nested_value(ev, "locationRating", 0),
+            "value": utils.get_nested_value(ev, "valueRating", 0),
+            "guest_satisfaction": utils.get_nested_value(
+                ev, "guestSatisfactionOverall", 0
+            ),
+            "review_count": utils.get_nested_value(ev, "visibleReviewCount", 0),
+        },
+        "house_rules": {
+            "aditional": "",
+            "general": [],
+        },
+        "host": {
+            "id": "",
+            "name": "",
+            "joined_on": "",
+            "description": "",
+        },
+        "sub_description": {
+            "title": "",
+            "items": [],
+        },
+        "amenities": [],
+        "co_hosts": [],
+        "images": [],
+        "location_descriptions": [],
+        "highlights": [],
+    }
+
+    sd = utils.get_nested_value(
+        meta, "data.presentation.stayProductDetailPage.sections.sbuiData"
+    )
+    for section in utils.get_nested_value(sd, "sectionConfiguration.root.sections", []):
+        type_name = utils.get_nested_value(section, "sectionData.__typename", "")
+        if type_name in skipped:
+            continue
+        if type_name == "PdpHostOverviewDefaultSection":
+            data["host"] = {
+                "id": utils.get_nested_value(
+                    section,
+                    "sectionData.hostAvatar.loggingEventData.eventData.pdpContext.hostId",
+                    "",
+                ),
+                "name": utils.get_nested_value(section, "sectionData.title", ""),
+            }
+        elif type_name == "PdpOverviewV2Section":
+            data["sub_description"]["title"] = utils.get_nested_value(
+                section, "sectionData.title", ""
+            )
+            for item in utils.get_nested_value(
+                section, "sectionData.overviewItems", []
+            ):
+                data["sub_description"]["items"].append(
+                    utils.get_nested_value(item, "title", "")
+                )
+
+    for section in utils.get_nested_value(
+        meta, "data.presentation.stayProductDetailPage.sections.sections", []
+    ):
+        type_name = utils.get_nested_value(section, "section.__typename", "")
+        if type_name in skipped:
+            continue
+        match type_name:
+            case "HostProfileSection":
+                data["host"]["id"] = utils.get_nested_value(
+                    section, "section.hostAvatar.userID", ""
+                )
+                data["host"]["name"] = utils.get_nested_value(
+                    section, "section.title", ""
+                )
+                data["host"]["joined_on"] = utils.get_nested_value(
+                    section, "section.subtitle", ""
+                )
+                data["host"]["description"] = utils.get_nested_value(
+                    section, "section.hostProfileDescription.htmlText", ""
+                )
+                for cohost in utils.get_nested_value(
+                    section, "section.additionalHosts", []
+                ):
+                    data["co_hosts"].append(
+                        {"id": cohost.get("id", ""), "name": cohost.get("name", "")}
+                    )
+            case "PhotoTourModalSection":
+                for media_item in utils.get_nested_value(
+                    section, "section.mediaItems", []
+                ):
+                    img = {
+                        "title": media_item.get("accessibilityLabel", ""),
+                        "url": media_item.get("baseUrl", ""),
+                    }
+                    data["images"].append(img)
+            case "PoliciesSection":
+                for house_rules_section in utils.get_nested_value(
+                    section, "section.houseRulesSections", []
+                ):
+                    house_rule = {
+                        "title": house_rules_section.get("title", ""),
+                        "values": [],
+                    }
+                    for item in house_rules_section.get("items", []):
+                        if item.get("title", "") == "Additional rules":
+                            data["house_rules"]["aditional"] = utils.get_nested_value(
+                                item, "html.htmlText", ""
+                            )
+                            continue
+                        house_rule["values"].append(
+                            {
+                                "title": item.get("title", ""),
+                                "icon": item.get("icon", ""),
+                            }
+                        )
+
+                    data["house_rules"]["general"].append(house_rule)
+            case "LocationSection":
+                for location_detail in utils.get_nested_value(
+                    section, "section.seeAllLocationDetails", []
+                ):
+                    see_all_location_detail = {
+                        "title": location_detail.get("title", ""),
+                        "content": utils.get_nested_value(
+                            location_detail, "content.htmlText"
+                        ),
+                    }
+                    data["location_descriptions"].append(see_all_location_detail)
+            case "PdpTitleSection":
+                data["title"] = section.get("title", "")
+            case "PdpHighlightsSection":
+                for highliting_data in utils.get_nested_value(
+                    section, "section.highlights", []
+                ):
+                    highliting = {
+                        "title": highliting_data.get("title", ""),
+                        "subtitle": highliting_data.get("subtitle", ""),
+                        "icon": highliting_data.get("icon", ""),
+                    }
+                    data["highlights"].append(highliting)
+            case "PdpDescriptionSection":
+                data["description"] = utils.get_nested_value(
+                    section, "section.htmlDescription.htmlText", ""
+                )
+            case "AmenitiesSection":
+                for amenity_group_raw in utils.get_nested_value(
+                    section, "section.seeAllAmenitiesGroups", []
+                ):
+                    amenity_group = {
+                        "title": amenity_group_raw.get("title", ""),
+                        "values": [],
+                    }
+                    for amenity_raw in amenity_group_raw.get("amenities", []):
+                        amenity = {
+                            "title": amenity_raw.get("title", ""),
+                            "subtitle": amenity_raw.get("subtitle", ""),
+                            "icon": amenity_raw.get("icon", ""),
+                            "available": amenity_raw.get("available", ""),
+                        }
+                        amenity_group["values"].append(amenity)
+                    data["amenities"].append(amenity_group)
+    return data
+
+
+def room_pages() -> list:
+    pages = [make_details_data(seed) for seed in range(4)]
+    pages += [parse.parse_body_details(body)[0] for _, body in load_fixtures("*.html")]
+    # the synthetic pages lack a title and a host overview section
+    full = copy.deepcopy(pages[0])
+    page_sections = full["data"]["presentation"]["stayProductDetailPage"]["sections"]
+    page_sections["sections"].append(
+        {"title": "Loft by the sea", "section": {"__typename": "PdpTitleSection"}}
+    )
+    page_sections["sbuiData"]["sectionConfiguration"]["root"]["sections"].append(
+        {
+            "sectionData": {
+                "__typename": "PdpHostOverviewDefaultSection",
+                "title": "Hosted by Ana",
+                "hostAvatar": {
+                    "loggingEventData": {"eventData": {"pdpContext": {"hostId": "42"}}}
+                },
+            }
+        }
+    )
+    # and the same page with its sections in reverse order, which puts the
+    # title key ahead of the description
+    reordered = copy.deepcopy(full)
+    reordered["data"]["presentation"]["stayProductDetailPage"]["sections"][
+        "sections"
+    ].reverse()
+    return pages + [full, reordered]
+
+
+ROOM_PAGES = room_pages()
+SECTION_SUBSETS = [
+    [],
+    ["title"],
+    ["host"],
+    ["description", "title"],
+    ["amenities", "images", "house_rules"],
+    list(DETAIL_SECTIONS),
+]
+
+
+def dumps(data: dict) -> str:
+    """JSON of `data` with its key order, nested dicts included."""
+    return json.dumps(data)
+
+
+@pytest.mark.parametrize("meta", ROOM_PAGES)
+def test_detail_view_matches_the_eager_output(meta):
+    expected = eager_from_details(meta)
+    assert dumps(DetailView(meta).to_dict()) == dumps(expected)
+    assert dumps(from_details(meta)) == dumps(expected)
+
+
+@pytest.mark.parametrize("sections", SECTION_SUBSETS)
+@pytest.mark.parametrize("meta", ROOM_PAGES)
+def test_detail_view_matches_the_eager_output_for_sections(meta, sections):
+    expected = eager_from_details(meta, sections)
+    assert dumps(DetailView(meta).to_dict(sections)) == dumps(expected)
+    assert dumps(from_details(meta, sections)) == dumps(expected)
+
+
+def test_reading_one_field_matches_the_full_output():
+    meta = ROOM_PAGES[-1]
+    expected = eager_from_details(meta)
+    view = DetailView(meta)
+    assert view.title == expected["title"]
+    assert view.amenities == expected["amenities"]
+    assert list(expected)[-2:] == ["title", "description"]
+    assert dumps(view.to_dict()) == dumps(expected)
+
+
+def test_unknown_sections_are_rejected():
+    with pytest.raises(ValueError):
+        DetailView(ROOM_PAGES[0]).to_dict(["nope"])
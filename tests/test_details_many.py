@@ -0,0 +1,58 @@
+from replay_server import ReplayServer
+
+from pyairbnb import start
+from pyairbnb.api import HOMEPAGE_URL, Api
+from pyairbnb.keystore import ApiKeyStore
+from pyairbnb.records import DetailRecord
+
+
+class FakeApi:
+    base_url = HOMEPAGE_URL
+    host_cache = None
+
+    def close_finished_threads(self):
+        pass
+
+
+def fake_get_details(api, room_url, room_id, *args):
+    if room_id == "bad":
+        raise RuntimeError("boom")
+    return {"room_url": room_url}
+
+
+def test_bad_rooms_are_yielded_as_errors(monkeypatch):
+    monkeypatch.setattr(start, "_get_details", fake_get_details)
+    results = dict(
+        start.get_details_many(["1", None, "bad", "2"], "USD", api=FakeApi())
+    )
+    assert results["1"] == {"room_url": "https://www.airbnb.com/rooms/1"}
+    assert results["2"] == {"room_url": "https://www.airbnb.com/rooms/2"}
+    assert isinstance(results[None], ValueError)
+    assert isinstance(results["bad"], RuntimeError)
+
+
+def test_given_api_gets_no_host_cache(monkeypatch):
+    def no_host_cache():
+        raise AssertionError("HostCache built for a caller's Api")
+
+    monkeypatch.setattr(start, "_get_details", fake_get_details)
+    monkeypatch.setattr(start, "HostCache", no_host_cache)
+    stats = start.DetailsBatchStats()
+    results = list(start.get_details_many(["1"], "USD", api=FakeApi(), stats=stats))
+    assert len(results) == 1 and stats.rooms_fetched == 1
+
+
+def test_rooms_are_loaded_from_the_api_base_url():
+    with ReplayServer(room_padding_kb=1) as server, Api(
+        base_url=server.base_url, key_store=ApiKeyStore()
+    ) as api:
+        results = dict(
+            start.get_details_many(
+                ["1", "2"], "USD", api=api, include={"calendar"}, typed=True
+            )
+        )
+
+    assert sorted(results) == ["1", "2"]
+    for result in results.values():
+        assert isinstance(result, DetailRecord)
+        assert result.calendar
@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+
+from pyairbnb.hostcache import HostCache
+
+
+def test_waiters_take_over_when_the_leader_is_cancelled():
+    async def main():
+        host_cache = HostCache()
+        calls = []
+
+        async def fetch():
+            calls.append(asyncio.current_task())
+            await asyncio.sleep(0.05)
+            return {"id": "1"}
+
+        leader = asyncio.create_task(host_cache.async_get_or_fetch("1", fetch))
+        await asyncio.sleep(0)
+        waiters = [
+            asyncio.create_task(host_cache.async_get_or_fetch("1", fetch))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        results = await asyncio.gather(*waiters)
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return host_cache, calls, results
+
+    host_cache, calls, results = asyncio.run(main())
+    assert results == [{"id": "1"}] * 3
+    assert len(calls) == 2
+    assert host_cache.misses == 2 and host_cache.shared == 2
+
+
+def test_cancelled_waiter_does_not_cancel_the_fetch():
+    async def main():
+        host_cache = HostCache()
+
+        async def fetch():
+            await asyncio.sleep(0.05)
+            return {"id": "1"}
+
+        leader = asyncio.create_task(host_cache.async_get_or_fetch("1", fetch))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(host_cache.async_get_or_fetch("1", fetch))
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        return await leader
+
+    assert asyncio.run(main()) == {"id": "1"}
+
+
+def test_waiters_get_the_error_of_the_fetch():
+    async def main():
+        host_cache = HostCache()
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            raise ValueError("profile unavailable")
+
+        return await asyncio.gather(
+            *(host_cache.async_get_or_fetch("1", fetch) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(main())
+    assert [type(result) for result in results] == [ValueError] * 3
+
+
+def test_persisted_profiles_are_stored_as_blobs(tmp_path):
+    host_cache = HostCache(path=tmp_path / "hosts.db")
+    host_cache.set("1", {"name": "Ana"})
+    (type_name,) = host_cache._connection.execute(
+        "SELECT typeof(body) FROM hosts"
+    ).fetchone()
+    host_cache.close()
+    assert type_name == "blob"
+    assert HostCache(path=tmp_path / "hosts.db").get("1") == {"name": "Ana"}
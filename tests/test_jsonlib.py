@@ -0,0 +1,61 @@
+import pytest
+from fixtures import make_details_data, make_search_response
+
+from pyairbnb import jsonlib
+
+DOCUMENTS = [
+    make_search_response(),
+    make_details_data(),
+    {"text": "café — \U0001f3e0", "nested": [1, 2.5, None, True, {}]},
+]
+
+
+@pytest.fixture(autouse=True)
+def restore_backend():
+    backend = jsonlib.backend
+    yield
+    jsonlib.backend = backend
+
+
+@pytest.fixture(params=jsonlib.PREFERRED_BACKENDS)
+def backend_name(request):
+    if request.param not in jsonlib.BACKENDS:
+        pytest.skip(f"{request.param} is not installed")
+    return request.param
+
+
+def test_set_backend_switches_the_implementation(backend_name):
+    jsonlib.set_backend(backend_name)
+
+    assert jsonlib.backend.name == backend_name
+    assert jsonlib.backend is jsonlib.BACKENDS[backend_name]
+
+
+@pytest.mark.parametrize("document", DOCUMENTS)
+def test_loads_gives_the_same_result_on_every_backend(backend_name, document):
+    data = jsonlib.BACKENDS["json"].dumps(document)
+    jsonlib.set_backend(backend_name)
+
+    assert jsonlib.loads(data) == document
+    assert jsonlib.loads(memoryview(data)[:]) == document
+    assert jsonlib.loads(data.decode()) == document
+    assert jsonlib.loads(jsonlib.dumps(document)) == document
+
+
+def test_loads_raises_value_error_on_every_backend(backend_name):
+    jsonlib.set_backend(backend_name)
+
+    with pytest.raises(ValueError):
+        jsonlib.loads(b'{"truncated": ')
+
+
+def test_set_backend_rejects_unknown_and_missing_backends():
+    with pytest.raises(ValueError):
+        jsonlib.set_backend("simplejson")
+
+    missing = [
+        name for name in jsonlib.PREFERRED_BACKENDS if name not in jsonlib.BACKENDS
+    ]
+    for name in missing:
+        with pytest.raises(ImportError):
+            jsonlib.set_backend(name)
@@ -0,0 +1,212 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from fixtures import make_homepage_html, make_room_html
+
+from pyairbnb import keystore, parse
+from pyairbnb.api import Api
+from pyairbnb.async_api import AsyncApi
+from pyairbnb.keystore import ApiKeyStore
+
+PAGE_KEY = "d306zoyjsyarp7ifhu67rjxn52tv0t20"
+
+
+class FakeResponse:
+    def __init__(self, text: str):
+        self.text = text
+        self.content = text.encode()
+        self.cookies = {}
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+class FakePageApi(Api):
+    """Serves `page` for every GET and counts them."""
+
+    def __init__(self, page: str, key_store: ApiKeyStore):
+        super().__init__(key_store=key_store)
+        self.page = page
+        self.gets = 0
+
+    def get_html(self, url, use_api_key, header_connection_close, params=None):
+        self.gets += 1
+        return FakeResponse(self.page)
+
+
+class FakeAsyncApi(AsyncApi):
+    def __init__(self, key_store: ApiKeyStore):
+        super().__init__(key_store=key_store)
+        self.gets = 0
+
+    async def get_html(self, url, use_api_key, header_connection_close, params=None):
+        self.gets += 1
+        await asyncio.sleep(0.05)
+        return FakeResponse(make_homepage_html())
+
+
+@pytest.fixture
+def now(monkeypatch):
+    clock = {"now": 1_700_000_000.0}
+    monkeypatch.setattr(keystore.time, "time", lambda: clock["now"])
+    return clock
+
+
+def test_keys_expire_after_the_ttl(tmp_path, now):
+    store = ApiKeyStore(tmp_path / "key.json", ttl=60)
+    store.set("k1")
+    now["now"] += 59
+    assert store.get() == "k1"
+    assert ApiKeyStore(tmp_path / "key.json", ttl=60).get() == "k1"
+    now["now"] += 2
+    assert store.get() is None
+    assert ApiKeyStore(tmp_path / "key.json", ttl=60).get() is None
+    assert store.get_or_fetch(lambda: "k2") == "k2"
+
+
+def test_offer_keeps_a_fresh_key():
+    store = ApiKeyStore()
+    store.offer("k1")
+    store.offer("k2")
+    assert store.get() == "k1"
+
+
+def test_invalidate_only_clears_a_matching_key(tmp_path):
+    path = tmp_path / "key.json"
+    store = ApiKeyStore(path)
+    store.set("k1")
+    store.invalidate("old")
+    assert store.get() == "k1"
+    assert path.exists()
+
+    store.invalidate("k1")
+    assert store.get() is None
+    assert not path.exists()
+
+
+def test_invalidate_leaves_a_newer_key_of_another_process(tmp_path):
+    path = tmp_path / "key.json"
+    first, second = ApiKeyStore(path), ApiKeyStore(path)
+    first.set("k1")
+    second.set("k2")
+    first.invalidate("k1")
+    assert first.get() == "k2"
+
+
+def test_get_or_fetch_fetches_once_across_stores_sharing_a_file(tmp_path):
+    if keystore.fcntl is None:
+        pytest.skip("file locks need fcntl")
+    path = tmp_path / "key.json"
+    fetches = []
+
+    def fetch() -> str:
+        fetches.append(threading.get_ident())
+        time.sleep(0.1)
+        return "k1"
+
+    # separate stores stand in for separate processes: only the lock file is shared
+    stores = [ApiKeyStore(path) for _ in range(4)]
+    keys = []
+    threads = [
+        threading.Thread(
+            target=lambda store=store: keys.append(store.get_or_fetch(fetch))
+        )
+        for store in stores
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert keys == ["k1"] * 4
+    assert len(fetches) == 1
+
+
+def test_config_key_is_found_after_a_stray_key():
+    page = '{"key":"stray"}' + make_homepage_html()
+    assert parse.extract_language_and_api_key(page + '"language":"en"')[1] == "stray"
+    assert parse.extract_api_config_key(page) == PAGE_KEY
+    assert parse.extract_api_config_key(page.encode()) == PAGE_KEY
+    assert parse.extract_api_config_key('{"key":"stray"}') is None
+
+
+def test_room_pages_only_offer_their_config_key():
+    page = make_room_html(padding_kb=1)
+    store = ApiKeyStore()
+    FakePageApi(page.replace("<head>", '<head>{"key":"stray"}'), store).get_details(
+        "/rooms/1"
+    )
+    assert store.get() == PAGE_KEY
+
+    store = ApiKeyStore()
+    without_config = page.replace('"api_config":{"key":', '"api":{"key":')
+    FakePageApi(without_config, store).get_details("/rooms/1")
+    assert store.get() is None
+
+
+def test_async_clients_fetch_through_the_store_lock(tmp_path):
+    path = tmp_path / "key.json"
+
+    async def get_keys(api: FakeAsyncApi) -> list[str]:
+        async with api:
+            return await asyncio.gather(*(api.get_api_key() for _ in range(5)))
+
+    first = FakeAsyncApi(ApiKeyStore(path))
+    assert asyncio.run(get_keys(first)) == [PAGE_KEY] * 5
+    assert first.gets == 1
+
+    second = FakeAsyncApi(ApiKeyStore(path))
+    assert asyncio.run(get_keys(second)) == [PAGE_KEY] * 5
+    assert second.gets == 0
+
+
+def test_async_clients_wait_for_a_fetch_in_another_process(tmp_path):
+    if keystore.fcntl is None:
+        pytest.skip("file locks need fcntl")
+    path = tmp_path / "key.json"
+    fetching = threading.Event()
+
+    def slow_fetch() -> str:
+        fetching.set()
+        time.sleep(0.2)
+        return "k1"
+
+    thread = threading.Thread(target=ApiKeyStore(path).get_or_fetch, args=(slow_fetch,))
+    thread.start()
+    fetching.wait()
+    api = FakeAsyncApi(ApiKeyStore(path))
+
+    async def get_key() -> str:
+        async with api:
+            return await api.get_api_key()
+
+    assert asyncio.run(get_key()) == "k1"
+    thread.join()
+    assert api.gets == 0
+
+
+def test_get_does_not_wait_for_a_fetch(tmp_path):
+    store = ApiKeyStore(tmp_path / "key.json")
+    fetching = threading.Event()
+    release = threading.Event()
+
+    def blocked_fetch() -> str:
+        fetching.set()
+        release.wait()
+        return "k1"
+
+    fetcher = threading.Thread(target=store.get_or_fetch, args=(blocked_fetch,))
+    fetcher.start()
+    fetching.wait()
+    results = []
+    reader = threading.Thread(target=lambda: results.append(store.get()))
+    reader.start()
+    reader.join(timeout=1)
+    release.set()
+    fetcher.join()
+    reader.join()
+
+    assert results == [None]
+    assert store.get() == "k1"
+
@@ -0,0 +1,19 @@
+from urllib.request import urlopen
+
+from pyairbnb.metrics import MetricsAggregator, RequestEvent, serve_prometheus
+
+
+def test_serve_prometheus_binds_loopback_by_default():
+    aggregator = MetricsAggregator()
+    aggregator(
+        RequestEvent("StaysSearch", "www.airbnb.com", "GET", 200, 0.2, 512, 0, None)
+    )
+    server = serve_prometheus(aggregator, port=0)
+    try:
+        host, port = server.server_address
+        assert host == "127.0.0.1"
+        with urlopen(f"http://127.0.0.1:{port}/metrics") as response:
+            body = response.read().decode()
+    finally:
+        server.shutdown()
+    assert 'pyairbnb_requests_total{operation="StaysSearch",status="200"} 1' in body
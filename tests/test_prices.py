@@ -0,0 +1,56 @@
+import asyncio
+
+from curl_cffi.requests.exceptions import HTTPError
+
+from pyairbnb.api import Api
+from pyairbnb.async_api import AsyncApi
+
+DATE_RANGES = [(f"2024-01-{day:02d}", f"2024-01-{day + 2:02d}") for day in range(1, 9)]
+FAILING = {"2024-01-03", "2024-01-06"}
+
+
+def quote(check_in: str) -> dict:
+    if check_in in FAILING:
+        raise HTTPError(f"quote for {check_in} failed")
+    return {"main": {"price": "$120", "qualifier": "night"}, "details": {}}
+
+
+class FakePriceApi(Api):
+    def get_price(self, product_id, impression_id, cookies, check_in, check_out):
+        return quote(check_in)
+
+
+class FakeAsyncPriceApi(AsyncApi):
+    async def get_price(self, product_id, impression_id, cookies, check_in, check_out):
+        await asyncio.sleep(0.01)
+        return quote(check_in)
+
+
+def check_rows(rows: list[dict]) -> None:
+    assert [(row["check_in"], row["check_out"]) for row in rows] == DATE_RANGES
+    for row in rows:
+        if row["check_in"] in FAILING:
+            assert isinstance(row["error"], HTTPError)
+            assert row["check_in"] in str(row["error"])
+            assert row["available"] is False
+            assert row["price"] is None
+        else:
+            assert row["error"] is None
+            assert row["available"] is True
+            assert row["price"] == 120
+            assert row["currency_symbol"] == "$"
+
+
+def test_get_prices_keeps_the_quotes_around_a_failure():
+    with FakePriceApi() as api:
+        rows = api.get_prices("p", "imp", None, DATE_RANGES, concurrency=3)
+
+    check_rows(rows)
+
+
+def test_async_get_prices_keeps_the_quotes_around_a_failure():
+    async def main() -> list[dict]:
+        async with FakeAsyncPriceApi() as api:
+            return await api.get_prices("p", "imp", None, DATE_RANGES, concurrency=3)
+
+    check_rows(asyncio.run(main()))
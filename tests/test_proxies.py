@@ -0,0 +1,94 @@
+import random
+from collections import Counter
+
+import pytest
+
+from pyairbnb import proxies
+from pyairbnb.proxies import ProxyPool
+
+PROXIES = ["http://a:1", "http://b:1", "http://c:1"]
+
+
+@pytest.fixture
+def now(monkeypatch):
+    clock = {"now": 1000.0}
+    monkeypatch.setattr(proxies.time, "monotonic", lambda: clock["now"])
+    return clock
+
+
+def test_failing_proxy_is_benched_and_comes_back(now):
+    pool = ProxyPool(PROXIES, cooldown=60.0, failure_threshold=3)
+    bad = PROXIES[0]
+    for url in PROXIES[1:]:
+        pool.record(url, 10.0, ok=True)
+    for _ in range(2):
+        pool.record(bad, 0.1, ok=False)
+    assert not pool.stats()[bad]["quarantined"]
+    pool.record(bad, 0.1, ok=False)
+    assert pool.stats()[bad]["quarantined_for"] == 60.0
+
+    assert bad not in {pool.choose() for _ in range(200)}
+
+    now["now"] += 61.0
+    assert not pool.stats()[bad]["quarantined"]
+    assert bad in {pool.choose() for _ in range(200)}
+
+
+def test_a_success_resets_the_consecutive_failures(now):
+    pool = ProxyPool(PROXIES, failure_threshold=3)
+    for ok in (False, False, True, False, False):
+        pool.record(PROXIES[0], 0.1, ok=ok)
+    assert not pool.stats()[PROXIES[0]]["quarantined"]
+    assert pool.stats()[PROXIES[0]]["error_rate"] == 0.8
+
+
+def test_when_everything_is_benched_the_first_back_is_used(now):
+    pool = ProxyPool(PROXIES[:2], cooldown=60.0, failure_threshold=1)
+    pool.record(PROXIES[0], 0.1, ok=False)
+    now["now"] += 10.0
+    pool.record(PROXIES[1], 0.1, ok=False)
+    assert pool.choose() == PROXIES[0]
+
+
+def test_selection_spreads_load_across_healthy_proxies(now):
+    random.seed(0)
+    pool = ProxyPool(PROXIES)
+    for url in PROXIES:
+        pool.record(url, 0.2, ok=True)
+    picks = Counter(pool.choose() for _ in range(3000))
+    assert set(picks) == set(PROXIES)
+    assert min(picks.values()) > 800
+
+
+def test_selection_favours_faster_and_reliable_proxies(now):
+    random.seed(0)
+    pool = ProxyPool(PROXIES)
+    pool.record(PROXIES[0], 0.1, ok=True)
+    pool.record(PROXIES[1], 1.0, ok=True)
+    pool.record(PROXIES[2], 0.1, ok=False)
+    picks = Counter(pool.choose() for _ in range(3000))
+    assert picks[PROXIES[0]] > picks[PROXIES[1]]
+    assert picks[PROXIES[0]] > picks[PROXIES[2]]
+    # the worst proxy of each sampled pair loses, so it never gets picked
+    assert picks[PROXIES[2]] == 0
+
+
+def test_untried_proxies_get_sampled(now):
+    random.seed(0)
+    pool = ProxyPool(PROXIES)
+    pool.record(PROXIES[0], 0.1, ok=True)
+    pool.record(PROXIES[1], 0.1, ok=True)
+    assert PROXIES[2] in {pool.choose() for _ in range(50)}
+
+
+def test_cookies_stay_on_their_proxy_while_it_is_healthy(now):
+    pool = ProxyPool(PROXIES, failure_threshold=1)
+    pool.pin({"session": "abc"}, PROXIES[1])
+    assert {pool.choose({"session": "abc"}) for _ in range(50)} == {PROXIES[1]}
+    pool.record(PROXIES[1], 0.1, ok=False)
+    assert PROXIES[1] not in {pool.choose({"session": "abc"}) for _ in range(50)}
+
+
+def test_an_empty_pool_is_rejected():
+    with pytest.raises(ValueError):
+        ProxyPool([])
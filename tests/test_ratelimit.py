@@ -0,0 +1,137 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from pyairbnb import ratelimit
+from pyairbnb.ratelimit import RateLimiter, RetryPolicy, TokenBucket
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, headers: dict | None = None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(ratelimit.time, "monotonic", clock)
+    return clock
+
+
+def test_bucket_spends_its_burst_then_makes_callers_wait(clock):
+    bucket = TokenBucket(rate=2.0, burst=3)
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.reserve() == pytest.approx(0.5)
+    assert bucket.reserve() == pytest.approx(1.0)
+
+
+def test_bucket_refills_at_its_rate_up_to_the_burst(clock):
+    bucket = TokenBucket(rate=2.0, burst=3)
+    for _ in range(3):
+        bucket.reserve()
+
+    clock.now += 1.0
+    assert [bucket.reserve() for _ in range(2)] == [0.0, 0.0]
+    assert bucket.reserve() == pytest.approx(0.5)
+
+    clock.now += 60.0
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.reserve() > 0
+
+
+def test_throttling_halves_the_rate_and_successes_win_it_back(clock):
+    bucket = TokenBucket(rate=4.0, burst=1, min_rate=1.5)
+    bucket.throttled()
+    assert bucket.rate == 2.0
+    bucket.throttled()
+    assert bucket.rate == 1.5
+    for _ in range(100):
+        bucket.succeeded()
+    assert bucket.rate == 4.0
+
+
+def test_hosts_have_separate_buckets(clock):
+    limiter = RateLimiter(rate=1.0, burst=1, host_rates={"fast": (10.0, 1)})
+    assert limiter.reserve("a") == 0.0
+    assert limiter.reserve("b") == 0.0
+    assert limiter.reserve("a") == pytest.approx(1.0)
+    assert limiter.reserve("fast") == 0.0
+    assert limiter.reserve("fast") == pytest.approx(0.1)
+
+
+def test_operation_limits_apply_on_top_of_the_host(clock):
+    limiter = RateLimiter(rate=100.0, burst=10, operation_rates={"Search": (1.0, 1)})
+    assert limiter.reserve("host", "Search") == 0.0
+    assert limiter.reserve("host", "Search") == pytest.approx(1.0)
+    # operations without a limit only wait for their host
+    assert limiter.reserve("host", "Reviews") == 0.0
+    assert limiter.reserve("host") == 0.0
+
+
+def test_throttled_statuses_slow_down_both_buckets(clock):
+    limiter = RateLimiter(rate=4.0, burst=1, operation_rates={"Search": (2.0, 1)})
+    limiter.record("host", "Search", 429)
+    assert limiter._bucket("host", "host").rate == 2.0
+    assert limiter._bucket("operation", "Search").rate == 1.0
+    limiter.record("host", "Search", 200)
+    assert limiter._bucket("host", "host").rate == 2.2
+
+
+@pytest.mark.parametrize("status_code", [429, 500, 502, 503, 504])
+def test_retryable_statuses_are_retried(status_code):
+    policy = RetryPolicy(max_retries=2)
+    assert policy.should_retry(0, FakeResponse(status_code))
+    assert policy.should_retry(1, FakeResponse(status_code))
+    assert not policy.should_retry(2, FakeResponse(status_code))
+
+
+@pytest.mark.parametrize("status_code", [200, 400, 401, 403, 404])
+def test_other_statuses_are_not_retried(status_code):
+    assert not RetryPolicy().should_retry(0, FakeResponse(status_code))
+
+
+def test_network_errors_are_retried():
+    assert RetryPolicy().should_retry(0, None)
+
+
+def test_retries_stop_when_the_budget_runs_out():
+    policy = RetryPolicy(budget_ratio=0.5, budget_max=2.0)
+    response = FakeResponse(503)
+    assert policy.should_retry(0, response)
+    assert policy.should_retry(0, response)
+    assert not policy.should_retry(0, response)
+    policy.sent()
+    policy.sent()
+    assert policy.should_retry(0, response)
+
+
+def test_delay_honours_retry_after_seconds_up_to_the_cap():
+    policy = RetryPolicy(backoff_max=30.0)
+    assert policy.delay(0, FakeResponse(429, {"Retry-After": "7"})) == 7.0
+    assert policy.delay(0, FakeResponse(429, {"Retry-After": "120"})) == 30.0
+    assert policy.delay(0, FakeResponse(429, {"Retry-After": "-3"})) == 0.0
+
+
+def test_delay_honours_retry_after_dates():
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=20)
+    response = FakeResponse(503, {"Retry-After": format_datetime(retry_at, True)})
+    assert 18.0 <= RetryPolicy().delay(0, response) <= 20.0
+
+
+def test_backoff_grows_with_the_attempt_and_is_capped(monkeypatch):
+    monkeypatch.setattr(ratelimit.random, "uniform", lambda low, high: high)
+    policy = RetryPolicy(backoff_base=0.5, backoff_max=3.0)
+    delays = [policy.delay(attempt, None) for attempt in range(5)]
+    assert delays == [0.5, 1.0, 2.0, 3.0, 3.0]
+    # an unparseable Retry-After falls back to the backoff
+    assert policy.delay(1, FakeResponse(503, {"Retry-After": "soon"})) == 1.0
@@ -0,0 +1,48 @@
+import json
+
+import pytest
+from fixtures import make_details_data, make_search_results
+
+from pyairbnb import standardize
+from pyairbnb.records import DetailRecord, SearchListing
+
+
+def as_json(data) -> str:
+    # compare through json so key order and int/float/str types count too
+    return json.dumps(data)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_search_listing_to_dict_matches_the_dict_path(seed):
+    results = make_search_results(seed, n=20)
+
+    dicts = standardize.from_search(results)
+    listings = standardize.from_search(results, typed=True)
+
+    assert all(isinstance(listing, SearchListing) for listing in listings)
+    assert as_json([listing.to_dict() for listing in listings]) == as_json(dicts)
+
+
+def test_search_listing_without_fees_round_trips():
+    listing = standardize.from_search(make_search_results(n=1))[0]
+    listing["long_stay_discount"] = {}
+    listing["fee"] = {"airbnb": {}, "cleaning": {}}
+    listing["images"] = []
+    listing["badges"] = []
+
+    assert as_json(SearchListing.from_dict(listing).to_dict()) == as_json(listing)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_detail_record_to_dict_matches_the_dict_path(seed):
+    data = standardize.from_details(make_details_data(seed))
+    data["language"] = "en"
+
+    assert as_json(DetailRecord.from_dict(data).to_dict()) == as_json(data)
+
+    data["calendar"] = [{"month": 1, "days": []}]
+    data["reviews"] = [{"comments": "nice"}]
+    data["price"] = {"main": {"price": "$100"}}
+    data["host_details"] = {"id": "1"}
+
+    assert as_json(DetailRecord.from_dict(data).to_dict()) == as_json(data)
@@ -0,0 +1,53 @@
+import pytest
+
+from pyairbnb.api import REVIEWS_PAGE_SIZE, Api, ThreadSession
+
+
+class FakeReviewsApi(Api):
+    """Serves `total` reviews from memory and records the offsets requested."""
+
+    def __init__(self, total: int, reported_total: int | None = None):
+        self.total = total
+        self.reported_total = total if reported_total is None else reported_total
+        self.offsets: list[int] = []
+        self.session = ThreadSession()
+        self.handles = []
+
+    def _get_reviews_page(self, offset, product_id):
+        self.offsets.append(offset)
+        self.handles.append(self.session.curl)
+        end = min(offset + REVIEWS_PAGE_SIZE, self.total)
+        return [{"id": str(i)} for i in range(offset, end)], self.reported_total
+
+
+@pytest.mark.parametrize("review_count", [100, "100", 100.0])
+def test_review_count_is_coerced(review_count):
+    api = FakeReviewsApi(100)
+    reviews = api.get_reviews("1", review_count=review_count, concurrency=4)
+    assert len(reviews) == 100
+    assert sorted(api.offsets) == [0, 50]
+
+
+def test_first_page_count_skips_trailing_empty_page():
+    api = FakeReviewsApi(100)
+    assert len(api.get_reviews("1", concurrency=4)) == 100
+    assert sorted(api.offsets) == [0, 50]
+
+
+def test_lagging_count_keeps_paginating():
+    api = FakeReviewsApi(130)
+    reviews = api.get_reviews("1", review_count=70, concurrency=4)
+    assert [review["id"] for review in reviews] == [str(i) for i in range(130)]
+    assert sorted(api.offsets) == [0, 50, 100, 150]
+
+
+def test_worker_handles_are_closed_after_the_fan_out():
+    api = FakeReviewsApi(400)
+    api.get_reviews("1", review_count=400, concurrency=4)
+    assert api.handles
+    assert all(handle._curl is None for handle in api.handles)
+    assert api.session._handles == {}
+
+    main_handle = api.session.curl
+    api.close()
+    assert main_handle._curl is None
@@ -0,0 +1,12 @@
+import pytest
+
+from pyairbnb.api import Api
+
+
+@pytest.mark.parametrize("include_map", [True, False])
+def test_search_request_asks_for_map_pins_only_when_included(include_map):
+    with Api(currency="USD") as api:
+        _, _, input_data = api._search_request(
+            "2025-01-01", "2025-01-04", 1, 1, 0, 0, 10, include_map=include_map
+        )
+    assert input_data["variables"]["includeMapResults"] is include_map
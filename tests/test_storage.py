@@ -0,0 +1,114 @@
+import copy
+
+from fixtures import make_search_results
+
+from pyairbnb import standardize
+from pyairbnb.storage import ListingStore
+
+
+def make_listings(n: int = 3) -> list[dict]:
+    return standardize.from_search(make_search_results(n=n))
+
+
+def make_details(host_id: str = "h1") -> dict:
+    return {
+        "title": "Sea view loft",
+        "room_type": "Entire home",
+        "coordinates": {"latitude": 1.5, "longitude": 2.5},
+        "rating": {"review_count": 12},
+        "host": {"id": host_id, "name": "Ana"},
+        "calendar": [
+            {
+                "days": [
+                    {"calendarDate": "2025-01-01", "available": True, "minNights": 2},
+                    {"calendarDate": "2025-01-02", "available": False},
+                    {"calendarDate": "2025-01-03", "available": True},
+                ]
+            }
+        ],
+        "reviews": [
+            {"id": 1, "createdAt": "2024-05-01T10:00:00Z", "rating": 5},
+            {"id": 2, "createdAt": "2024-06-01T10:00:00Z", "rating": 4},
+        ],
+        "host_details": {"id": host_id, "about": "hi"},
+    }
+
+
+def count_rows(store: ListingStore, table: str) -> int:
+    return store._query(f"SELECT count(*) FROM {table}")[0][0]
+
+
+def test_reupsert_without_changes_keeps_one_row_per_listing():
+    listings = make_listings()
+    with ListingStore() as store:
+        assert store.upsert_search(listings, fetched_at=100.0) == 3
+        assert store.upsert_search(listings, fetched_at=200.0) == 3
+
+        assert count_rows(store, "listings") == 3
+        stored = store.listing(listings[0]["room_id"])
+        assert stored["search"] == listings[0]
+        assert stored["details"] is None
+        assert stored["search_fetched_at"] == 200.0
+
+
+def test_upsert_with_a_changed_field_updates_only_its_kind():
+    listings = make_listings(1)
+    room_id = listings[0]["room_id"]
+    with ListingStore() as store:
+        store.upsert_search(listings, fetched_at=100.0)
+        store.upsert_details(room_id, make_details(), fetched_at=150.0)
+
+        changed = copy.deepcopy(listings)
+        changed[0]["name"] = "Renamed"
+        changed[0]["price"]["total"]["amount"] = 99.0
+        store.upsert_search(changed, fetched_at=200.0)
+
+        stored = store.listing(room_id)
+        assert stored["search"]["name"] == "Renamed"
+        assert stored["details"]["title"] == "Sea view loft"
+        assert "calendar" not in stored["details"]
+        assert store.fetched_at(room_id) == (200.0, 150.0)
+        assert store._query(
+            "SELECT name, price_total, host_id FROM listings WHERE room_id = ?",
+            (str(room_id),),
+        ) == [("Renamed", 99.0, "h1")]
+
+
+def test_query_helpers():
+    with ListingStore() as store:
+        store.upsert_search(make_listings(3), fetched_at=100.0)
+        store.upsert_details("1", make_details("h1"), fetched_at=500.0)
+        # review IDs are unique across rooms
+        details = make_details("h1")
+        del details["reviews"]
+        store.upsert_details("2", details, fetched_at=50.0)
+
+        assert store.room_ids_by_host("h1") == ["1", "2"]
+        assert store.stale_room_ids(max_age=100, now=550.0) == ["0", "2"]
+        days = store.calendar("1", start="2025-01-02", end="2025-01-03")
+        assert [day["calendarDate"] for day in days] == ["2025-01-02", "2025-01-03"]
+        assert store.available_room_ids("2025-01-01") == ["1", "2"]
+        assert store.available_room_ids("2025-01-02") == []
+        reviews = store.reviews("1", since="2024-05-15")
+        assert [review["id"] for review in reviews] == [2]
+        assert [review["id"] for review in store.reviews("1")] == [2, 1]
+        assert store.host("h1") == {"id": "h1", "about": "hi"}
+        assert store.host("missing") is None
+        assert store.listing("missing") is None
+        assert store.fetched_at("missing") == (None, None)
+
+
+def test_reopening_a_database_file_keeps_its_data(tmp_path):
+    path = tmp_path / "listings.db"
+    listings = make_listings(2)
+    with ListingStore(path) as store:
+        store.upsert_search(listings, fetched_at=100.0)
+        store.upsert_details("0", make_details(), fetched_at=150.0)
+
+    with ListingStore(path) as store:
+        assert count_rows(store, "listings") == 2
+        assert store.listing("1")["search"] == listings[1]
+        assert store.fetched_at("0") == (100.0, 150.0)
+        assert len(store.calendar("0")) == 3
+        store.upsert_search(listings[:1], fetched_at=300.0)
+        assert store.fetched_at("0") == (300.0, 150.0)
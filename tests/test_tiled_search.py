@@ -0,0 +1,41 @@
+from pyairbnb import tiled_search
+from pyairbnb.tiled_search import TiledSearchStats, iter_search_tiled
+
+
+class FakeApi:
+    currency = "USD"
+
+
+def fake_search_tile(api, tile, check_in, check_out, typed):
+    if tile.depth == 0:
+        return [{"room_id": i} for i in range(10)], 1
+    if tile.ne_lat == 10 and tile.ne_long == 10:
+        raise RuntimeError("tile failed")
+    offset = int(tile.ne_lat * 100 + tile.ne_long)
+    return [{"room_id": offset + i} for i in range(3)], 1
+
+
+def test_failed_tile_is_recorded_and_the_crawl_continues(monkeypatch):
+    monkeypatch.setattr(tiled_search, "_search_tile", fake_search_tile)
+    stats = TiledSearchStats()
+    results = list(
+        iter_search_tiled(
+            "2025-01-01",
+            "2025-01-04",
+            10,
+            10,
+            0,
+            0,
+            10,
+            "USD",
+            api=FakeApi(),
+            saturation=10,
+            stats=stats,
+        )
+    )
+    assert stats.tiles_searched == 4
+    assert stats.tiles_failed == 1
+    ((failed_tile, error),) = stats.failed_tiles
+    assert failed_tile.depth == 1 and isinstance(error, RuntimeError)
+    assert len(results) == 10 + 3 * 3
+    assert not stats.complete
@@ -0,0 +1,75 @@
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from pyairbnb.api import REVIEWS_PAGE_SIZE, BaseApi, ReviewWatermark, parse_created_at
+from pyairbnb.watermarks import ReviewWatermarks
+
+
+def make_review(n: int) -> dict:
+    created_at = datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(hours=n)
+    return {"id": str(n), "createdAt": created_at.strftime("%Y-%m-%dT%H:%M:%SZ")}
+
+
+class FakeApi:
+    """Serves reviews newest first, REVIEWS_PAGE_SIZE per page, via `since`."""
+
+    def __init__(self, reviews: list):
+        self.reviews = reviews
+        self.pages = 0
+
+    def get_reviews(self, product_id, since=None):
+        all_reviews = []
+        for offset in range(0, len(self.reviews) + 1, REVIEWS_PAGE_SIZE):
+            self.pages += 1
+            page = self.reviews[offset : offset + REVIEWS_PAGE_SIZE]
+            if not page:
+                break
+            page, reached = BaseApi._reviews_until(page, since)
+            all_reviews.extend(page)
+            if reached:
+                break
+        return all_reviews
+
+
+def test_fetch_new_stops_at_the_watermark():
+    api = FakeApi([make_review(n) for n in range(5, 0, -1)])
+    watermarks = ReviewWatermarks()
+    assert len(watermarks.fetch_new(api, "1")) == 5
+
+    api.reviews = [make_review(7), make_review(6)] + api.reviews
+    assert [review["id"] for review in watermarks.fetch_new(api, "1")] == ["7", "6"]
+    assert watermarks.get("1") == "7"
+
+
+def test_fetch_new_stops_by_date_when_the_watermark_review_is_gone():
+    api = FakeApi([make_review(n) for n in range(200, 0, -1)])
+    watermarks = ReviewWatermarks()
+    watermarks.set("1", make_review(190))
+
+    api.reviews = [make_review(202), make_review(201)] + [
+        review for review in api.reviews if review["id"] != "190"
+    ]
+    new = watermarks.fetch_new(api, "1")
+    assert [review["id"] for review in new] == [str(n) for n in range(202, 190, -1)]
+    assert api.pages == 1
+    assert watermarks.get("1") == "202"
+
+
+def test_is_watermark_parses_zulu_timestamps():
+    review = make_review(3)
+    assert BaseApi._is_watermark(review, date(2024, 1, 1))
+    assert not BaseApi._is_watermark(review, date(2023, 12, 31))
+    assert BaseApi._is_watermark(
+        review, ReviewWatermark("x", make_review(3)["createdAt"])
+    )
+    assert (
+        parse_created_at(make_review(3)["createdAt"]).utcoffset().total_seconds() == 0
+    )
+
+
+def test_is_watermark_rejects_bad_timestamps():
+    with pytest.raises(ValueError):
+        BaseApi._is_watermark({"id": "1", "createdAt": "yesterday"}, date(2024, 1, 1))
+    with pytest.raises(ValueError):
+        BaseApi._is_watermark({"id": "1"}, ReviewWatermark("2", "2024-01-01"))